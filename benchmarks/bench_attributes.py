@@ -0,0 +1,72 @@
+"""
+.. module:: bench_attributes
+   :synopsis: Cost of reading and writing Resource attributes.
+"""
+
+import json
+
+from vivialconnect.resources.message import Message
+from vivialconnect.resources.resource import Resource
+
+from benchmarks.common import measure, report
+
+
+class LegacyMessage(Resource):
+    # Attribute access as it was before generated accessors and the class
+    # attribute cache.
+    _singular = "message"
+
+    def __getattr__(self, name):
+        if "attributes" in self.__dict__:
+            if name in self.attributes:
+                return self.attributes[name]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        field = self._fields.get(name)
+        if field is not None:
+            field.assign(self, value)
+        elif "_initialized" in self.__dict__:
+            if name in self.__dict__ or getattr(self.__class__, name, None):
+                object.__setattr__(self, name, value)
+            else:
+                self.attributes[name] = value
+        else:
+            object.__setattr__(self, name, value)
+
+
+def attributes():
+    with open("tests/fixtures/message/messages.json") as f:
+        return json.load(f)["messages"][0]
+
+
+def main():
+    legacy, resource = LegacyMessage(attributes()), Message(attributes())
+
+    def read(message):
+        message.body
+        message.to_number
+        message.from_number
+        message.status
+
+    def write(message):
+        message.body = "Howdy"
+        message.status = "sent"
+
+    def missing(message):
+        getattr(message, "no_such_attribute", None)
+
+    for title, func, count in (
+        ("read an attribute", read, 4),
+        ("write an attribute", write, 2),
+        ("read a missing attribute", missing, 1),
+    ):
+        report(
+            title,
+            measure(lambda: func(legacy), number=100000) / count,
+            measure(lambda: func(resource), number=100000) / count,
+        )
+
+
+if __name__ == "__main__":
+    main()
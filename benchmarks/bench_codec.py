@@ -0,0 +1,59 @@
+"""
+.. module:: bench_codec
+   :synopsis: Response decoding and request encoding with each JSON codec.
+"""
+
+import json
+import hashlib
+
+import requests
+
+from vivialconnect.common.codec import available_codecs, get_codec
+from vivialconnect.common.util import Util
+
+from benchmarks.bench_decode import listing
+from benchmarks.common import measure, report
+
+
+def legacy_decode(body):
+    # Formerly: result.text, which detects the charset of a JSON response
+    # sent without one, then json.loads of the str.
+    response = requests.Response()
+    response._content = body
+    response.headers["Content-Type"] = "application/json"
+    return json.loads(response.text)
+
+
+def legacy_encode(payload):
+    # Formerly: a str body encoded once for its signature and once more
+    # when sent.
+    data = Util.to_json(payload, root=None)
+    hashlib.sha256(data.encode()).hexdigest()
+    return data.encode("utf-8")
+
+
+def main():
+    response = listing(100)
+    body = json.dumps(response).encode("utf-8")
+    payload = {"message": response["messages"][0]}
+    before_decode = measure(lambda: legacy_decode(body), number=20)
+    before_encode = measure(lambda: legacy_encode(payload), number=2000)
+    for name in available_codecs():
+        codec = get_codec(name)
+        assert codec.loads(body) == response
+
+        def encode():
+            data = codec.dumps(payload)
+            hashlib.sha256(data).hexdigest()
+            return data
+
+        report(
+            "decode 100 messages (%s)" % name,
+            before_decode,
+            measure(lambda: codec.loads(body), number=20),
+        )
+        report("encode a message (%s)" % name, before_encode, measure(encode, number=2000))
+
+
+if __name__ == "__main__":
+    main()
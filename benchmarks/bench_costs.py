@@ -0,0 +1,63 @@
+"""
+.. module:: bench_costs
+   :synopsis: Cost rollups over transactions, objects vs columnar arrays.
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+import collections
+
+from vivialconnect.resources.account import Transaction
+from vivialconnect.resources.costs import TransactionAggregator
+
+SIZE = 100000
+
+
+def transactions(size=SIZE):
+    with open("tests/fixtures/transaction/transactions.json") as f:
+        samples = json.load(f)["transactions"]
+    for i in range(size):
+        yield dict(samples[i % len(samples)], id=i)
+
+
+def with_objects():
+    objects = Transaction._build_list({"transactions": list(transactions())})
+    rollup = collections.defaultdict(int)
+    for transaction in objects:
+        rollup[transaction.transaction_type, transaction.post_time[:10]] += transaction.cash_amount
+    return objects, rollup
+
+
+def with_aggregator():
+    aggregator = TransactionAggregator().extend(transactions())
+    return aggregator, aggregator.rollup("transaction_type", "day")
+
+
+def run(func):
+    gc.collect()
+    tracemalloc.start()
+    started = time.time()
+    func()
+    elapsed = time.time() - started
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, size
+
+
+def main():
+    before_time, before_size = run(with_objects)
+    after_time, after_size = run(with_aggregator)
+    print(
+        "%-40s before: %10.1f MB  after: %10.1f MB  ratio: %6.1fx"
+        % ("peak memory, %d transactions" % SIZE, before_size / 1e6, after_size / 1e6, before_size / after_size)
+    )
+    print(
+        "%-40s before: %10.2f s   after: %10.2f s   speedup: %6.1fx"
+        % ("rollup by type and day", before_time, after_time, before_time / after_time)
+    )
+
+
+if __name__ == "__main__":
+    main()
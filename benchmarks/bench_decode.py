@@ -0,0 +1,31 @@
+"""
+.. module:: bench_decode
+   :synopsis: Cost of turning a decoded listing into resources.
+"""
+
+import json
+
+from vivialconnect.resources.message import Message
+
+from benchmarks.common import measure, report
+
+
+def listing(size=1000):
+    with open("tests/fixtures/message/messages.json") as f:
+        message = json.load(f)["messages"][0]
+    return {"messages": [dict(message, id=i) for i in range(size)]}
+
+
+def main():
+    response = listing()
+    report(
+        "build 1000 messages (objects vs raw)",
+        measure(lambda: Message._build_list(response), number=10),
+        measure(lambda: Message._build_list(response, raw=True), number=10),
+        unit="ms",
+        scale=1e3,
+    )
+
+
+if __name__ == "__main__":
+    main()
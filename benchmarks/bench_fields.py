@@ -0,0 +1,78 @@
+"""
+.. module:: bench_fields
+   :synopsis: Cost of declared field access and Connector construction.
+"""
+
+import json
+
+from weakref import WeakKeyDictionary
+
+from vivialconnect.common.fields import ResourceListingField
+from vivialconnect.resources.connector import (
+    Connector,
+    ConnectorCallback,
+    ConnectorNumber,
+)
+
+from benchmarks.common import measure, report
+
+
+class LegacyListingField(ResourceListingField):
+    # Field storage as it was before values moved to the instance __dict__:
+    # a data descriptor keeping every value in a WeakKeyDictionary.
+    def __init__(self, name, member_type):
+        super(LegacyListingField, self).__init__(name, member_type)
+        self.owner_map = WeakKeyDictionary()
+
+    def __get__(self, obj, obj_type):
+        if obj is None:
+            return self
+        if obj not in self.owner_map:
+            self.owner_map[obj] = self.initialized_value(obj)
+        return self.owner_map[obj]
+
+    def __set__(self, obj, value):
+        self.assign(obj, value)
+
+    def assign(self, obj, value):
+        if not isinstance(value, self.iterable_type):
+            value = self.initialized_value(obj, value)
+        self.owner_map[obj] = value
+        attributes = obj.__dict__.get("attributes")
+        if attributes is not None:
+            attributes.mark_dirty(self.name)
+
+
+class LegacyConnector(Connector):
+    _singular = "connector"
+    phone_numbers = LegacyListingField("phone_numbers", ConnectorNumber)
+    callbacks = LegacyListingField("callbacks", ConnectorCallback)
+
+
+def connector_attributes():
+    with open("tests/fixtures/connector/connectors.json") as f:
+        return json.load(f)["connectors"][0]
+
+
+def main():
+    attributes = connector_attributes()
+    report(
+        "build a connector",
+        measure(lambda: LegacyConnector(attributes), number=20000),
+        measure(lambda: Connector(attributes), number=20000),
+    )
+    legacy, connector = LegacyConnector(attributes), Connector(attributes)
+
+    def read(connector):
+        connector.phone_numbers
+        connector.callbacks
+
+    report(
+        "read 2 fields of a connector",
+        measure(lambda: read(legacy), number=100000),
+        measure(lambda: read(connector), number=100000),
+    )
+
+
+if __name__ == "__main__":
+    main()
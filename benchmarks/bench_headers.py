@@ -0,0 +1,50 @@
+"""
+.. module:: bench_headers
+   :synopsis: Per-request cost of the static request headers.
+"""
+
+import json
+import platform
+
+from vivialconnect.version import VERSION
+from vivialconnect.common.requestor import API_CONTENT_TYPE, static_headers
+
+from benchmarks.common import measure, report
+
+
+def legacy_headers():
+    # The header construction formerly done by Requestor.request_raw on
+    # every call.
+    ua = {
+        "client_version": VERSION,
+        "lang": "python",
+        "publisher": "vivialconnect",
+        "request_lib": "requests",
+    }
+    for attr, func in [
+        ["lang_version", platform.python_version],
+        ["platform", platform.platform],
+    ]:
+        try:
+            val = func()
+        except Exception as e:
+            val = "!! %s" % e
+        ua[attr] = val
+    return {
+        "X-VivialConnect-User-Agent": json.dumps(ua),
+        "User-Agent": "VivialConnect PythonClient %s" % VERSION,
+        "Accept": API_CONTENT_TYPE,
+    }
+
+
+def cached_headers():
+    return dict(static_headers())
+
+
+def main():
+    assert legacy_headers() == cached_headers()
+    report("static request headers", measure(legacy_headers), measure(cached_headers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+.. module:: bench_memory
+   :synopsis: Memory held per decoded resource, measured with tracemalloc.
+"""
+
+import gc
+import tracemalloc
+
+from vivialconnect.resources.message import Message
+
+from benchmarks.bench_decode import listing
+
+
+def bytes_per_object(build, response):
+    gc.collect()
+    tracemalloc.start()
+    objects = build(response)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(objects)
+
+
+def main():
+    response = listing(10000)
+    before = bytes_per_object(Message._build_list, response)
+    after = bytes_per_object(lambda r: Message._build_list(r, records=True), response)
+    print(
+        "%-40s before: %10.0f B  after: %10.0f B  ratio: %6.1fx"
+        % ("bytes per message (objects vs records)", before, after, before / after)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+.. module:: bench_paths
+   :synopsis: Cost of building and splitting request URLs.
+"""
+
+from six.moves.urllib.parse import urlparse
+
+from vivialconnect.common.requestor import Requestor
+from vivialconnect.resources.message import Message
+
+from benchmarks.common import measure, report
+
+
+def legacy_element_path(cls, id_, path=None, options=None, ext=".json"):
+    # Resource._element_path as it was before path templates.
+    return (cls.API_ACCOUNT_PREFIX + "%(prefix)s/%(plural)s/%(id)s%(ext)s") % {
+        "account_id": cls._api_account_id,
+        "prefix": cls._prefix(path, options),
+        "plural": cls._plural,
+        "id": id_,
+        "ext": ext,
+    }
+
+
+def legacy_split_url(requestor, url, params):
+    # What Requestor.prepare_request did to get the signed URL parts.
+    abs_url = requestor.api_url(url)
+    if params:
+        abs_url = requestor.build_url(abs_url, params)
+    parsed_url = urlparse(abs_url)
+    host = parsed_url.hostname + (
+        (":" + str(parsed_url.port)) if parsed_url.port else ""
+    )
+    return host, parsed_url.path, parsed_url.query
+
+
+def main():
+    Message.api_account_id = "12345"
+    requestor = Requestor()
+    params = {"page": 3, "limit": 50}
+    report(
+        "element path",
+        measure(lambda: legacy_element_path(Message, 42), number=100000),
+        measure(lambda: Message._element_path(42), number=100000),
+    )
+    url = Message._collection_path()
+    report(
+        "split URL with query parameters",
+        measure(lambda: legacy_split_url(requestor, url, params), number=100000),
+        measure(lambda: requestor.split_url(url, params), number=100000),
+    )
+    report(
+        "split URL without query parameters",
+        measure(lambda: legacy_split_url(requestor, url, None), number=100000),
+        measure(lambda: requestor.split_url(url), number=100000),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+.. module:: bench_signing
+   :synopsis: Signatures per second of the HMAC request signer.
+"""
+
+import hmac
+import hashlib
+
+from six.moves.urllib.parse import urlparse, parse_qsl, quote
+
+from vivialconnect.common.requestor import API_HMAC_SIGNED_HEADERS, Requestor
+
+from benchmarks.common import measure
+
+SECRET = "__benchmark_secret__"
+TIMESTAMP = "20201208T201330Z"
+HEADERS = {
+    "Content-Type": "application/json",
+    "Date": "Tue, 08 Dec 2020 20:13:30 GMT",
+    "Host": "api.vivialconnect.net",
+    "Accept": "application/json",
+    "User-Agent": "VivialConnect PythonClient",
+}
+POST_URL = "https://api.vivialconnect.net/api/v1.0/accounts/12345/messages.json"
+GET_URL = POST_URL + "?page=3&limit=50&order=id+desc"
+BODY = '{"message":{"body":"Howdy","from_number":"+19132597591","to_number":"+11234567890"}}'
+
+
+def _uri_encode(data, encode_slash=False):
+    safe = "_-~."
+    if not encode_slash:
+        safe += "/"
+    return quote(data, safe=safe)
+
+
+def legacy_sign(method, iso8601_timestamp, abs_url, headers, data):
+    # Requestor.sign as it was before the signing engine was introduced.
+    api_hmac_used_signed_headers = []
+    canonical_headers = []
+    for key in headers.keys():
+        if key.lower() in API_HMAC_SIGNED_HEADERS:
+            canonical_headers.append(key.lower() + ":" + headers[key])
+            api_hmac_used_signed_headers.append(key.lower())
+    api_hmac_used_signed_headers.sort()
+    canonical_headers.sort()
+    parsed_url = urlparse(abs_url)
+    canonical_query_string = []
+    query_string = parse_qsl(
+        parsed_url.query, keep_blank_values=True, strict_parsing=False
+    )
+    for item in query_string:
+        canonical_query_string.append(
+            _uri_encode(item[0], encode_slash=True)
+            + "="
+            + _uri_encode(item[1], encode_slash=True)
+        )
+    canonical_query_string.sort()
+    canonical_request = (
+        method.upper()
+        + "\n"
+        + iso8601_timestamp
+        + "\n"
+        + _uri_encode(parsed_url.path, encode_slash=False)
+        + "\n"
+        + "&".join(canonical_query_string)
+        + "\n"
+        + "\n".join(canonical_headers)
+        + "\n"
+        + ";".join(api_hmac_used_signed_headers).lower()
+        + "\n"
+        + hashlib.sha256((data if data else "").encode()).hexdigest()
+    )
+    h = hmac.new(SECRET.encode(), b"", hashlib.sha256)
+    h.update(canonical_request.encode())
+    return h.hexdigest(), api_hmac_used_signed_headers
+
+
+def main():
+    signer = Requestor(api_secret=SECRET).signer
+    post_path = urlparse(POST_URL).path
+    get_url = urlparse(GET_URL)
+    cases = [
+        (
+            "POST without query string",
+            lambda: legacy_sign("post", TIMESTAMP, POST_URL, HEADERS, BODY),
+            lambda: signer.sign("post", TIMESTAMP, post_path, "", HEADERS, BODY),
+        ),
+        (
+            "GET with query string",
+            lambda: legacy_sign("get", TIMESTAMP, GET_URL, HEADERS, None),
+            lambda: signer.sign(
+                "get", TIMESTAMP, get_url.path, get_url.query, HEADERS, None
+            ),
+        ),
+    ]
+    for title, before, after in cases:
+        assert before() == after()
+        before_time, after_time = measure(before), measure(after)
+        print(
+            "%-30s before: %9.0f sig/s  after: %9.0f sig/s  speedup: %4.1fx"
+            % (title, 1 / before_time, 1 / after_time, before_time / after_time)
+        )
+
+
+if __name__ == "__main__":
+    main()
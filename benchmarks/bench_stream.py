@@ -0,0 +1,53 @@
+"""
+.. module:: bench_stream
+   :synopsis: Peak memory of walking a large listing, loaded vs streamed.
+"""
+
+import gc
+import json
+import tracemalloc
+
+from vivialconnect.common.jsonstream import JsonArrayStream
+from vivialconnect.resources.message import Message
+
+from benchmarks.bench_decode import listing
+
+CHUNK_SIZE = 64 * 1024
+
+
+def chunks(body):
+    for i in range(0, len(body), CHUNK_SIZE):
+        yield body[i : i + CHUNK_SIZE]
+
+
+def loaded(body):
+    for message in Message._build_list(json.loads(body)):
+        message.id
+
+
+def streamed(body):
+    for message in Message._build_stream(JsonArrayStream(chunks(body))):
+        message.id
+
+
+def peak(walk, body):
+    gc.collect()
+    tracemalloc.start()
+    walk(body)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    body = json.dumps(listing(20000)).encode("utf-8")
+    before = peak(loaded, body)
+    after = peak(streamed, body)
+    print(
+        "%-40s before: %10.1f MB  after: %10.1f MB  ratio: %6.1fx"
+        % ("peak memory walking 20000 messages", before / 1e6, after / 1e6, before / after)
+    )
+
+
+if __name__ == "__main__":
+    main()
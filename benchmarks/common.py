@@ -0,0 +1,24 @@
+"""
+.. module:: common
+   :synopsis: Helpers shared by the micro-benchmarks.
+
+Run a benchmark from the repository root, e.g.::
+
+    python -m benchmarks.bench_headers
+"""
+
+import timeit
+
+
+def measure(func, number=10000, repeat=5):
+    """Returns the best time per call of ``func`` in seconds."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def report(title, before, after, unit="us", scale=1e6):
+    """Prints a before/after comparison of two per-call timings."""
+    print(
+        "%-40s before: %10.3f %s  after: %10.3f %s  speedup: %6.1fx"
+        % (title, before * scale, unit, after * scale, unit, before / after)
+    )
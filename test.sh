@@ -10,3 +10,13 @@ python -m unittest tests.test_number
 python -m unittest tests.test_connector
 python -m unittest tests.test_log
 python -m unittest tests.test_user
+python -m unittest tests.test_requestor
+python -m unittest tests.test_signer
+python -m unittest tests.test_ratelimit
+python -m unittest tests.test_retry
+python -m unittest tests.test_bulk
+python -m unittest tests.test_cache
+python -m unittest tests.test_singleflight
+python -m unittest tests.test_codec
+python -m unittest tests.test_jsonstream
+python -m unittest tests.test_costs
@@ -2,6 +2,7 @@ import os
 import re
 import sys
 import json
+import asyncio
 import unittest
 import datetime
 from functools import wraps
@@ -15,6 +16,7 @@ from six.moves.urllib.parse import urlsplit
 
 from vivialconnect.version import VERSION
 from vivialconnect.resources.resource import Resource
+from vivialconnect.common.async_requestor import ThreadPoolTransport
 
 
 class Headers(object):
@@ -180,11 +182,20 @@ class BaseTestCase(unittest.TestCase):
         Resource.api_key = "__my_test_key__"
         Resource.api_secret = "__my_test_secret__"
         Resource.api_base_url = "https://tests.vivialconnect.net/api/v1.0"
+        # HTTMock only patches requests, which aiohttp does not use.
+        Resource._async_transport = ThreadPoolTransport()
 
     @all_requests
     def response_content(self, url, request, **kwargs):
         return self.fake(url, request, **kwargs)
 
+    def run_async(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
     def load_fixture(self, name, frmt='json'):
         with open(os.path.dirname(__file__) + '/fixtures/%s.%s' % (name, frmt), 'rb') as f:
             return f.read()
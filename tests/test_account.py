@@ -1,3 +1,10 @@
+import json
+import threading
+
+from datetime import datetime, timedelta
+
+from six.moves.urllib.parse import parse_qsl
+
 import vivialconnect
 
 from tests.common import BaseTestCase
@@ -113,5 +120,104 @@ class AccountTest(BaseTestCase):
                 assert transaction.transaction_type.startswith("number_purchase")
 
 
+    def test_get_transactions_raw(self):
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("transaction/transactions"),
+            headers={"Content-type": "application/json"},
+        ):
+            transactions = Transaction.find(raw=True)
+
+            assert len(transactions) > 0
+            for transaction in transactions:
+                assert isinstance(transaction, dict)
+                assert "transaction_type" in transaction
+
+    def test_find_sends_only_given_times(self):
+        queries = []
+
+        def record(url, request, **kwargs):
+            queries.append(dict(parse_qsl(url.query)))
+            return self.fake(url, request, body=self.load_fixture("transaction/transactions"))
+
+        with HTTMock(record):
+            Transaction.find()
+            Transaction.find(end_time="2020-12-01T00:00:00Z", transaction_type="sms_local_out")
+        self.assertEqual({}, queries[0])
+        self.assertEqual(
+            {"end_time": "2020-12-01T00:00:00Z", "include_types[]": "sms_local_out"},
+            queries[1],
+        )
+
+    def _transactions_server(self, transactions, requests_seen):
+        lock = threading.Lock()
+
+        def serve(url, request, **kwargs):
+            query = dict(parse_qsl(url.query))
+            with lock:
+                requests_seen.append(query)
+            start = query["start_time"].replace("Z", "")
+            end = query["end_time"].replace("Z", "")
+            limit = int(query["limit"])
+            page = int(query.get("page", 1))
+            # Both bounds are inclusive, as with the API.
+            matching = [t for t in transactions if start <= t["post_time"][:19] <= end]
+            body = {"transactions": matching[(page - 1) * limit : page * limit]}
+            return self.fake(url, request, body=json.dumps(body).encode("utf-8"))
+
+        return serve
+
+    def test_find_range(self):
+        first = datetime(2020, 12, 1)
+        transactions = [
+            {"id": i, "post_time": (first + timedelta(hours=i)).isoformat() + ".000001"}
+            for i in range(72)
+        ]
+        seen = []
+        with HTTMock(self._transactions_server(transactions[::-1], seen)):
+            found = list(
+                Transaction.find_range(
+                    first, first + timedelta(days=3), workers=3, limit=100, raw=True
+                )
+            )
+        self.assertEqual(transactions, found)
+        self.assertEqual(
+            ["2020-12-02T00:00:00Z", "2020-12-03T00:00:00Z", "2020-12-04T00:00:00Z"],
+            sorted(query["end_time"] for query in seen),
+        )
+
+    def test_find_range_subdivides_full_shards(self):
+        first = datetime(2020, 12, 1)
+        transactions = [
+            {"id": i, "post_time": (first + timedelta(minutes=10 * i)).isoformat()}
+            for i in range(144)
+        ]
+        seen = []
+        with HTTMock(self._transactions_server(transactions, seen)):
+            found = list(
+                Transaction.find_range(
+                    "2020-12-01T00:00:00Z", "2020-12-02T00:00:00Z", limit=50
+                )
+            )
+        self.assertEqual(list(range(144)), [t.id for t in found])
+        self.assertIsInstance(found[0], Transaction)
+        self.assertTrue(len(seen) > 3)
+
+    def test_find_range_pages_through_busy_seconds(self):
+        transactions = [
+            {"id": i, "post_time": "2020-12-01T00:00:00.%06d" % i} for i in range(7)
+        ]
+        seen = []
+        with HTTMock(self._transactions_server(transactions, seen)):
+            found = list(
+                Transaction.find_range(
+                    datetime(2020, 12, 1), datetime(2020, 12, 1, 0, 0, 1), limit=3, raw=True
+                )
+            )
+        self.assertEqual(transactions, found)
+        self.assertEqual(["1", "2", "3"], [q.get("page", "1") for q in seen])
+
+
+
 if __name__ == "__main__":
     unittest.main()
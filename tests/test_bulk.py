@@ -0,0 +1,216 @@
+import io
+import calendar
+import json
+import threading
+
+from six.moves.urllib.parse import parse_qsl
+
+from tests.common import BaseTestCase
+from tests.common import HTTMock
+from vivialconnect import BulkSender, BulkWatcher
+
+
+class BulkSenderTest(BaseTestCase):
+    def setUp(self):
+        super(BulkSenderTest, self).setUp()
+        self.payloads = []
+        self.lock = threading.Lock()
+
+    def bulk_endpoint(self, url, request, **kwargs):
+        # Message.send_bulk sends its payload as query string parameters.
+        payload = {"to_numbers": []}
+        for key, value in parse_qsl(url.query):
+            if key.startswith("to_numbers["):
+                payload["to_numbers"].append(value)
+            else:
+                payload[key] = value
+        with self.lock:
+            self.payloads.append(payload)
+            index = len(self.payloads)
+        if "+10000000000" in payload["to_numbers"]:
+            return self.fake(url, request, code=400, body=b'{"message": "Invalid number"}')
+        body = json.dumps({"bulk_id": "bulk-%d" % index}).encode()
+        return self.fake(url, request, body=body)
+
+    def test_send_in_chunks(self):
+        recipients = ("+1555000%04d" % i for i in range(25))
+        sender = BulkSender("+16164320123", body="Bulk Message Test", chunk_size=10, workers=3)
+        with HTTMock(self.bulk_endpoint):
+            report = sender.send(recipients)
+        self.assertEqual(3, report.chunks)
+        self.assertEqual(25, report.recipients)
+        self.assertEqual(3, len(report.bulk_ids))
+        self.assertEqual([], report.errors)
+        self.assertEqual(
+            [10, 10, 5], sorted((len(p["to_numbers"]) for p in self.payloads), reverse=True)
+        )
+        for payload in self.payloads:
+            self.assertEqual("+16164320123", payload["from_number"])
+            self.assertEqual("Bulk Message Test", payload["body"])
+
+    def test_failed_chunks_are_reported(self):
+        recipients = ["+15550000001", "+10000000000", "+15550000002"]
+        chunks = []
+        sender = BulkSender(
+            "+16164320123",
+            body="Bulk Message Test",
+            chunk_size=1,
+            workers=1,
+            on_chunk=lambda *args: chunks.append(args),
+        )
+        with HTTMock(self.bulk_endpoint):
+            report = sender.send(recipients)
+        self.assertEqual(2, report.recipients)
+        self.assertEqual(1, len(report.errors))
+        self.assertEqual(1, report.errors[0].index)
+        self.assertEqual(["+10000000000"], report.errors[0].recipients)
+        self.assertEqual([0, 1, 2], [index for index, _, _ in chunks])
+
+    def test_chunks_are_lazy(self):
+        consumed = []
+
+        def recipients():
+            for i in range(100):
+                consumed.append(i)
+                yield "+1555000%04d" % i
+
+        chunks = BulkSender("+16164320123", chunk_size=10).chunks(recipients())
+        self.assertEqual(10, len(next(chunks)))
+        self.assertEqual(10, len(consumed))
+
+    def test_read_csv(self):
+        data = io.StringIO("name,phone_number\nA,+15550000001\nB,+15550000002\n")
+        self.assertEqual(
+            ["+15550000001", "+15550000002"],
+            list(BulkSender.read_csv(data, column="phone_number")),
+        )
+
+
+class BulkWatcherTest(BaseTestCase):
+    def setUp(self):
+        super(BulkWatcherTest, self).setUp()
+        self.requests = []
+        # Bulks of the account, newest first.
+        self.bulks = [
+            {"bulk_id": "bulk-%d" % i, "total_messages": 3, "processed": 3, "errors": 0}
+            for i in range(3, 8)
+        ]
+        self.bulks[:0] = [
+            {"bulk_id": "bulk-1", "total_messages": 3, "processed": 1, "errors": 1},
+            {"bulk_id": "bulk-2", "total_messages": 3, "processed": 3, "errors": 0},
+        ]
+
+    def bulk_endpoint(self, url, request, **kwargs):
+        query = dict(parse_qsl(url.query))
+        self.requests.append((url.path, query))
+        page, limit = int(query["page"]), int(query["limit"])
+        body = {
+            "bulks": self.bulks[(page - 1) * limit : page * limit],
+            "count": len(self.bulks),
+            "pages": (len(self.bulks) + limit - 1) // limit,
+        }
+        return self.fake(url, request, body=json.dumps(body).encode())
+
+    def test_poll_tracks_progress(self):
+        completed = []
+        watcher = BulkWatcher(min_interval=0, on_complete=completed.append)
+        first = watcher.track("bulk-1")
+        second = watcher.track("bulk-2", total=3)
+        with HTTMock(self.bulk_endpoint):
+            self.assertEqual([first, second], watcher.poll())
+            self.assertEqual(1, len(self.requests))
+            self.assertTrue(self.requests[0][0].endswith("/messages/bulk.json"))
+            self.assertEqual(3, first.total)
+            self.assertEqual((1, 1), (first.processed, first.errors))
+            self.assertTrue(second.done)
+            self.assertEqual([second], completed)
+
+            # Finished jobs are no longer polled.
+            self.requests = []
+            self.bulks[0]["processed"] = 3
+            watcher.poll()
+        self.assertEqual(1, len(self.requests))
+        self.assertTrue(first.done)
+        self.assertEqual([], watcher.pending)
+        self.assertEqual(2, len(completed))
+
+    def test_listing_is_read_until_jobs_are_found(self):
+        watcher = BulkWatcher(min_interval=0, page_size=2)
+        watcher.track("bulk-1")
+        watcher.track("bulk-5")
+        with HTTMock(self.bulk_endpoint):
+            watcher.poll()
+        self.assertEqual(["1", "2", "3"], [query["page"] for _, query in self.requests])
+        self.assertTrue(watcher.jobs["bulk-5"].done)
+
+    def test_listing_ignoring_pages_is_read_once(self):
+        self.bulks = [{"bulk_id": "bulk-%d" % i, "processed": 3} for i in range(60)]
+
+        def unpaged_endpoint(url, request, **kwargs):
+            self.requests.append((url.path, dict(parse_qsl(url.query))))
+            body = {"bulks": self.bulks, "count": len(self.bulks)}
+            return self.fake(url, request, body=json.dumps(body).encode())
+
+        watcher = BulkWatcher(min_interval=0)
+        watcher.track("bulk-0")
+        watcher.track("bulk-missing")
+        with HTTMock(unpaged_endpoint):
+            watcher.poll()
+        self.assertEqual(2, len(self.requests))
+        self.assertEqual(3, watcher.jobs["bulk-0"].processed)
+        self.assertEqual(1, watcher.jobs["bulk-missing"].misses)
+
+    def test_listing_is_not_read_past_tracked_jobs(self):
+        for i, bulk in enumerate(self.bulks):
+            bulk["date_created"] = "2020-06-29T12:%02d:07" % (50 - i)
+        created = calendar.timegm((2020, 6, 29, 12, 48, 7, 0, 0, 0))
+        watcher = BulkWatcher(min_interval=0, page_size=2, clock_slack=60)
+        watcher.track("bulk-missing", created=created)
+        with HTTMock(self.bulk_endpoint):
+            watcher.poll()
+        # Page 2 holds bulks created at 12:48 and 12:47, page 3 is older.
+        self.assertEqual(["1", "2", "3"], [query["page"] for _, query in self.requests])
+
+        # Without creation dates, the number of pages read is capped.
+        for bulk in self.bulks:
+            del bulk["date_created"]
+        self.requests = []
+        watcher = BulkWatcher(min_interval=0, page_size=2, max_pages=2)
+        watcher.track("bulk-missing")
+        with HTTMock(self.bulk_endpoint):
+            watcher.poll()
+        self.assertEqual(["1", "2"], [query["page"] for _, query in self.requests])
+
+    def test_missing_job_backs_off_and_is_lost(self):
+        watcher = BulkWatcher(min_interval=0.5, max_interval=4, max_misses=3)
+        job = watcher.track("bulk-new")
+        with HTTMock(self.bulk_endpoint):
+            job.next_poll = 0
+            watcher.poll()
+            self.assertEqual((1, 1.0), (job.misses, job.interval))
+            self.assertEqual(1, len(self.requests))
+            # Not due yet: the listing is not read again.
+            watcher.poll()
+            self.assertEqual(1, len(self.requests))
+            for _ in range(2):
+                job.next_poll = 0
+                watcher.poll()
+            self.assertTrue(job.lost)
+            self.assertFalse(watcher.watch())
+        self.assertEqual(3, len(self.requests))
+
+    def test_interval_backs_off_without_progress(self):
+        watcher = BulkWatcher(min_interval=0.5, max_interval=4)
+        job = watcher.track("bulk-1", total=3)
+        with HTTMock(self.bulk_endpoint):
+            for _ in range(5):
+                job.next_poll = 0
+                watcher.poll()
+        self.assertEqual(4, job.interval)
+        self.assertEqual(5, job.polls)
+
+    def test_watch(self):
+        watcher = BulkWatcher(min_interval=0)
+        watcher.track("bulk-2", total=3)
+        with HTTMock(self.bulk_endpoint):
+            self.assertTrue(watcher.watch(timeout=5))
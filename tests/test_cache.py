@@ -0,0 +1,173 @@
+from unittest import mock
+
+from tests.common import BaseTestCase
+from tests.common import HTTMock
+from vivialconnect import Number, Requestor, Resource
+from vivialconnect.common.cache import (
+    NOT_MODIFIED,
+    ResponseCache,
+    ValidatorStore,
+    resource_prefix,
+)
+
+
+class ResponseCacheTest(BaseTestCase):
+    def setUp(self):
+        super(ResponseCacheTest, self).setUp()
+        self.requests = []
+
+    def counting(self, url, request, **kwargs):
+        self.requests.append((request.method, url.path))
+        if request.method == "GET":
+            return self.fake(url, request, body=self.load_fixture("message/count"))
+        return self.fake(url, request, body=b"{}")
+
+    def requestor(self, **options):
+        return Requestor(api_base_url=Resource.api_base_url, cache=ResponseCache(**options))
+
+    def test_resource_prefix(self):
+        self.assertEqual("/accounts/1/numbers", resource_prefix("/accounts/1/numbers.json"))
+        self.assertEqual(
+            "/accounts/1/numbers", resource_prefix("/accounts/1/numbers/42/tags.json?a=b")
+        )
+        self.assertEqual("/accounts/1", resource_prefix("/accounts/1.json"))
+
+    def test_get_is_cached_per_query(self):
+        requestor = self.requestor()
+        with HTTMock(self.counting):
+            first = requestor.get("/accounts/1/messages/count.json")
+            first["count"] = 42
+            second = requestor.get("/accounts/1/messages/count.json")
+            requestor.get("/accounts/1/messages/count.json", {"page": 2})
+        self.assertEqual({"count": 2}, second)
+        self.assertEqual(2, len(self.requests))
+        self.assertEqual((1, 2), (requestor.cache.hits, requestor.cache.misses))
+
+    def test_split_urls(self):
+        requestor = self.requestor()
+        host = "tests.vivialconnect.net"
+        with HTTMock(self.counting):
+            requestor.get("/accounts/1/messages/count.json", {"page": 2})
+            requestor.get((host, "/api/v1.0/accounts/1/messages/count.json", "page=2"))
+            self.assertEqual(1, len(self.requests))
+            requestor.post(
+                (host, "/api/v1.0/accounts/1/messages.json", ""), payload={"message": {}}
+            )
+            self.assertEqual(0, len(requestor.cache))
+            requestor.get((host, "/api/v1.0/accounts/1/messages/count.json", "page=2"))
+        self.assertEqual(
+            ["GET", "POST", "GET"], [method for method, _ in self.requests]
+        )
+
+    def test_entries_expire(self):
+        requestor = self.requestor(ttl=10, ttls={"/messages/count": 0, "/messages": 5})
+        self.assertEqual(0, requestor.cache.ttl_for("/accounts/1/messages/count.json"))
+        self.assertEqual(5, requestor.cache.ttl_for("/accounts/1/messages.json"))
+        with HTTMock(self.counting):
+            requestor.get("/accounts/1/messages/count.json")
+            requestor.get("/accounts/1/messages/count.json")
+            requestor.get("/accounts/1/numbers.json")
+            with mock.patch("time.time", return_value=10 ** 10):
+                requestor.get("/accounts/1/numbers.json")
+        self.assertEqual(4, len(self.requests))
+
+    def test_lru_eviction(self):
+        requestor = self.requestor(maxsize=2)
+        with HTTMock(self.counting):
+            for path in ("/a.json", "/b.json", "/a.json", "/c.json", "/a.json", "/b.json"):
+                requestor.get(path)
+        self.assertEqual(
+            ["/api/v1.0/%s.json" % name for name in "abcb"],
+            [path for _, path in self.requests],
+        )
+        self.assertEqual(2, len(requestor.cache))
+
+    def test_writes_invalidate_the_resource(self):
+        requestor = self.requestor()
+        with HTTMock(self.counting):
+            requestor.get("/accounts/1/numbers/42.json")
+            requestor.get("/accounts/1/messages.json")
+            requestor.delete("/accounts/1/numbers/42/tags.json")
+            requestor.get("/accounts/1/numbers/42.json")
+            requestor.get("/accounts/1/messages.json")
+        self.assertEqual(4, len(self.requests))
+        requestor.cache.invalidate()
+        self.assertEqual(0, len(requestor.cache))
+
+    def test_resource_cache(self):
+        cache = ResponseCache()
+        Number.response_cache = cache
+        try:
+            with HTTMock(
+                self.response_content,
+                body=self.load_fixture("number/available-tollfree"),
+                headers={"Content-type": "application/json"},
+            ):
+                Number.available(number_type="tollfree")
+                Number.available(number_type="tollfree")
+            self.assertEqual(1, cache.hits)
+        finally:
+            Number.response_cache = None
+
+
+class ConditionalRequestTest(BaseTestCase):
+    def setUp(self):
+        super(ConditionalRequestTest, self).setUp()
+        self.requests = []
+        self.etag = '"v1"'
+        self.body = self.load_fixture("number/tollfree-purchase")
+
+    def conditional(self, url, request, **kwargs):
+        self.requests.append(request)
+        headers = {"ETag": self.etag, "Content-type": "application/json"}
+        if request.headers.get("If-None-Match") == self.etag:
+            return self.fake(url, request, code=304, body=b"", headers=headers)
+        return self.fake(url, request, body=self.body, headers=headers)
+
+    def test_get_reuses_body_on_304(self):
+        store = ValidatorStore()
+        requestor = Requestor(api_base_url=Resource.api_base_url, validators=store)
+        with HTTMock(self.conditional):
+            first = requestor.get("/accounts/1/numbers/1.json")
+            second = requestor.get("/accounts/1/numbers/1.json")
+        self.assertEqual(first, second)
+        self.assertNotIn("If-None-Match", self.requests[0].headers)
+        self.assertEqual('"v1"', self.requests[1].headers["If-None-Match"])
+        self.assertEqual((1, 1, 1.0), (store.requests, store.not_modified, store.hit_rate))
+        self.assertEqual(len(self.body), store.bytes_saved)
+
+    def test_get_if_modified(self):
+        requestor = Requestor(api_base_url=Resource.api_base_url, validators=ValidatorStore())
+        with HTTMock(self.conditional):
+            response, validators = requestor.get_if_modified("/accounts/1/numbers/1.json")
+            self.assertEqual('"v1"', validators["etag"])
+            response, validators = requestor.get_if_modified(
+                "/accounts/1/numbers/1.json", validators=validators
+            )
+        self.assertIs(NOT_MODIFIED, response)
+
+    def test_reload_short_circuits(self):
+        store = ValidatorStore()
+        Number.validators = store
+        try:
+            with HTTMock(self.conditional):
+                number = Number.find(1)
+                with mock.patch.object(Number, "_update") as update:
+                    number.reload()
+                self.assertFalse(update.called)
+                self.assertEqual((1, 1), (store.requests, store.not_modified))
+
+                number.city = "local change"
+                number.reload()
+                self.assertIsNone(number.city)
+                self.assertFalse(number.is_dirty())
+                self.assertNotIn("If-None-Match", self.requests[-1].headers)
+
+                number.city = "local change"
+                self.etag = '"v2"'
+                number.reload()
+            self.assertIsNone(number.city)
+            self.assertEqual('"v2"', number._response_validators["etag"])
+        finally:
+            Number.validators = None
+
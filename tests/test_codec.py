@@ -0,0 +1,50 @@
+import json
+import unittest
+
+from tests.common import BaseTestCase
+from tests.common import HTTMock
+from vivialconnect import Requestor, Resource
+from vivialconnect.common import codec
+from vivialconnect.common.error import BadRequest
+
+
+class CodecTest(BaseTestCase):
+    def test_stdlib_codec(self):
+        json_codec = codec.get_codec("json")
+        data = json_codec.dumps({"body": "héllo ✓", "to": ["+1"]})
+        self.assertIsInstance(data, bytes)
+        self.assertEqual({"body": "héllo ✓", "to": ["+1"]}, json_codec.loads(data))
+        self.assertEqual([1], json_codec.loads("[1]"))
+
+    @unittest.skipUnless("orjson" in codec.available_codecs(), "orjson is not installed")
+    def test_orjson_codec(self):
+        orjson_codec = codec.get_codec("orjson")
+        fixture = self.load_fixture("message/messages")
+        self.assertEqual(json.loads(fixture), orjson_codec.loads(fixture))
+        self.assertEqual(json.loads(fixture), orjson_codec.loads(orjson_codec.dumps(json.loads(fixture))))
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            codec.get_codec("yaml")
+
+    def test_body_is_encoded_once_as_utf8(self):
+        sent = []
+
+        def echo(url, request, **kwargs):
+            sent.append(request.body)
+            return self.fake(url, request, body=request.body)
+
+        requestor = Requestor(api_base_url=Resource.api_base_url)
+        payload = {"message": {"body": "héllo ✓"}}
+        method, abs_url, headers, data = requestor.prepare_request("post", "/m.json", payload=payload)
+        self.assertIsInstance(data, bytes)
+        with HTTMock(echo):
+            self.assertEqual(payload, requestor.post("/m.json", payload=payload))
+        self.assertEqual(data, sent[0])
+
+    def test_errors_expose_text_body(self):
+        requestor = Requestor(api_base_url=Resource.api_base_url)
+        with HTTMock(self.response_content, code=400, body=b'{"message": "Bad"}'):
+            with self.assertRaises(BadRequest) as context:
+                requestor.get("/m.json")
+        self.assertEqual('{"message": "Bad"}', context.exception.http_body)
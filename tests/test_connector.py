@@ -2,6 +2,13 @@ import json
 import vivialconnect
 
 from tests.common import BaseTestCase, HTTMock
+from vivialconnect.common.error import ResourceError
+from vivialconnect.common.fields import ResourceField, SimpleResourceList
+from vivialconnect.resources.resource import Resource
+
+
+class Holder(Resource):
+    number = ResourceField('number', vivialconnect.ConnectorNumber)
 
 
 class ConnectorTest(BaseTestCase):
@@ -96,6 +103,202 @@ class ConnectorTest(BaseTestCase):
             connector = vivialconnect.Connector.find(424242)
         self.assertEqual(1, len(connector.phone_numbers))
 
+    def test_field_is_initialized_on_first_read(self):
+        connector = vivialconnect.Connector({'id': 1, 'name': 'Empty'})
+        self.assertNotIn('phone_numbers', connector.__dict__)
+        numbers = connector.phone_numbers
+        self.assertIsInstance(numbers, SimpleResourceList)
+        self.assertEqual(0, len(numbers))
+        self.assertIs(numbers, connector.__dict__['phone_numbers'])
+        self.assertIs(numbers, connector.phone_numbers)
+        self.assertNotIn('phone_numbers', connector.attributes.dirty)
+        self.assertIsNone(Holder().number)
+
+    def test_field_assign_marks_dirty(self):
+        connector = self._connector()
+        self.assertFalse(connector.is_dirty())
+        connector.phone_numbers = [{'phone_number': '+15550001111'}]
+        self.assertIn('phone_numbers', connector.attributes.dirty)
+        self.assertIsInstance(connector.phone_numbers, SimpleResourceList)
+        self.assertIsInstance(connector.phone_numbers[0], vivialconnect.ConnectorNumber)
+        self.assertIs(connector, connector.phone_numbers[0].parent_resource)
+
+        holder = Holder._loaded({})
+        number = vivialconnect.ConnectorNumber({'phone_number': '+15550001111'})
+        holder.number = number
+        self.assertIs(number, holder.number)
+        self.assertIs(holder, number.parent_resource)
+        self.assertEqual({'number'}, holder.attributes.dirty)
+
+    def test_field_parent_checks(self):
+        first = vivialconnect.Connector({'id': 1})
+        second = vivialconnect.Connector({'id': 2})
+        first.phone_numbers.append({'phone_number': '+15550001111'})
+        with self.assertRaises(TypeError):
+            second.phone_numbers = first.phone_numbers
+        with self.assertRaises(TypeError):
+            second.phone_numbers.append(first.phone_numbers[0])
+        self.assertEqual(0, len(second.phone_numbers))
+
+        holder = Holder()
+        with self.assertRaises(TypeError):
+            holder.number = first.phone_numbers[0]
+        self.assertIsNone(holder.number)
+
+    def test_save_sends_only_changes(self):
+        fixture = self.load_fixture('connector/connector_with_phone_number')
+        sent = []
+
+        def record(url, request, **kwargs):
+            sent.append((request.method, json.loads(request.body) if request.body else None))
+            return self.fake(url, request, body=fixture)
+
+        with HTTMock(self.response_content, body=fixture):
+            connector = vivialconnect.Connector.find(424242)
+        self.assertFalse(connector.is_dirty())
+        with HTTMock(record):
+            connector.save()
+            self.assertEqual([], sent)
+
+            connector.name = 'Renamed'
+            self.assertTrue(connector.is_dirty())
+            connector.save()
+            self.assertEqual(('PUT', {'connector': {'name': 'Renamed'}}), sent[-1])
+            self.assertFalse(connector.is_dirty())
+
+            del connector.phone_numbers[0]
+            connector.save()
+            self.assertEqual(('PUT', {'connector': {'phone_numbers': []}}), sent[-1])
+
+            connector.phone_numbers[0].phone_number = '+15555555555'
+            connector.save()
+            self.assertEqual(['phone_numbers'], list(sent[-1][1]['connector']))
+
+            connector.save(full=True)
+            self.assertIn('active', sent[-1][1]['connector'])
+        self.assertEqual(4, len(sent))
+
+    def _connector(self, name='connector/connector_with_phone_number'):
+        with HTTMock(self.response_content, body=self.load_fixture(name)):
+            return vivialconnect.Connector.find(424242)
+
+    def test_changes(self):
+        connector = self._connector()
+        self.assertEqual([], connector.changes())
+        del connector.phone_numbers[0]
+        connector.phone_numbers.append({'phone_number': '+15550001111'})
+        changes = connector.changes()
+        self.assertEqual(['remove', 'add'], [op.action for op in changes])
+        self.assertEqual([{'phone_number': '+12345678901', 'phone_number_id': 1}], changes[0].items)
+        self.assertEqual([{'phone_number': '+15550001111'}], changes[1].items)
+
+        connector.phone_numbers.append({'phone_number_id': 1})
+        self.assertEqual(1, len(connector.changes()))
+
+    def test_changed_callback_is_replaced(self):
+        connector = self._connector('connector/connector_with_callback')
+        connector.callbacks[0].url = 'https://example.com/status'
+        changes = connector.changes()
+        self.assertEqual(['remove', 'add'], [op.action for op in changes])
+        self.assertEqual('https://somecallback.com/status', changes[0].items[0]['url'])
+        self.assertEqual('https://example.com/status', changes[1].items[0]['url'])
+
+    def test_sync(self):
+        connector = self._connector()
+        sent = []
+
+        def record(url, request, **kwargs):
+            sent.append((request.method, url.path, json.loads(request.body)))
+            return self.fake(url, request, body=b'{}')
+
+        del connector.phone_numbers[0]
+        for i in range(120):
+            connector.phone_numbers.append({'phone_number': '+1555000%04d' % i})
+        with HTTMock(record):
+            report = connector.sync(batch_size=50, workers=3)
+            self.assertTrue(report.ok)
+            self.assertEqual(4, report.requests)
+            self.assertEqual(120, report.count('phone_numbers', 'add'))
+            self.assertEqual(1, report.count('phone_numbers', 'remove'))
+            self.assertEqual('DELETE', sent[0][0])
+            self.assertEqual(
+                '/api/v1.0/accounts/1234567890/connectors/424242/phone_numbers.json', sent[0][1]
+            )
+            self.assertEqual(
+                [50, 50, 20],
+                sorted((len(body['connector']['phone_numbers']) for _, _, body in sent[1:]), reverse=True),
+            )
+            self.assertEqual([], connector.changes())
+            self.assertFalse(connector.is_dirty())
+            connector.save()
+            connector.sync()
+        self.assertEqual(4, len(sent))
+
+    def test_sync_keeps_failed_batches_pending(self):
+        connector = self._connector()
+
+        def fail_deletes(url, request, **kwargs):
+            if request.method == 'DELETE':
+                return self.fake(url, request, code=400, body=b'{"message": "No"}')
+            return self.fake(url, request, body=b'{}')
+
+        del connector.phone_numbers[0]
+        connector.phone_numbers.append({'phone_number': '+15550001111'})
+        with HTTMock(fail_deletes):
+            report = connector.sync()
+        self.assertFalse(report.ok)
+        self.assertEqual(1, report.count('phone_numbers', 'add'))
+        self.assertEqual(['remove'], [op.action for op in connector.changes()])
+
+    def test_sync_with_more_numbers(self):
+        connector = self._connector('connector/connector_with_more_numbers')
+        connector.callbacks.append({'message_type': 'text', 'event_type': 'status',
+                                    'url': 'https://example.com/status', 'method': 'POST'})
+        self.assertEqual(['callbacks'], [op.field for op in connector.changes()])
+        connector.phone_numbers.append({'phone_number': '+12345678903'})
+        with self.assertRaises(ResourceError):
+            connector.changes()
+
+        pages = {
+            '1': [{'phone_number': '+12345678901', 'phone_number_id': 1},
+                  {'phone_number': '+12345678902', 'phone_number_id': 2}],
+            '2': [{'phone_number': '+12345678903', 'phone_number_id': 3},
+                  {'phone_number': '+12345678904', 'phone_number_id': 4}],
+            '3': [{'phone_number': '+12345678905', 'phone_number_id': 5}],
+        }
+        sent = []
+
+        def record(url, request, **kwargs):
+            if request.method == 'GET':
+                page = dict(p.split('=') for p in url.query.split('&'))['page']
+                sent.append((request.method, page))
+                body = {'connector': {'phone_numbers': pages[page], 'more_numbers': page != '3'}}
+                return self.fake(url, request, body=json.dumps(body).encode())
+            sent.append((request.method, json.loads(request.body)['connector']))
+            return self.fake(url, request, body=b'{}')
+
+        with HTTMock(record):
+            numbers = connector.load_phone_numbers(limit=2)
+            self.assertEqual(5, len(numbers))
+            self.assertEqual(['callbacks'], [op.field for op in connector.changes()])
+
+            del connector.phone_numbers[4]
+            connector.phone_numbers.append({'phone_number': '+12345678903'})
+            connector.phone_numbers.append({'phone_number': '+12345678906'})
+            report = connector.sync()
+        self.assertTrue(report.ok)
+        self.assertEqual([('GET', '1'), ('GET', '2'), ('GET', '3')], sent[:3])
+        self.assertEqual(
+            [('DELETE', {'phone_numbers': [{'phone_number': '+12345678905', 'phone_number_id': 5}]}),
+             ('POST', {'phone_numbers': [{'phone_number': '+12345678906'}]})],
+            [item for item in sent[3:] if 'phone_numbers' in item[1]],
+        )
+        self.assertEqual([], connector.changes())
+
+    def test_sync_requires_loaded_connector(self):
+        with self.assertRaises(ResourceError):
+            vivialconnect.Connector({'name': 'New'}).sync()
+
     def validate_with_dict(self, obj, data):
         for k, v in data.items():
             self.assertEqual(v, getattr(obj, k))
@@ -0,0 +1,98 @@
+import json
+import unittest
+
+from datetime import date, datetime
+
+from tests.common import BaseTestCase
+from tests.common import HTTMock
+from vivialconnect import TransactionAggregator
+from vivialconnect.resources import costs
+from vivialconnect.resources.account import Transaction
+from vivialconnect.resources.costs import CostTotals
+
+
+class TransactionAggregatorTest(BaseTestCase):
+    def setUp(self):
+        super(TransactionAggregatorTest, self).setUp()
+        self.transactions = json.loads(self.load_fixture("transaction/transactions"))[
+            "transactions"
+        ]
+
+    def expected(self, key):
+        rollup = {}
+        for transaction in self.transactions:
+            totals = rollup.setdefault(key(transaction), CostTotals())
+            totals.count += 1
+            totals.cash_amount += transaction["cash_amount"]
+            totals.credit_amount += transaction["credit_amount"]
+            totals.unit_count += transaction["unit_count"]
+        return rollup
+
+    def aggregators(self):
+        yield TransactionAggregator(use_numpy=False).extend(self.transactions)
+        if costs.numpy is not None:
+            yield TransactionAggregator(use_numpy=True).extend(self.transactions)
+
+    def test_rollup_by_type(self):
+        expected = self.expected(lambda t: t["transaction_type"])
+        for aggregator in self.aggregators():
+            self.assertEqual(expected, aggregator.rollup("transaction_type"))
+
+    def test_rollup_by_account_and_day(self):
+        expected = self.expected(
+            lambda t: (t["account_id"], date(*map(int, t["post_time"][:10].split("-"))))
+        )
+        for aggregator in self.aggregators():
+            self.assertEqual(expected, aggregator.rollup("account_id", "day"))
+
+    def test_rollup_by_hour(self):
+        for aggregator in self.aggregators():
+            rollup = aggregator.rollup("hour")
+            self.assertEqual(50, sum(totals.count for totals in rollup.values()))
+            self.assertEqual(1, rollup[datetime(2020, 12, 8, 20)].count)
+
+    def test_totals_and_size(self):
+        aggregator = TransactionAggregator(use_numpy=False)
+        with HTTMock(self.response_content, body=self.load_fixture("transaction/transactions")):
+            aggregator.extend(Transaction.find())
+        self.assertEqual(50, len(aggregator))
+        self.assertEqual(
+            sum(t["cash_amount"] for t in self.transactions), aggregator.totals().cash_amount
+        )
+        self.assertEqual(50 * 40, aggregator.nbytes)
+
+    def test_missing_post_time(self):
+        aggregator = TransactionAggregator(use_numpy=False)
+        aggregator.add({"transaction_type": "sms_local_out", "cash_amount": 60})
+        self.assertEqual({None: CostTotals(1, 60.0, 0.0, 0)}, aggregator.rollup("day"))
+
+    def test_negative_amounts(self):
+        for aggregator in self.aggregators():
+            aggregator.add(
+                {"transaction_type": "refund", "cash_amount": -60, "unit_count": -2}
+            )
+            self.assertEqual(
+                CostTotals(1, -60.0, 0.0, -2), aggregator.rollup("transaction_type")["refund"]
+            )
+
+    def test_invalid_transaction_is_not_added(self):
+        aggregator = TransactionAggregator(use_numpy=False)
+        with self.assertRaises(ValueError):
+            aggregator.add({"transaction_type": "sms_local_out", "unit_count": "many"})
+        self.assertEqual(0, len(aggregator))
+        self.assertEqual(0, aggregator.nbytes)
+
+    def test_unknown_dimension(self):
+        with self.assertRaises(ValueError):
+            TransactionAggregator(use_numpy=False).rollup("week")
+
+    def test_from_range(self):
+        with HTTMock(self.response_content, body=self.load_fixture("transaction/transactions")):
+            aggregator = TransactionAggregator.from_range(
+                datetime(2020, 12, 1), datetime(2020, 12, 2), use_numpy=False, limit=100
+            )
+        self.assertEqual(50, len(aggregator))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import json
+import unittest
+
+from tests.common import BaseTestCase
+from tests.common import HTTMock
+from vivialconnect import Message, Requestor, Resource
+from vivialconnect.resources.account import Transaction
+from vivialconnect.common.error import ResourceNotFound
+from vivialconnect.common.jsonstream import JsonArrayStream
+
+
+def chunked(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class JsonArrayStreamTest(BaseTestCase):
+    def test_decodes_listing_in_any_chunk_size(self):
+        fixture = self.load_fixture("message/messages")
+        expected = json.loads(fixture)
+        for size in (1, 7, 64, 4096, len(fixture)):
+            stream = JsonArrayStream(chunked(fixture, size))
+            self.assertEqual(expected["messages"], list(stream))
+
+    def test_multibyte_characters_split_across_chunks(self):
+        data = json.dumps([{"body": "héllo ✓"}, 12.5, None], ensure_ascii=False)
+        stream = JsonArrayStream(chunked(data.encode("utf-8"), 1))
+        self.assertEqual([{"body": "héllo ✓"}, 12.5, None], list(stream))
+
+    def test_root_selects_member(self):
+        data = b'{"a": [1, 2], "b": [3], "count": 1}'
+        stream = JsonArrayStream(chunked(data, 3), root="b")
+        self.assertEqual([3], list(stream))
+        self.assertEqual({"a": [1, 2], "count": 1}, stream.meta)
+
+    def test_meta_around_listing(self):
+        data = b'{"count": 3, "messages": [{"id": 1}, {"id": 2}], "next": null}'
+        stream = JsonArrayStream(chunked(data, 5))
+        self.assertEqual([{"id": 1}, {"id": 2}], list(stream))
+        self.assertEqual({"count": 3, "next": None}, stream.meta)
+
+    def test_empty_listings(self):
+        self.assertEqual([], list(JsonArrayStream([b"[]"])))
+        self.assertEqual([], list(JsonArrayStream([b"{}"])))
+        self.assertEqual([], list(JsonArrayStream([b'{"messages": []}'])))
+
+    def test_invalid_document(self):
+        with self.assertRaises(ValueError):
+            list(JsonArrayStream([b'{"messages": [1, 2'], root="messages"))
+
+    def test_close_releases_source(self):
+        closed = []
+
+        def chunks():
+            try:
+                yield b"[1, 2, "
+                yield b"3]"
+            finally:
+                closed.append(True)
+
+        stream = JsonArrayStream(chunks())
+        self.assertEqual(1, next(stream))
+        stream.close()
+        self.assertEqual([True], closed)
+
+
+class StreamRequestTest(BaseTestCase):
+    def test_get_stream(self):
+        requestor = Requestor(api_base_url=Resource.api_base_url)
+        with HTTMock(self.response_content, body=self.load_fixture("message/messages")):
+            stream = requestor.get_stream("/messages.json", root="messages")
+            messages = list(stream)
+        self.assertEqual(json.loads(self.load_fixture("message/messages"))["messages"], messages)
+
+    def test_get_stream_error(self):
+        requestor = Requestor(api_base_url=Resource.api_base_url)
+        with HTTMock(self.response_content, code=404, body=b'{"message": "Not found"}'):
+            with self.assertRaises(ResourceNotFound):
+                requestor.get_stream("/messages.json")
+
+    def test_find_stream(self):
+        with HTTMock(self.response_content, body=self.load_fixture("message/messages")):
+            messages = list(Message.find_stream())
+            records = list(Message.find_stream(records=True))
+        expected = Message._build_list(
+            json.loads(self.load_fixture("message/messages")), raw=True
+        )
+        self.assertEqual(len(expected), len(messages))
+        self.assertIsInstance(messages[0], Message)
+        self.assertEqual(expected[0]["id"], messages[0].id)
+        self.assertEqual(expected[-1]["body"], records[-1].body)
+
+    def test_transaction_find_stream(self):
+        with HTTMock(self.response_content, body=self.load_fixture("transaction/transactions")):
+            transactions = list(Transaction.find_stream(raw=True))
+        self.assertEqual(
+            json.loads(self.load_fixture("transaction/transactions"))["transactions"],
+            transactions,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,7 @@
+import json
+
+from six.moves.urllib.parse import parse_qsl
+
 import vivialconnect
 from tests.common import BaseTestCase, HTTMock
 
@@ -16,6 +20,17 @@ class LogTest(BaseTestCase):
         self.assertTrue(isinstance(logs, list))
         self.assertEqual(len(logs), 16)
 
+    def test_get_logs_raw(self):
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("log/log"),
+            headers={"Conent-type": "application/json"},
+        ):
+            params = {"start_time": "20181101T145548Z", "end_time": "20181205T155548Z"}
+            last_key, logs = vivialconnect.Log.find(raw=True, **params)
+        self.assertTrue(last_key != "")
+        self.assertTrue(all(isinstance(log, dict) for log in logs))
+
     def test_get_aggregated_logs(self):
         with HTTMock(
             self.response_content,
@@ -67,3 +82,41 @@ class LogTest(BaseTestCase):
         self.assertTrue("user.login", log_item["log_type"])
         # Check the amount of items
         self.assertEqual(len(logs["log_items"]), 2)
+
+    def paged_logs(self, url, request, **kwargs):
+        logs = json.loads(self.load_fixture("log/log").decode())
+        query = dict(parse_qsl(url.query))
+        start_key = query.get("start_key")
+        self.requested_keys.append(start_key)
+        if start_key is None:
+            logs["log_items"] = logs["log_items"][:10]
+            logs["last_key"] = "page-2"
+        else:
+            logs["log_items"] = logs["log_items"][10:]
+            logs["last_key"] = None
+        return self.fake(url, request, body=json.dumps(logs).encode())
+
+    def test_stream_logs(self):
+        self.requested_keys = []
+        with HTTMock(self.paged_logs):
+            logs = list(vivialconnect.Log.stream("20181101T145548Z", "20181205T155548Z"))
+        self.assertEqual(16, len(logs))
+        self.assertEqual([None, "page-2"], self.requested_keys)
+
+    def test_stream_logs_resume(self):
+        self.requested_keys = []
+        with HTTMock(self.paged_logs):
+            logs = vivialconnect.Log.stream(
+                "20181101T145548Z", "20181205T155548Z", prefetch=False
+            )
+            for _ in range(12):
+                next(logs)
+            cursor = logs.cursor
+            logs.close()
+            rest = list(
+                vivialconnect.Log.stream(
+                    "20181101T145548Z", "20181205T155548Z", cursor=cursor
+                )
+            )
+        self.assertEqual({"page": "page-2", "offset": 2}, cursor)
+        self.assertEqual(4, len(rest))
@@ -1,3 +1,7 @@
+import json
+
+from six.moves.urllib.parse import parse_qsl
+
 import vivialconnect
 
 from tests.common import BaseTestCase
@@ -132,6 +136,13 @@ class MessageTest(BaseTestCase):
         ):
             attachments = message.attachments()
         self.assertEqual(2, len(attachments))
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("message/attachments"),
+            headers={"Content-type": "application/json"},
+        ):
+            raw_attachments = message.attachments(raw=True)
+        self.assertEqual([a.id for a in attachments], [a["id"] for a in raw_attachments])
 
     def test_count_attachments(self):
         with HTTMock(
@@ -216,6 +227,176 @@ class MessageTest(BaseTestCase):
 
             self.assertTrue(hasattr(message, "body") and message.body == "")
 
+    def test_async_send_message(self):
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("message/message"),
+            headers={"Content-type": "application/json"},
+        ):
+            message = Message()
+            message.from_number = "+12223334444"
+            message.to_number = "+12223335555"
+            message.body = "This is message"
+            self.run_async(message.asend())
+        self.assertEqual(6242736, message.id)
+
+    def test_async_get_messages(self):
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("message/messages"),
+            headers={"Content-type": "application/json"},
+        ):
+            messages = self.run_async(Message.afind())
+        self.assertEqual(2, len(messages))
+
+    def test_async_count_messages(self):
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("message/count"),
+            headers={"Content-type": "application/json"},
+        ):
+            count = self.run_async(Message.acount())
+        self.assertEqual(2, count)
+
+    def test_async_get_attachments(self):
+        message = Message({"id": 6242736})
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("message/attachments"),
+            headers={"Content-type": "application/json"},
+        ):
+            attachments = self.run_async(message.aattachments())
+        self.assertEqual(2, len(attachments))
+
+    def paged_messages(self, url, request, **kwargs):
+        messages = json.loads(self.load_fixture("message/messages").decode())
+        query = dict(parse_qsl(url.query))
+        page, limit = int(query["page"]), int(query["limit"])
+        messages["messages"] = messages["messages"][(page - 1) * limit : page * limit]
+        self.requested_pages.append(page)
+        return self.fake(url, request, body=json.dumps(messages).encode())
+
+    def test_iter_all_messages(self):
+        self.requested_pages = []
+        with HTTMock(self.paged_messages):
+            messages = list(Message.iter_all(page_size=1))
+        self.assertEqual(2, len(messages))
+        self.assertNotEqual(messages[0].id, messages[1].id)
+        self.assertEqual([1, 2, 3], self.requested_pages)
+
+    def test_iter_all_messages_with_prefetch(self):
+        self.requested_pages = []
+        with HTTMock(self.paged_messages):
+            with Message.iter_all(page_size=1, prefetch=True) as messages:
+                ids = [message.id for message in messages]
+        self.assertEqual(2, len(ids))
+        self.assertEqual([1, 2, 3], self.requested_pages)
+
+    def test_iter_all_messages_resume(self):
+        self.requested_pages = []
+        with HTTMock(self.paged_messages):
+            messages = Message.iter_all(page_size=1)
+            first = next(messages)
+            cursor = json.loads(json.dumps(messages.cursor))
+            rest = list(Message.iter_all(page_size=1, cursor=cursor))
+        self.assertEqual(1, len(rest))
+        self.assertNotEqual(first.id, rest[0].id)
+
+    def test_nested_classes_are_reused(self):
+        first, second = Message(), Message()
+        first._update({"id": 1, "delivery_report": {"code": 1}, "segments": [{"n": 1}]})
+        second._update({"id": 2, "delivery_report": {"code": 2}, "segments": [{"n": 2}]})
+        self.assertIs(type(first.delivery_report), type(second.delivery_report))
+        self.assertIs(type(first.segments[0]), type(second.segments[0]))
+        self.assertEqual("DeliveryReport", type(first.delivery_report).__name__)
+        self.assertIs(Message._find_class_for("attachment"), vivialconnect.Attachment)
+
+    def test_get_messages_raw(self):
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("message/messages"),
+            headers={"Content-type": "application/json"},
+        ):
+            messages = vivialconnect.Message.find(raw=True)
+            first = vivialconnect.Message.find_first(raw=True)
+        self.assertEqual(2, len(messages))
+        self.assertIsInstance(messages[0], dict)
+        self.assertEqual(messages[0], first)
+        self.assertIn("body", first)
+
+    def test_get_messages_records(self):
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("message/messages"),
+            headers={"Content-type": "application/json"},
+        ):
+            messages = vivialconnect.Message.find()
+            records = vivialconnect.Message.find(records=True)
+        self.assertEqual(2, len(records))
+        self.assertIs(type(records[0]), type(records[1]))
+        for message, record in zip(messages, records):
+            self.assertEqual(message.id, record.id)
+            self.assertEqual(message.body, record.body)
+            self.assertEqual(message._to_dict(), record._to_dict())
+            self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual("message(%s)" % messages[0].id, repr(records[0]))
+        with self.assertRaises(AttributeError):
+            records[0].body = "changed"
+        with self.assertRaises(AttributeError):
+            records[0].not_a_field
+
+    def test_records_with_invalid_field_names(self):
+        body = {
+            "messages": [
+                {"id": 1, "from": "+15555555555", "_links": {}, "body": "Hi"},
+                {"id": 2, "body": "Hello"},
+            ]
+        }
+        with HTTMock(
+            self.response_content,
+            body=json.dumps(body).encode(),
+            headers={"Content-type": "application/json"},
+        ):
+            records = vivialconnect.Message.find(records=True)
+        self.assertIsInstance(records[0], vivialconnect.Message)
+        self.assertEqual("+15555555555", records[0]._to_dict()["from"])
+        self.assertEqual({}, records[0]._to_dict()["_links"])
+        self.assertEqual("Hello", records[1].body)
+        self.assertFalse(hasattr(records[1], "__dict__"))
+
+    def test_attribute_access(self):
+        message = Message({"body": "Hi", "status": "sent"})
+        self.assertEqual("Hi", message.body)
+        self.assertEqual("Hi", message.body)
+        self.assertFalse(hasattr(Message({"status": "sent"}), "body"))
+
+        message.body = "Howdy"
+        message.tag = "new"
+        self.assertEqual("Howdy", message.attributes["body"])
+        self.assertEqual("new", message.tag)
+        self.assertEqual({"body", "status", "tag"}, set(message.attributes))
+
+        object.__setattr__(message, "status", "local")
+        self.assertEqual("local", message.status)
+        self.assertEqual("sent", message.attributes["status"])
+
+    def test_attribute_assignment_follows_class_attributes(self):
+        class Widget(vivialconnect.Resource):
+            pass
+
+        widget = Widget({"size": 1})
+        widget.color = "red"
+        self.assertIn("color", widget.attributes)
+        Widget.color = "blue"
+        try:
+            widget.color = "green"
+            self.assertEqual("green", widget.__dict__["color"])
+            self.assertEqual("red", widget.attributes["color"])
+        finally:
+            del Widget.color
+        widget.size = 2
+        self.assertEqual(2, widget.attributes["size"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import json
 import unittest
 
 from tests.common import HTTMock, BaseTestCase
@@ -95,5 +96,44 @@ class NumberTest(BaseTestCase):
             assert number.id is not None
 
 
+    def test_update_sends_only_changes(self):
+        sent = []
+
+        def record(url, request, **kwargs):
+            sent.append(json.loads(request.body))
+            return self.fake(url, request, body=self.load_fixture("number/tollfree-purchase"))
+
+        with HTTMock(
+            self.response_content, body=self.load_fixture("number/tollfree-purchase")
+        ):
+            number = Number.find(1104650)
+        number.incoming_text_url = "https://example.com/sms"
+        with HTTMock(record):
+            number.save()
+            number.save()
+            Number.partial_updates = False
+            try:
+                number.save()
+            finally:
+                Number.partial_updates = True
+        self.assertEqual(
+            {"phone_number": {"incoming_text_url": "https://example.com/sms"}}, sent[0]
+        )
+        self.assertEqual(2, len(sent))
+        self.assertIn("capabilities", sent[1]["phone_number"])
+
+    def test_search_available_raw(self):
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("number/available-tollfree"),
+            headers={"Content-type": "application/json"},
+        ):
+            available_numbers = Number.available(number_type="tollfree", raw=True)
+
+            assert len(available_numbers) > 0
+            for number in available_numbers:
+                assert number["phone_number"][2:].startswith("833")
+
+
 if __name__ == "__main__":
     unittest.main()
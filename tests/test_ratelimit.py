@@ -0,0 +1,99 @@
+from tests.common import BaseTestCase
+from tests.common import HTTMock
+from vivialconnect import AsyncRequestor, Requestor, Resource
+from vivialconnect.common.async_requestor import ThreadPoolTransport
+from vivialconnect.common.error import RateLimit
+from vivialconnect.common.ratelimit import (
+    RateLimiter,
+    TokenBucket,
+    endpoint_class,
+    parse_retry_after,
+)
+
+
+class RateLimitTest(BaseTestCase):
+    def test_endpoint_class(self):
+        self.assertEqual("messages", endpoint_class("/accounts/1/messages.json"))
+        self.assertEqual("messages", endpoint_class("/accounts/1/messages/2/attachments.json"))
+        self.assertEqual("numbers", endpoint_class("/accounts/1/numbers/available/US/local.json"))
+        self.assertEqual("logs", endpoint_class("/accounts/1/logs.json?start_time=x"))
+        self.assertEqual("default", endpoint_class("/accounts/1/connectors.json"))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(3.0, parse_retry_after("3"))
+        self.assertEqual(0.0, parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"))
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+
+    def test_bucket_reservations(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        self.assertEqual(0.0, bucket.reserve())
+        self.assertEqual(0.0, bucket.reserve())
+        self.assertAlmostEqual(0.1, bucket.reserve(), places=2)
+        self.assertAlmostEqual(0.2, bucket.reserve(), places=2)
+
+    def test_bucket_aimd(self):
+        bucket = TokenBucket(rate=10, increase=1)
+        bucket.on_throttle()
+        self.assertEqual(5, bucket.rate)
+        bucket.on_throttle(retry_after=30)
+        self.assertEqual(2.5, bucket.rate)
+        self.assertGreater(bucket.reserve(), 29)
+        bucket.on_success()
+        self.assertEqual(3.5, bucket.rate)
+        for _ in range(20):
+            bucket.on_success()
+        self.assertEqual(10, bucket.rate)
+
+    def test_limiter_buckets(self):
+        limiter = RateLimiter(rate=5, rates={"messages": 20})
+        messages = limiter.bucket("1", "/accounts/1/messages.json")
+        self.assertIs(messages, limiter.bucket("1", "/accounts/1/messages/3.json"))
+        self.assertIsNot(messages, limiter.bucket("2", "/accounts/2/messages.json"))
+        self.assertEqual(20, messages.max_rate)
+        self.assertEqual(5, limiter.bucket("1", "/accounts/1/users.json").max_rate)
+
+    def test_requestor_feedback(self):
+        limiter = RateLimiter(rate=10)
+        requestor = Requestor(
+            api_base_url=Resource.api_base_url, api_account_id="1", rate_limiter=limiter
+        )
+        with HTTMock(
+            self.response_content,
+            body=b'{"message": "Slow down"}',
+            code=429,
+            headers={"Content-type": "application/json", "Retry-After": "1"},
+        ):
+            with self.assertRaises(RateLimit):
+                requestor.get("/accounts/1/messages.json")
+        bucket = limiter.bucket("1", "/accounts/1/messages.json")
+        self.assertEqual(5, bucket.rate)
+        self.assertGreater(bucket.reserve(), 0.5)
+
+    def test_split_url_feedback(self):
+        limiter = RateLimiter(rate=10)
+        options = dict(
+            api_base_url=Resource.api_base_url, api_account_id="1", rate_limiter=limiter
+        )
+        split = ("tests.vivialconnect.net", "/api/v1.0/accounts/1/messages.json", "")
+        with HTTMock(
+            self.response_content,
+            body=b'{"message": "Slow down"}',
+            code=429,
+            headers={"Content-type": "application/json"},
+        ):
+            with self.assertRaises(RateLimit):
+                Requestor(**options).get(split)
+            requestor = AsyncRequestor(transport=ThreadPoolTransport(), **options)
+            with self.assertRaises(RateLimit):
+                self.run_async(requestor.get(split))
+        self.assertEqual(2.5, limiter.bucket("1", "/accounts/1/messages.json").rate)
+
+    def test_resource_rate_limiter(self):
+        limiter = RateLimiter()
+        Resource.rate_limiter = limiter
+        try:
+            self.assertIs(limiter, Resource.request.rate_limiter)
+            self.assertIs(limiter, Resource.async_request.rate_limiter)
+        finally:
+            Resource.rate_limiter = None
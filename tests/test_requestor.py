@@ -0,0 +1,154 @@
+import datetime
+
+from unittest import mock
+
+from tests.common import BaseTestCase
+from tests.common import HTTMock
+from vivialconnect import Requestor, AsyncRequestor, Resource
+from vivialconnect.common import requestor as requestor_module
+from vivialconnect.common import async_requestor as async_requestor_module
+from vivialconnect.common.async_requestor import (
+    AiohttpTransport,
+    AsyncTransport,
+    ThreadPoolTransport,
+)
+from vivialconnect.common.error import ResourceNotFound
+from vivialconnect.resources.message import Message
+
+
+class RequestorTest(BaseTestCase):
+    def test_session_is_reused(self):
+        requestor = Requestor(api_base_url=Resource.api_base_url)
+        with HTTMock(
+            self.response_content,
+            body=self.load_fixture("account/count"),
+            headers={"Content-type": "application/json"},
+        ):
+            session = requestor.session
+            requestor.get("/accounts/count.json")
+            requestor.get("/accounts/count.json")
+        self.assertIs(session, requestor.session)
+
+    def test_pool_configuration(self):
+        requestor = Requestor(pool_connections=3, pool_maxsize=7)
+        adapter = requestor.session.get_adapter("https://api.vivialconnect.net")
+        self.assertEqual(7, adapter._pool_maxsize)
+        self.assertEqual(3, adapter._pool_connections)
+
+    def test_idle_session_is_recycled(self):
+        requestor = Requestor(pool_idle_timeout=5)
+        session = requestor.session
+        requestor._last_used -= 10
+        self.assertIsNot(session, requestor.session)
+
+    def test_close(self):
+        with Requestor() as requestor:
+            session = requestor.session
+        self.assertIsNone(requestor._session)
+        self.assertIsNot(session, requestor.session)
+
+    def test_session_survives_configuration_reset(self):
+        session = Resource.request.session
+        Resource.api_key = "__another_test_key__"
+        self.assertEqual("__another_test_key__", Resource.request.api_key)
+        self.assertIs(session, Resource.request.session)
+
+    def test_pool_reconfiguration_closes_session(self):
+        session = Resource.request.session
+        Resource.pool_maxsize = 20
+        try:
+            self.assertEqual(20, Resource.request.pool_maxsize)
+            self.assertIsNot(session, Resource.request.session)
+        finally:
+            Resource.pool_maxsize = None
+
+    def test_async_requestor_maps_errors(self):
+        requestor = AsyncRequestor(
+            api_base_url=Resource.api_base_url, transport=ThreadPoolTransport()
+        )
+        with HTTMock(
+            self.response_content,
+            body=b'{"message": "Not found"}',
+            code=404,
+            headers={"Content-type": "application/json"},
+        ):
+            with self.assertRaises(ResourceNotFound):
+                self.run_async(requestor.get("/accounts/1234567890/messages/1.json"))
+
+    def test_async_requestor_custom_transport(self):
+        class FakeTransport(AsyncTransport):
+            async def send(self, requestor, method, abs_url, headers, data, **kwargs):
+                self.headers = headers
+                return '{"count": 3}', 200, abs_url, {}
+
+        transport = FakeTransport()
+        requestor = AsyncRequestor(transport=transport)
+        self.assertEqual({"count": 3}, self.run_async(requestor.get("/count.json")))
+        self.assertTrue(transport.headers["Authorization"].startswith("HMAC "))
+
+    def test_aiohttp_session_per_event_loop(self):
+        fake_aiohttp = mock.Mock()
+        fake_aiohttp.ClientSession.side_effect = lambda **kwargs: mock.Mock(closed=False)
+        with mock.patch.object(async_requestor_module, "aiohttp", fake_aiohttp):
+            transport = AiohttpTransport()
+
+            async def sessions():
+                return transport._get_session(), transport._get_session()
+
+            first, again = self.run_async(sessions())
+            second, _ = self.run_async(sessions())
+        self.assertIs(first, again)
+        self.assertIsNot(first, second)
+
+    def test_static_headers_are_cached_per_process(self):
+        headers = requestor_module.static_headers()
+        self.assertIs(headers, requestor_module.static_headers())
+        with mock.patch("os.getpid", return_value=-1):
+            forked_headers = requestor_module.static_headers()
+        self.assertIsNot(headers, forked_headers)
+        self.assertEqual(headers, forked_headers)
+        self.assertIn("X-VivialConnect-User-Agent", headers)
+
+    def test_split_url(self):
+        requestor = Requestor(api_base_url="https://tests.vivialconnect.net:8443/api/v1.0")
+        self.assertEqual(
+            ("tests.vivialconnect.net:8443", "/api/v1.0/messages.json", "page=2&limit=5"),
+            requestor.split_url("/messages.json?page=2", {"limit": 5}),
+        )
+        split = ("other.vivialconnect.net", "/api/v1.0/messages.json", "page=2")
+        self.assertEqual(split, requestor.split_url(split))
+        requestor.api_base_url = "https://api.vivialconnect.net/api"
+        self.assertEqual(
+            ("api.vivialconnect.net", "/api/count.json", ""),
+            requestor.split_url("/count.json"),
+        )
+
+    def test_prepare_request_with_split_url(self):
+        requestor = Requestor(api_base_url=Resource.api_base_url, api_secret="secret")
+        now = datetime.datetime(2020, 12, 8, 20, 13, 30)
+        with mock.patch("datetime.datetime") as clock:
+            clock.utcnow.return_value = now
+            prepared = requestor.prepare_request("get", "/messages.json", {"page": 2})
+            split = requestor.prepare_request(
+                "get", ("tests.vivialconnect.net", "/api/v1.0/messages.json", "page=2")
+            )
+        self.assertEqual(
+            "https://tests.vivialconnect.net/api/v1.0/messages.json?page=2", prepared[1]
+        )
+        self.assertEqual(prepared, split)
+        self.assertEqual("tests.vivialconnect.net", prepared[2]["Host"])
+
+    def test_path_templates_follow_account_id(self):
+        self.assertEqual(
+            "/accounts/1234567890/messages/42.json", Message._element_path(42)
+        )
+        Resource.api_account_id = "55"
+        self.assertEqual("/accounts/55/messages.json", Message._collection_path())
+        self.assertEqual(
+            "/accounts/55/messages/42/attachments.json",
+            Message._custom_path(42, custom_path="/attachments"),
+        )
+        self.assertEqual(
+            "/accounts/55/numbers/7/tags.json",
+            Message._item_sub_resource_path(7, "numbers", "tags"),
+        )
@@ -0,0 +1,148 @@
+import asyncio
+
+from unittest import mock
+
+import requests
+
+from tests.common import BaseTestCase
+from tests.common import HTTMock
+from vivialconnect import AsyncRequestor, Message, Requestor, Resource
+from vivialconnect.common import async_requestor as async_requestor_module
+from vivialconnect.common.async_requestor import AsyncTransport
+from vivialconnect.common.error import BadRequest, ConnectionError, ServerError
+from vivialconnect.common.retry import IDEMPOTENCY_KEY_HEADER, RetryPolicy
+
+
+class RetryTest(BaseTestCase):
+    def setUp(self):
+        super(RetryTest, self).setUp()
+        self.requests = []
+        self.responses = []
+
+    def scripted(self, url, request, **kwargs):
+        self.requests.append(request)
+        code, body, headers = self.responses.pop(0)
+        if isinstance(code, Exception):
+            raise code
+        return self.fake(url, request, code=code, body=body, headers=headers)
+
+    def requestor(self, **options):
+        return Requestor(
+            api_base_url=Resource.api_base_url, retry_policy=RetryPolicy(**options)
+        )
+
+    def test_retry_server_error(self):
+        self.responses = [
+            (503, b'{"message": "Unavailable"}', {}),
+            (200, self.load_fixture("message/count"), {}),
+        ]
+        requestor = self.requestor()
+        with HTTMock(self.scripted), mock.patch("time.sleep") as sleep:
+            self.assertEqual({"count": 2}, requestor.get("/messages/count.json"))
+        self.assertEqual(2, len(self.requests))
+        self.assertEqual(1, sleep.call_count)
+        attempts = requestor.last_attempts
+        self.assertEqual([503, 200], [a.http_status for a in attempts])
+        self.assertIsInstance(attempts[0].error, ServerError)
+        self.assertIsNotNone(attempts[0].delay)
+        self.assertIsNone(attempts[1].delay)
+
+    def test_give_up_after_max_attempts(self):
+        self.responses = [(500, b'{"message": "Oops"}', {})] * 2
+        requestor = self.requestor(max_attempts=2)
+        with HTTMock(self.scripted), mock.patch("time.sleep"):
+            with self.assertRaises(ServerError):
+                requestor.get("/messages/count.json")
+        self.assertEqual(2, len(requestor.last_attempts))
+
+    def test_client_errors_are_not_retried(self):
+        self.responses = [(400, b'{"message": "Bad"}', {})]
+        with HTTMock(self.scripted):
+            with self.assertRaises(BadRequest):
+                self.requestor().get("/messages/count.json")
+        self.assertEqual(1, len(self.requests))
+
+    def test_honor_retry_after(self):
+        self.responses = [
+            (429, b'{"message": "Slow down"}', {"Retry-After": "7"}),
+            (200, self.load_fixture("message/count"), {}),
+        ]
+        with HTTMock(self.scripted), mock.patch("time.sleep") as sleep:
+            self.requestor().get("/messages/count.json")
+        sleep.assert_called_once_with(7.0)
+
+    def test_retry_connection_error(self):
+        self.responses = [
+            (requests.exceptions.ConnectionError("reset"), None, None),
+            (200, self.load_fixture("message/count"), {}),
+        ]
+        requestor = self.requestor()
+        with HTTMock(self.scripted), mock.patch("time.sleep"):
+            requestor.get("/messages/count.json")
+        self.assertIsInstance(requestor.last_attempts[0].error, ConnectionError)
+        self.assertIsNone(requestor.last_attempts[0].http_status)
+
+    def test_post_retries_reuse_idempotency_key(self):
+        self.responses = [
+            (502, b'{"message": "Bad gateway"}', {}),
+            (200, self.load_fixture("message/message"), {}),
+        ]
+        Resource.retry_policy = RetryPolicy()
+        try:
+            with HTTMock(self.scripted), mock.patch("time.sleep"):
+                message = Message({"body": "This is message"})
+                message.save()
+        finally:
+            Resource.retry_policy = None
+        self.assertEqual(6242736, message.id)
+        keys = [r.headers[IDEMPOTENCY_KEY_HEADER] for r in self.requests]
+        self.assertEqual(2, len(keys))
+        self.assertEqual(keys[0], keys[1])
+
+    def test_post_without_idempotency_keys_is_not_retried(self):
+        self.responses = [(502, b'{"message": "Bad gateway"}', {})]
+        with HTTMock(self.scripted):
+            with self.assertRaises(ServerError):
+                self.requestor(idempotency_keys=False).post("/messages.json")
+        self.assertEqual(1, len(self.requests))
+        self.assertNotIn(IDEMPOTENCY_KEY_HEADER, self.requests[0].headers)
+
+    def test_full_jitter_backoff(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=4)
+        for attempt, ceiling in [(1, 1), (2, 2), (3, 4), (6, 4)]:
+            for _ in range(20):
+                self.assertTrue(0 <= policy.backoff(attempt) <= ceiling)
+
+    def test_async_attempts_are_kept_per_task(self):
+        self.assertEqual([[503, 200], [200]], self.concurrent_attempts())
+
+    def test_async_attempts_without_contextvars(self):
+        with mock.patch.object(async_requestor_module, "contextvars", None):
+            self.assertEqual([[503, 200], [200]], self.concurrent_attempts())
+
+    def concurrent_attempts(self):
+        class FlakyTransport(AsyncTransport):
+            failed = False
+
+            async def send(self, requestor, method, abs_url, headers, data, **kwargs):
+                await asyncio.sleep(0)
+                if abs_url.endswith("/flaky.json") and not self.failed:
+                    self.failed = True
+                    return b'{"message": "Unavailable"}', 503, abs_url, {}
+                return b'{"count": 2}', 200, abs_url, {}
+
+        requestor = AsyncRequestor(
+            api_base_url=Resource.api_base_url,
+            retry_policy=RetryPolicy(backoff_base=0),
+            transport=FlakyTransport(),
+        )
+
+        async def attempts(url):
+            await requestor.get(url)
+            await asyncio.sleep(0)
+            return [a.http_status for a in requestor.last_attempts]
+
+        async def both():
+            return await asyncio.gather(attempts("/flaky.json"), attempts("/steady.json"))
+
+        return self.run_async(both())
@@ -0,0 +1,97 @@
+import unittest
+
+from vivialconnect import Requestor
+from vivialconnect.common.signer import HmacSigner
+
+SECRET = "__my_test_secret__"
+BASE_URL = "https://tests.vivialconnect.net/api/v1.0/accounts/1234567890"
+DATE = "Tue, 08 Dec 2020 20:13:30 GMT"
+TIMESTAMP = "20201208T201330Z"
+
+# Signatures produced by the original Requestor.sign implementation.
+GOLDEN_VECTORS = [
+    (
+        (
+            "get",
+            TIMESTAMP,
+            BASE_URL + "/messages.json",
+            {"Date": DATE, "Host": "tests.vivialconnect.net", "Accept": "application/json"},
+            None,
+        ),
+        "8470f4bdead724531889b5723b9dc73681fcfd9f5e8cdefadcbfeb03a4c16357",
+        ["date", "host"],
+    ),
+    (
+        (
+            "post",
+            TIMESTAMP,
+            BASE_URL + "/messages.json",
+            {
+                "Content-Type": "application/json",
+                "Date": DATE,
+                "Host": "tests.vivialconnect.net",
+                "Accept": "application/json",
+            },
+            '{"message":{"body":"Howdy","to_number":"+11234567890"}}',
+        ),
+        "977783a4253fe0659fd14a70cfe14a818f0c1a1b9c974ab35f41422a6ebac54a",
+        ["content-type", "date", "host"],
+    ),
+    (
+        (
+            "get",
+            TIMESTAMP,
+            "https://tests.vivialconnect.net:8443/api/v1.0/accounts/1234567890"
+            "/numbers/available/US/local.json?area_code=913&limit=5&name=a b/c&x=",
+            {"Date": DATE, "Host": "tests.vivialconnect.net:8443"},
+            None,
+        ),
+        "74b0f6dd709f6c7889f5d75295a7f4a334039547ae092479f43b397d955e9e4d",
+        ["date", "host"],
+    ),
+    (
+        (
+            "put",
+            TIMESTAMP,
+            BASE_URL + "/connectors/42 x.json",
+            {
+                "content-type": "application/json",
+                "DATE": DATE,
+                "Host": "tests.vivialconnect.net",
+            },
+            '{"connector":{"name":"\\u00e9"}}',
+        ),
+        "629d5a8f502a91fd6eeb6b221dd71aa0e4d5b1937da2b1f1ba0f5a35e079772a",
+        ["content-type", "date", "host"],
+    ),
+]
+
+
+class SignerTest(unittest.TestCase):
+    def test_golden_vectors(self):
+        requestor = Requestor(api_secret=SECRET)
+        for args, digest, signed_headers in GOLDEN_VECTORS:
+            self.assertEqual((digest, signed_headers), requestor.sign(*args))
+
+    def test_signer_is_reused(self):
+        requestor = Requestor(api_secret=SECRET)
+        for args, digest, _ in GOLDEN_VECTORS:
+            requestor.sign(*args)
+            self.assertEqual(digest, requestor.sign(*args)[0])
+        signer = requestor.signer
+        self.assertIs(signer, requestor.signer)
+
+    def test_secret_change_rekeys_signer(self):
+        requestor = Requestor(api_secret="another secret")
+        signer = requestor.signer
+        requestor.api_secret = SECRET
+        self.assertIsNot(signer, requestor.signer)
+        args, digest, _ = GOLDEN_VECTORS[0]
+        self.assertEqual(digest, requestor.sign(*args)[0])
+
+    def test_body_as_bytes(self):
+        signer = HmacSigner(SECRET)
+        args = GOLDEN_VECTORS[1][0]
+        path = "/api/v1.0/accounts/1234567890/messages.json"
+        digest, _ = signer.sign(args[0], args[1], path, "", args[3], args[4].encode())
+        self.assertEqual(GOLDEN_VECTORS[1][1], digest)
@@ -0,0 +1,99 @@
+import time
+import asyncio
+import threading
+
+from tests.common import BaseTestCase
+from tests.common import HTTMock
+from vivialconnect import AsyncRequestor, Requestor, Resource
+from vivialconnect.common.async_requestor import AsyncTransport
+from vivialconnect.common.error import ServerError
+from vivialconnect.common.singleflight import SingleFlight
+
+
+class SingleFlightTest(BaseTestCase):
+    def setUp(self):
+        super(SingleFlightTest, self).setUp()
+        self.requests = []
+        self.flight = SingleFlight()
+
+    def wait_for_followers(self, followers):
+        deadline = time.time() + 5
+        while self.flight.coalesced < followers and time.time() < deadline:
+            time.sleep(0.001)
+
+    def test_concurrent_gets_share_one_request(self):
+        def slow(url, request, **kwargs):
+            self.requests.append(url.path)
+            self.wait_for_followers(4)
+            return self.fake(url, request, body=self.load_fixture("message/count"))
+
+        requestor = Requestor(api_base_url=Resource.api_base_url, single_flight=self.flight)
+        results = []
+
+        def worker():
+            results.append(requestor.get("/accounts/1/messages/count.json"))
+
+        with HTTMock(slow):
+            threads = [threading.Thread(target=worker) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual([{"count": 2}] * 5, results)
+        self.assertEqual(5, len(set(id(result) for result in results)))
+        self.assertEqual((1, 4, 0), (self.flight.calls, self.flight.coalesced, self.flight.in_flight))
+
+    def test_errors_are_shared(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def call():
+            started.set()
+            release.wait(5)
+            raise ServerError("Unavailable", 503, None)
+
+        errors = []
+
+        def worker():
+            try:
+                self.flight.do("key", call)
+            except ServerError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=worker)
+        follower.start()
+        self.wait_for_followers(1)
+        release.set()
+        leader.join()
+        follower.join()
+        self.assertEqual(2, len(errors))
+        self.assertIs(errors[0], errors[1])
+
+    def test_async_gets_share_one_request(self):
+        flight = self.flight
+
+        class SlowTransport(AsyncTransport):
+            sent = 0
+
+            async def send(self, requestor, method, abs_url, headers, data, **kwargs):
+                self.sent += 1
+                while flight.coalesced < 4:
+                    await asyncio.sleep(0)
+                return '{"count": 3}', 200, abs_url, {}
+
+        transport = SlowTransport()
+        requestor = AsyncRequestor(transport=transport, single_flight=flight)
+
+        async def main():
+            return await asyncio.gather(
+                *[requestor.get("/count.json") for _ in range(5)]
+            )
+
+        results = self.run_async(main())
+        self.assertEqual(1, transport.sent)
+        self.assertEqual([{"count": 3}] * 5, results)
+        self.assertEqual(0, flight.in_flight)
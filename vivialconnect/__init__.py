@@ -14,10 +14,13 @@ except ImportError:
 
 from vivialconnect.resources.resource import Resource
 from vivialconnect.common.requestor import Requestor
+from vivialconnect.common.async_requestor import AsyncRequestor
 
 from vivialconnect.resources.user import User
 from vivialconnect.resources.account import Account
 from vivialconnect.resources.message import Message, Attachment
+from vivialconnect.resources.bulk import BulkSender, BulkWatcher
+from vivialconnect.resources.costs import TransactionAggregator
 from vivialconnect.resources.number import Number
 from vivialconnect.resources.connector import (
     Connector,
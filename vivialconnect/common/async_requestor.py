@@ -0,0 +1,311 @@
+"""
+.. module:: async_requestor
+   :synopsis: Asyncio flavour of the Requestor module.
+
+"""
+
+import time
+import asyncio
+import weakref
+import functools
+
+from vivialconnect.common.cache import conditional_headers
+from vivialconnect.common.error import RequestorError, ConnectionError
+from vivialconnect.common.requestor import Requestor
+from vivialconnect.common.retry import Attempt
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import contextvars
+except ImportError:
+    # Python 3.6, where attempts are kept per task in a WeakKeyDictionary.
+    contextvars = None
+
+
+def _current_task():
+    if hasattr(asyncio, "current_task"):
+        return asyncio.current_task()
+    return asyncio.Task.current_task()
+
+
+class AsyncTransport(object):
+    """Interface of the transports used by :class:`AsyncRequestor`.
+
+    A transport receives a fully signed request and returns the same
+    ``(http_body, http_status, response_url, response_headers)`` tuple as
+    :meth:`Requestor.requests_request`, ``http_body`` being the raw
+    response ``bytes``.
+    """
+
+    async def send(self, requestor, method, abs_url, headers, data, **kwargs):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class ThreadPoolTransport(AsyncTransport):
+    """Runs the blocking requests based transport of the requestor in an
+    executor. This transport has no extra dependencies.
+
+    :param executor: A :class:`concurrent.futures.Executor`, or ``None`` to
+        use the default executor of the running loop.
+    """
+
+    def __init__(self, executor=None):
+        self.executor = executor
+
+    async def send(self, requestor, method, abs_url, headers, data, **kwargs):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            functools.partial(
+                requestor.requests_request, method, abs_url, headers, data, **kwargs
+            ),
+        )
+
+
+class AiohttpTransport(AsyncTransport):
+    """Native asyncio transport built on top of aiohttp.
+
+    An aiohttp session is bound to the event loop it was created in, so a
+    new one is opened whenever the transport is used from another loop,
+    e.g. by a second :func:`asyncio.run`.
+
+    :param limit: Maximum number of simultaneous connections.
+    """
+
+    def __init__(self, limit=100):
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp library is required. "
+                + 'Install aiohttp via "pip install aiohttp".'
+            )
+        self.limit = limit
+        self._session = None
+        self._loop = None
+
+    def _get_session(self):
+        loop = asyncio.get_event_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # A session of another loop cannot be used, nor closed, from this one.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit)
+            )
+            self._loop = loop
+        return self._session
+
+    async def send(self, requestor, method, abs_url, headers, data, **kwargs):
+        try:
+            async with self._get_session().request(
+                method,
+                abs_url,
+                headers=headers,
+                data=data,
+                timeout=aiohttp.ClientTimeout(total=requestor.request_timeout),
+                ssl=None if requestor.verify_request else False,
+                **kwargs
+            ) as result:
+                http_body = await result.read()
+                http_status = result.status
+                response_url = str(result.url)
+                response_headers = result.headers
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            raise ConnectionError(
+                "Could not connect to VivialConnect. If this "
+                "problem persists please let us know at contact@vivialconnect.net."
+            )
+        except Exception:
+            raise RequestorError(
+                "Unexpected error communicating with VivialConnect. If this "
+                "problem persists please let us know at contact@vivialconnect.net."
+            )
+        return http_body, http_status, response_url, response_headers
+
+    async def close(self):
+        session, self._session = self._session, None
+        loop, self._loop = self._loop, None
+        if session is not None and loop is asyncio.get_event_loop():
+            await session.close()
+
+
+def default_transport():
+    """Returns an :class:`AiohttpTransport` when aiohttp is installed,
+    otherwise a :class:`ThreadPoolTransport`."""
+    if aiohttp is not None:
+        return AiohttpTransport()
+    return ThreadPoolTransport()
+
+
+class AsyncRequestor(Requestor):
+    """A :class:`Requestor` whose request methods are coroutines.
+
+    Requests are signed and their responses interpreted exactly as in
+    :class:`Requestor`; only the network round trip goes through the
+    pluggable ``transport``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        transport = kwargs.pop("transport", None)
+        super(AsyncRequestor, self).__init__(*args, **kwargs)
+        self.transport = transport if transport else default_transport()
+        # Coroutines of a loop share its thread, so attempts are kept per
+        # task rather than per thread.
+        if contextvars is not None:
+            self._attempts = contextvars.ContextVar("attempts", default=None)
+        else:
+            self._attempts = None
+            self._task_attempts = weakref.WeakKeyDictionary()
+
+    @property
+    def last_attempts(self):
+        """The :class:`Attempt` list of the last request made by the calling
+        task with a retry policy."""
+        if self._attempts is not None:
+            return self._attempts.get() or []
+        task = _current_task()
+        if task is None:
+            return []
+        return self._task_attempts.get(task, [])
+
+    def _set_attempts(self, attempts):
+        if self._attempts is not None:
+            self._attempts.set(attempts)
+        else:
+            self._task_attempts[_current_task()] = attempts
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Closes the transport and the pooled session."""
+        await self.transport.close()
+        self.close()
+
+    async def request(self, method, url, params=None, payload=None, **kwargs):
+        if params is None:
+            params = {}
+        cache = self.cache
+        if method.lower() == "get":
+            if (
+                cache is not None
+                or self.validators is not None
+                or self.single_flight is not None
+            ):
+                return (await self._get(url, params, **kwargs))[0]
+        if cache is None:
+            return (await self._request(method, url, params, payload, **kwargs))[1]
+        try:
+            return (await self._request(method, url, params, payload, **kwargs))[1]
+        finally:
+            cache.invalidate(self.request_path(url))
+
+    async def get_if_modified(self, url, params=None, validators=None, **kwargs):
+        """Coroutine version of :meth:`Requestor.get_if_modified`."""
+        return await self._get(
+            url,
+            params or {},
+            validators=validators,
+            conditional=validators is not None,
+            **kwargs
+        )
+
+    async def _get(self, url, params, validators=None, conditional=False, **kwargs):
+        key, cached, entry, validators = self._get_begin(
+            url, params, validators, conditional
+        )
+        if cached is not None:
+            return cached
+
+        def fetch():
+            return self._request(
+                "get", url, params, None, conditional_headers(validators), **kwargs
+            )
+
+        shared = False
+        if self.single_flight is None:
+            raw, response = await fetch()
+        else:
+            (raw, response), shared = await self.single_flight.ado(
+                self._flight_key(key, validators), fetch
+            )
+        return self._get_end(
+            key, url, raw, response, entry, validators, conditional, shared
+        )
+
+    async def _request(self, method, url, params, payload, headers=None, **kwargs):
+        policy = self.retry_policy
+        if policy is None:
+            raw = await self.request_raw(
+                method, url, params, payload, headers, **kwargs
+            )
+            return raw, self.interpret_response(*raw)
+
+        headers = dict(policy.request_headers(method), **(headers or {}))
+        attempts = []
+        self._set_attempts(attempts)
+        number = 0
+        while True:
+            number += 1
+            started = time.time()
+            http_status = None
+            try:
+                raw = await self.request_raw(
+                    method, url, params, payload, headers=headers, **kwargs
+                )
+                http_status = raw[1]
+                response = self.interpret_response(*raw)
+            except RequestorError as e:
+                delay = policy.retry_delay(method, number, e)
+                policy.record(
+                    attempts,
+                    Attempt(number, time.time() - started, e.http_status, e, delay),
+                )
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            policy.record(attempts, Attempt(number, time.time() - started, http_status))
+            return raw, response
+
+    async def get(self, url, params=None, **kwargs):
+        return await self.request("get", url, params, **kwargs)
+
+    async def put(self, url, params=None, payload=None, **kwargs):
+        return await self.request("put", url, params, payload, **kwargs)
+
+    async def post(self, url, params=None, payload=None, **kwargs):
+        return await self.request("post", url, params, payload, **kwargs)
+
+    async def delete(self, url, params=None, payload=None, **kwargs):
+        return await self.request("delete", url, params, payload, **kwargs)
+
+    async def head(self, url, params=None, **kwargs):
+        return await self.request("head", url, params, **kwargs)
+
+    async def request_raw(
+        self, method, url, params=None, payload=None, headers=None, **kwargs
+    ):
+        path = self.request_path(url)
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve(self.api_account_id, path)
+            if wait > 0:
+                await asyncio.sleep(wait)
+        method, abs_url, headers, data = self.prepare_request(
+            method, url, params, payload, headers
+        )
+        http_body, http_status, response_url, response_headers = await self.transport.send(
+            self, method, abs_url, headers, data, **kwargs
+        )
+        if self.rate_limiter is not None:
+            self.rate_limiter.feedback(
+                self.api_account_id, path, http_status, response_headers
+            )
+        return http_body, http_status, response_url, response_headers
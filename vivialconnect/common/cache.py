@@ -0,0 +1,232 @@
+"""
+.. module:: cache
+   :synopsis: Response caching and conditional GET requests.
+
+"""
+
+import re
+import time
+import threading
+
+from collections import OrderedDict
+
+_RESOURCE_PREFIX_RE = re.compile(r"^(/accounts/[^/.?]+(?:/[^/.?]+)?)")
+
+
+def resource_prefix(url):
+    """Returns the path prefix shared by every URL of the resource addressed
+    by ``url``, e.g. ``/accounts/1/numbers`` for
+    ``/accounts/1/numbers/42/tags.json``.
+
+    :param url: A request path relative to the API base URL.
+    :returns: ``str`` -- the resource prefix, or ``url`` without query and
+        extension when it is not an account URL.
+    """
+    url = url.split("?", 1)[0]
+    match = _RESOURCE_PREFIX_RE.match(url)
+    if match:
+        return match.group(1)
+    if url.endswith(".json"):
+        url = url[:-5]
+    return url
+
+
+class ResponseCache(object):
+    """A thread safe, size bounded LRU cache of successful GET responses.
+
+    Entries expire after a TTL chosen per endpoint: the longest key of
+    ``ttls`` found in the request path wins, otherwise ``ttl`` applies. A
+    TTL of 0 disables caching for the endpoint. Responses are stored as
+    received and decoded again on each hit, so callers never share
+    mutable objects.
+
+    Writes (PUT, POST and DELETE) made through a requestor using the cache
+    drop the cached entries of the resource they modify. Other changes can
+    be accounted for with :meth:`invalidate`::
+
+        cache = ResponseCache(ttl=30, ttls={"/available/": 300, "/lookup": 3600})
+        Resource.response_cache = cache
+
+    :param ttl: Default time to live of an entry, in seconds.
+    :param maxsize: Maximum number of cached responses.
+    :param ttls: Optional ``dict`` of path fragment to time to live.
+    """
+
+    def __init__(self, ttl=30, maxsize=1024, ttls=None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.ttls = sorted(
+            (ttls or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, url):
+        """Returns the time to live of the responses of ``url``."""
+        for fragment, ttl in self.ttls:
+            if fragment in url:
+                return ttl
+        return self.ttl
+
+    def get(self, key):
+        """Returns the response cached under ``key``, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, prefix, response = entry
+                if expires > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, url, response):
+        """Caches ``response`` under ``key`` for the TTL of ``url``.
+
+        :param key: Cache key of the request.
+        :param url: Request path relative to the API base URL.
+        :param response: The ``(http_body, http_status, response_url,
+            response_headers)`` tuple of the response.
+        """
+        ttl = self.ttl_for(url)
+        if not ttl or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, resource_prefix(url), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url=None):
+        """Drops the cached responses of the resource addressed by ``url``,
+        or every cached response if ``url`` is ``None``.
+
+        :param url: Any request path of the resource, e.g.
+            ``/accounts/1/numbers/42.json``.
+        """
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                return
+            prefix = resource_prefix(url)
+            stale = [
+                key
+                for key, (_, entry_prefix, _) in self._entries.items()
+                if entry_prefix == prefix
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        """Drops every cached response."""
+        self.invalidate()
+
+
+class _NotModified(object):
+    def __repr__(self):
+        return "NOT_MODIFIED"
+
+
+# Returned instead of a response when a conditional request was answered
+# with 304 Not Modified.
+NOT_MODIFIED = _NotModified()
+
+
+def validators_of(headers):
+    """Returns the ``ETag`` and ``Last-Modified`` validators found in
+    response headers as a ``dict``, or ``None`` if there are none."""
+    if not headers:
+        return None
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if etag is None and last_modified is None:
+        return None
+    return {"etag": etag, "last_modified": last_modified}
+
+
+def conditional_headers(validators):
+    """Returns the request headers making a GET conditional on
+    ``validators``, as returned by :func:`validators_of`."""
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+class ValidatorStore(object):
+    """Remembers the validators and body of the last response of each GET
+    URL so that the next request for it is conditional.
+
+    When the API answers ``304 Not Modified`` the remembered body is used
+    instead of downloading it again, and :meth:`Resource.reload` leaves the
+    object untouched without decoding anything. Hit rates and saved bytes
+    are counted in :attr:`requests`, :attr:`not_modified` and
+    :attr:`bytes_saved`::
+
+        store = ValidatorStore()
+        Resource.validators = store
+        ...
+        print(store.hit_rate, store.bytes_saved)
+
+    :param maxsize: Maximum number of URLs remembered.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.requests = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        """Fraction of the conditional requests answered with 304."""
+        if not self.requests:
+            return 0.0
+        return float(self.not_modified) / self.requests
+
+    def get(self, key):
+        """Returns the ``(validators, raw_response)`` remembered for
+        ``key``, or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key, response):
+        """Remembers a successful ``(http_body, http_status, response_url,
+        response_headers)`` response if it carries validators."""
+        validators = validators_of(response[3])
+        with self._lock:
+            if validators is None:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (validators, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def record(self, not_modified, entry=None):
+        """Counts a conditional request and whether it was answered with
+        304, crediting the size of the remembered body of ``entry``."""
+        with self._lock:
+            self.requests += 1
+            if not_modified:
+                self.not_modified += 1
+                if entry is not None and entry[1][0]:
+                    self.bytes_saved += len(entry[1][0])
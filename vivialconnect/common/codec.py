@@ -0,0 +1,133 @@
+"""
+.. module:: codec
+   :synopsis: Pluggable JSON encoding and decoding.
+
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonCodec(object):
+    """Interface of the JSON codecs used to encode request bodies and decode
+    response bodies.
+
+    ``dumps`` returns the UTF-8 encoded document as ``bytes``, and ``loads``
+    accepts either ``bytes`` or ``str``.
+    """
+
+    name = None
+
+    def dumps(self, obj):
+        raise NotImplementedError
+
+    def loads(self, data):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return "%s()" % self.__class__.__name__
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Codec built on the standard library :mod:`json` module."""
+
+    name = "json"
+
+    def dumps(self, obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec built on orjson, usually the fastest one."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError(
+                "orjson library is required. " + 'Install orjson via "pip install orjson".'
+            )
+
+    def dumps(self, obj):
+        return orjson.dumps(obj)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """Codec built on ujson."""
+
+    name = "ujson"
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError(
+                "ujson library is required. " + 'Install ujson via "pip install ujson".'
+            )
+
+    def dumps(self, obj):
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+CODECS = {
+    StdlibJsonCodec.name: StdlibJsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+}
+
+_default_codec = StdlibJsonCodec()
+
+
+def available_codecs():
+    """Returns the names of the codecs whose library is installed."""
+    names = [StdlibJsonCodec.name]
+    if orjson is not None:
+        names.append(OrjsonCodec.name)
+    if ujson is not None:
+        names.append(UjsonCodec.name)
+    return names
+
+
+def get_codec(codec=None):
+    """Returns a codec instance.
+
+    :param codec: A :class:`JsonCodec` instance, the name of a codec
+        ("json", "orjson" or "ujson") or ``None`` for the default codec.
+    :raises: ``ImportError`` if the library of the codec is not installed.
+    """
+    if codec is None:
+        return _default_codec
+    if isinstance(codec, JsonCodec):
+        return codec
+    try:
+        return CODECS[codec]()
+    except KeyError:
+        raise ValueError("Unknown JSON codec: %s" % codec)
+
+
+def set_codec(codec):
+    """Sets the default codec of every requestor without an explicit one::
+
+        from vivialconnect.common import codec
+        codec.set_codec("orjson")
+
+    :param codec: A :class:`JsonCodec` instance or a codec name.
+    """
+    global _default_codec
+    _default_codec = get_codec(codec)
@@ -11,15 +11,16 @@ class RequestorError(Exception):
     """Base Requestor Error
     """
 
-    def __init__(self, message=None, http_status=None, http_body=None):
+    def __init__(self, message=None, http_status=None, http_body=None, http_headers=None):
         self.http_status = http_status
         self.http_body = http_body
+        self.http_headers = http_headers
         try:
             self.json_body = json.loads(http_body)
         except:
             self.json_body = None
 
-        if "error_code" in self.json_body:
+        if self.json_body and "error_code" in self.json_body:
             super(RequestorError, self).__init__(
                 "{}: {}".format(self.json_body.get("error_code"), message)
             )
@@ -64,7 +65,7 @@ class Redirection(ConnectionError):
     def __init__(
         self, message=None, http_status=None, http_body=None, url=None, headers=None
     ):
-        super(Redirection, self).__init__(message, http_status, http_body)
+        super(Redirection, self).__init__(message, http_status, http_body, headers)
         self.url = url
         self.headers = headers
 
@@ -1,7 +1,6 @@
 import abc
 import collections
 
-from weakref import WeakKeyDictionary
 from vivialconnect.resources.resource import BaseField, SubordinateResource
 from six import with_metaclass
 
@@ -9,11 +8,19 @@ from six import with_metaclass
 class SimpleResourceList(collections.MutableSequence):
     """A simple list wrapper that only takes SubordinateResource or dict instances."""
 
-    def __init__(self, owner, member_type, raw_items):
+    def __init__(self, owner, member_type, raw_items, name=None):
         self.member_type = member_type
         self.owner = owner
         self._items = list()
+        # Only set once filled, so that loading items does not flag the owner.
+        self.name = None
         self.extend(list(raw_items))
+        self.name = name
+
+    def _changed(self):
+        attributes = self.owner.__dict__.get("attributes")
+        if attributes is not None and self.name:
+            attributes.mark_dirty(self.name)
 
     def check(self, value):
         if isinstance(value, self.member_type):
@@ -38,6 +45,7 @@ class SimpleResourceList(collections.MutableSequence):
             value = self.member_type(attributes=value)
         value.parent_resource = self.owner
         self._items.insert(index, value)
+        self._changed()
 
     def __len__(self):
         return len(self._items)
@@ -47,32 +55,41 @@ class SimpleResourceList(collections.MutableSequence):
 
     def __delitem__(self, i):
         del self._items[i]
+        self._changed()
 
     def __setitem__(self, i, v):
         self.check(v)
         self._items[i] = v
+        self._changed()
 
     def __repr__(self):
         return str(self._items)
 
 
 class Field(with_metaclass(abc.ABCMeta, BaseField)):
-    """Abstract field type defining a common interface."""
+    """Abstract field type defining a common interface.
+
+    Values are stored in the instance ``__dict__`` under the field name. As
+    the field defines no ``__set__``, reading a value once initialized is a
+    plain attribute lookup; :meth:`Resource.__setattr__` calls
+    :meth:`assign` to set it.
+    """
 
     def __init__(self, name):
         self.name = name
-        self.owner_map = WeakKeyDictionary()
 
     def __get__(self, obj, obj_type):
         if obj is None:
             # Return the descriptor if no instance is given, as in getattr(type(obj), desc_name)
             return self
-        if obj not in self.owner_map:
-            self.owner_map[obj] = self.initialized_value(obj)
-        return self.owner_map[obj]
+        value = obj.__dict__[self.name] = self.initialized_value(obj)
+        return value
 
-    def __set__(self, obj, value):
-        self.owner_map[obj] = value
+    def assign(self, obj, value):
+        obj.__dict__[self.name] = value
+        attributes = obj.__dict__.get("attributes")
+        if attributes is not None:
+            attributes.mark_dirty(self.name)
 
     @abc.abstractmethod
     def initialized_value(self, obj, value=None):
@@ -88,14 +105,14 @@ class ResourceField(Field):
         self.member_type = member_type
         super(ResourceField, self).__init__(name)
 
-    def __set__(self, obj, value):
+    def assign(self, obj, value):
         if issubclass(self.member_type, SubordinateResource):
             if value.parent_resource and value.parent_resource != obj:
                 raise TypeError(
                     "Cannot set subordinate resource to a value from another parent"
                 )
             value.parent_resource = obj
-        Field.__set__(self, obj, value)
+        Field.assign(self, obj, value)
 
     def initialized_value(self, obj, value=None):
         return None
@@ -108,7 +125,7 @@ class ResourceListingField(ResourceField):
         self.iterable_type = iterable_type
         super(ResourceListingField, self).__init__(name, member_type)
 
-    def __set__(self, obj, value):
+    def assign(self, obj, value):
         if not isinstance(value, self.iterable_type):
             value = self.initialized_value(obj, value)
         elif issubclass(self.member_type, SubordinateResource):
@@ -118,7 +135,7 @@ class ResourceListingField(ResourceField):
                         "Cannot set listing of subordinate resources containing items from different parents."
                     )
                 item.parent_resource = obj
-        Field.__set__(self, obj, value)
+        Field.assign(self, obj, value)
 
     def initialized_value(self, obj, value=None):
-        return self.iterable_type(obj, self.member_type, value or [])
+        return self.iterable_type(obj, self.member_type, value or [], name=self.name)
@@ -0,0 +1,165 @@
+"""
+.. module:: jsonstream
+   :synopsis: Incremental decoding of large JSON listings.
+
+"""
+
+import json
+import codecs
+
+import six
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+
+
+class JsonArrayStream(object):
+    """Yields the elements of a JSON listing as its body arrives.
+
+    The body is read chunk by chunk and only the part of the document not
+    yet decoded is buffered, so memory stays bounded by the chunk size and
+    the largest element, whatever the size of the listing. The streamed
+    array is either a top level array or the value of a member of a top
+    level object such as ``{"messages": [...], "count": 1000}``. The other
+    members of that object are collected in :attr:`meta`, which is
+    complete once iteration is over.
+
+    :param chunks: An iterable of ``bytes`` (or ``str``) chunks of the
+        document. Its ``close`` method, if any, is called once the stream
+        is exhausted or closed.
+    :param root: Name of the member holding the array to stream. Defaults
+        to the first member whose value is an array.
+    """
+
+    def __init__(self, chunks, root=None):
+        self.root = root
+        self.meta = {}
+        self._source = chunks
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._items = self._parse()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._items)
+
+    next = __next__
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Stops decoding and releases the underlying response."""
+        self._items.close()
+        self._release()
+
+    def _release(self):
+        source, self._source = self._source, None
+        if source is not None and hasattr(source, "close"):
+            source.close()
+
+    def _read(self):
+        if self._eof:
+            return False
+        # Drop the decoded part of the buffer before growing it.
+        if self._pos:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        for chunk in self._chunks:
+            if isinstance(chunk, six.binary_type):
+                chunk = self._decoder.decode(chunk)
+            if chunk:
+                self._buffer += chunk
+                return True
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def _peek(self):
+        """Skips whitespace and returns the next character, or ``None`` at
+        the end of the document."""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._read():
+                return None
+
+    def _expect(self, chars):
+        char = self._peek()
+        if char is None or char not in chars:
+            raise ValueError(
+                "Invalid JSON document: expected one of %r at %r" % (chars, char)
+            )
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """Decodes the next complete JSON value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if not self._read():
+                    raise
+                continue
+            # A number cut by the end of a chunk (e.g. "12." of "12.5")
+            # decodes fine, so only accept values followed by a delimiter.
+            if self._eof or (
+                end < len(self._buffer) and self._buffer[end] in _DELIMITERS
+            ):
+                self._pos = end
+                return value
+            self._read()
+
+    def _array(self):
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            if self._expect(",]") == "]":
+                return
+
+    def _parse(self):
+        try:
+            if self._peek() == "[":
+                for item in self._array():
+                    yield item
+                return
+            self._expect("{")
+            streamed = False
+            if self._peek() == "}":
+                return
+            while True:
+                key = self._value()
+                self._expect(":")
+                if (
+                    not streamed
+                    and self._peek() == "["
+                    and (self.root is None or self.root == key)
+                ):
+                    streamed = True
+                    for item in self._array():
+                        yield item
+                else:
+                    self.meta[key] = self._value()
+                if self._expect(",}") == "}":
+                    return
+        finally:
+            self._release()
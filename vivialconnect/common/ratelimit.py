@@ -0,0 +1,162 @@
+"""
+.. module:: ratelimit
+   :synopsis: Client side adaptive rate limiting.
+
+"""
+
+import re
+import time
+import threading
+import email.utils
+
+# Endpoint classes with their own request budget. Requests to any other
+# endpoint share the "default" budget.
+ENDPOINT_CLASSES = ("messages", "numbers", "logs")
+
+_ENDPOINT_CLASS_RE = re.compile(r"/(%s)(?:[/.?]|$)" % "|".join(ENDPOINT_CLASSES))
+
+
+def endpoint_class(path):
+    """Returns the endpoint class ("messages", "numbers", "logs" or
+    "default") of a request path."""
+    match = _ENDPOINT_CLASS_RE.search(path or "")
+    return match.group(1) if match else "default"
+
+
+def parse_retry_after(value):
+    """Parses a ``Retry-After`` header value into a number of seconds.
+
+    :param value: Either a number of seconds or an HTTP date.
+    :returns: ``float`` -- seconds to wait, or ``None`` if unparseable.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.mktime_tz(email.utils.parsedate_tz(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return max(0.0, retry_at - time.time())
+
+
+class TokenBucket(object):
+    """A thread safe token bucket whose refill rate adapts with AIMD.
+
+    The rate grows by ``increase`` tokens/second after each accepted request,
+    up to ``max_rate``, and is multiplied by ``decrease`` each time the API
+    answers with a 429, down to ``min_rate``. A ``Retry-After`` value blocks
+    the bucket until that time has passed.
+
+    :param rate: Initial and maximum number of requests per second.
+    :param capacity: Maximum burst size, defaults to ``rate``.
+    """
+
+    def __init__(self, rate, capacity=None, min_rate=0.5, increase=0.1, decrease=0.5):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.capacity = float(capacity if capacity else max(rate, 1))
+        self.increase = increase
+        self.decrease = decrease
+        self._tokens = self.capacity
+        self._updated = time.time()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self, tokens=1):
+        """Takes ``tokens`` from the bucket, going into debt if needed.
+
+        :returns: ``float`` -- the number of seconds the caller must wait
+            before sending its request.
+        """
+        with self._lock:
+            now = time.time()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = 0.0
+            if self._tokens < 0:
+                wait = -self._tokens / self.rate
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self, tokens=1):
+        """Blocks until ``tokens`` may be spent."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            self._refill(time.time())
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after=None):
+        with self._lock:
+            now = time.time()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+
+class RateLimiter(object):
+    """Keeps a :class:`TokenBucket` per account and endpoint class.
+
+    A single instance may be shared by any number of requestors and
+    threads so that they all draw from the same budget::
+
+        limiter = RateLimiter(rate=10, rates={"messages": 25})
+        Resource.rate_limiter = limiter
+
+    :param rate: Default requests per second of each bucket.
+    :param rates: Optional ``dict`` of endpoint class to requests per second.
+    :param \\**bucket_options: Extra keyword arguments for :class:`TokenBucket`.
+    """
+
+    def __init__(self, rate=10, rates=None, **bucket_options):
+        self.rate = rate
+        self.rates = dict(rates or {})
+        self.bucket_options = bucket_options
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, account_id, path):
+        key = (account_id, endpoint_class(path))
+        try:
+            return self._buckets[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = TokenBucket(
+                    self.rates.get(key[1], self.rate), **self.bucket_options
+                )
+            return self._buckets[key]
+
+    def reserve(self, account_id, path):
+        """Reserves a request slot and returns the seconds to wait."""
+        return self.bucket(account_id, path).reserve()
+
+    def acquire(self, account_id, path):
+        """Blocks until a request to ``path`` may be sent."""
+        self.bucket(account_id, path).acquire()
+
+    def feedback(self, account_id, path, http_status, response_headers=None):
+        """Adapts the bucket rate to the outcome of a request."""
+        bucket = self.bucket(account_id, path)
+        if http_status == 429:
+            retry_after = None
+            if response_headers:
+                retry_after = parse_retry_after(response_headers.get("Retry-After"))
+            bucket.on_throttle(retry_after)
+        elif 200 <= http_status < 300:
+            bucket.on_success()
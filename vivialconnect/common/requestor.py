@@ -4,19 +4,20 @@
 
 """
 
+import os
 import json
-import hmac
 import time
 import types
-import hashlib
 import platform
 import datetime
+import threading
 
 import six
-from six.moves.urllib.parse import urlencode, quote_plus, urlparse, parse_qsl, quote
+from six.moves.urllib.parse import urlencode, quote_plus, urlparse
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     raise ImportError(
         "requests library is required. "
@@ -26,6 +27,7 @@ except ImportError:
 from vivialconnect.version import VERSION
 from vivialconnect.common.error import (
     RequestorError,
+    ConnectionError,
     Redirection,
     RateLimit,
     BadRequest,
@@ -38,7 +40,15 @@ from vivialconnect.common.error import (
     ClientError,
     ServerError,
 )
-from vivialconnect.common.util import Util
+from vivialconnect.common.cache import (
+    NOT_MODIFIED,
+    conditional_headers,
+    validators_of,
+)
+from vivialconnect.common.codec import get_codec
+from vivialconnect.common.jsonstream import JsonArrayStream
+from vivialconnect.common.retry import Attempt
+from vivialconnect.common.signer import HmacSigner, API_HMAC_SIGNED_HEADERS
 
 
 API_BASE_URL = "https://api.vivialconnect.net/api/v1.0"
@@ -46,9 +56,62 @@ API_KEY = ""
 API_SECRET = ""
 API_ACCOUNT_ID = ""
 
-API_HMAC_SIGNED_HEADERS = ["content-type", "date", "host"]
 API_CONTENT_TYPE = "application/json"
 
+# Connection pool defaults. ``pool_connections`` is the number of per-host
+# pools to cache, ``pool_maxsize`` the number of keep-alive connections kept
+# per host and ``pool_idle_timeout`` the number of seconds a pooled session
+# may sit unused before it is recycled.
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
+POOL_IDLE_TIMEOUT = 60
+
+# Size of the chunks read from streamed responses.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+_static_headers = None
+_static_headers_pid = None
+
+
+def static_headers():
+    """Returns the headers that are identical for every request made by this
+    process.
+
+    They are computed once, as ``platform.platform()`` is slow, and computed
+    again in a forked child (detected by a change of process id).
+
+    :returns: ``dict`` -- the per-process request headers. Callers must copy
+        it before adding request specific headers.
+    """
+    global _static_headers, _static_headers_pid
+    pid = os.getpid()
+    if _static_headers is None or _static_headers_pid != pid:
+        ua = {
+            "client_version": VERSION,
+            "lang": "python",
+            "publisher": "vivialconnect",
+            "request_lib": "requests",
+        }
+
+        for attr, func in [
+            ["lang_version", platform.python_version],
+            ["platform", platform.platform],
+        ]:
+            try:
+                val = func()
+            except Exception as e:
+                val = "!! %s" % e
+            ua[attr] = val
+
+        _static_headers = {
+            "X-VivialConnect-User-Agent": json.dumps(ua),
+            "User-Agent": "VivialConnect PythonClient %s" % VERSION,
+            "Accept": API_CONTENT_TYPE,
+        }
+        _static_headers_pid = pid
+    return _static_headers
+
 
 class Requestor(object):
     def __init__(
@@ -59,6 +122,16 @@ class Requestor(object):
         api_account_id=None,
         request_timeout=None,
         verify_request=True,
+        pool_connections=None,
+        pool_maxsize=None,
+        pool_idle_timeout=None,
+        session=None,
+        rate_limiter=None,
+        retry_policy=None,
+        cache=None,
+        validators=None,
+        single_flight=None,
+        codec=None,
     ):
         self.api_key = api_key if api_key else API_KEY
         self.api_secret = api_secret if api_secret else API_SECRET
@@ -66,11 +139,161 @@ class Requestor(object):
         self.api_account_id = api_account_id if api_account_id else API_ACCOUNT_ID
         self.request_timeout = request_timeout if request_timeout else 30
         self.verify_request = verify_request if verify_request is not None else True
+        self.pool_connections = (
+            pool_connections if pool_connections else POOL_CONNECTIONS
+        )
+        self.pool_maxsize = pool_maxsize if pool_maxsize else POOL_MAXSIZE
+        self.pool_idle_timeout = (
+            pool_idle_timeout if pool_idle_timeout is not None else POOL_IDLE_TIMEOUT
+        )
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.validators = validators
+        self.single_flight = single_flight
+        self.codec = get_codec(codec) if codec is not None else None
+        self._local = threading.local()
+        self._signer = None
+        self._base_url = None
+        self._session = session
+        self._session_lock = threading.Lock()
+        self._last_used = time.time()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _create_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @property
+    def session(self):
+        """A long-lived :class:`requests.Session` holding the connection pool.
+
+        The session is created lazily and recycled once it has been idle for
+        longer than ``pool_idle_timeout`` seconds, so that keep-alive sockets
+        the server has already dropped are not reused.
+        """
+        with self._session_lock:
+            now = time.time()
+            if (
+                self._session is not None
+                and self.pool_idle_timeout
+                and now - self._last_used > self.pool_idle_timeout
+            ):
+                self._session.close()
+                self._session = None
+            if self._session is None:
+                self._session = self._create_session()
+            self._last_used = now
+            return self._session
+
+    def detach_session(self):
+        """Detaches the pooled session from this requestor without closing it.
+
+        Used to hand the warm connection pool over to a new requestor when
+        the resource configuration changes.
+
+        :returns: The detached :class:`requests.Session` or ``None``.
+        """
+        with self._session_lock:
+            session, self._session = self._session, None
+            return session
+
+    def close(self):
+        """Closes the pooled session and all of its connections.
+
+        The requestor stays usable; a new session is created on the next
+        request.
+        """
+        session = self.detach_session()
+        if session is not None:
+            session.close()
 
     def api_url(self, url=None):
         url = url or ""
         return "%s%s" % (self.api_base_url, url)
 
+    @property
+    def base_url(self):
+        """The ``(origin, host, path)`` split of ``api_base_url``, e.g.
+        ``("https://api.vivialconnect.net", "api.vivialconnect.net",
+        "/api/v1.0")``, parsed once per base URL."""
+        base_url = self._base_url
+        if base_url is None or base_url[0] != self.api_base_url:
+            parsed_url = urlparse(self.api_base_url)
+            host = parsed_url.hostname + (
+                (":" + str(parsed_url.port)) if parsed_url.port else ""
+            )
+            base_url = self._base_url = (
+                self.api_base_url,
+                (
+                    "%s://%s" % (parsed_url.scheme, parsed_url.netloc),
+                    host,
+                    parsed_url.path,
+                ),
+            )
+        return base_url[1]
+
+    def split_url(self, url, params=None):
+        """Splits the URL of a request into the ``(host, path, query)``
+        parts that are signed, without parsing it.
+
+        :param url: Either a path relative to ``api_base_url``, with an
+            optional query string, or an already split ``(host, path,
+            query)`` tuple of an absolute URL, ``query`` being encoded and
+            without its leading ``?``.
+        :param params: Optional query parameters appended to the query.
+        :returns: A ``(host, path, query)`` tuple.
+        """
+        if isinstance(url, tuple):
+            host, path, query = url
+        else:
+            _, host, base_path = self.base_url
+            path, _, query = (url or "").partition("?")
+            path = base_path + path
+        if params:
+            encoded = self.encode(params)
+            query = "%s&%s" % (query, encoded) if query else encoded
+        return host, path, query
+
+    def absolute_url(self, url, params=None):
+        """Returns the absolute URL of a request to ``url``, a relative path
+        or a split URL as accepted by :meth:`split_url`."""
+        host, path, query = self.split_url(url, params)
+        origin = self.base_url[0]
+        if isinstance(url, tuple):
+            origin = "%s://%s" % (origin.split("://", 1)[0], host)
+        if query:
+            return "%s%s?%s" % (origin, path, query)
+        return origin + path
+
+    def request_path(self, url):
+        """Returns ``url`` as the path, relative to ``api_base_url``, that
+        the response cache and the rate limiter are keyed on.
+
+        Split URLs are turned into their path and query, the path being
+        made relative when it is on the host and under the path of
+        ``api_base_url``.
+        """
+        if not isinstance(url, tuple):
+            return url
+        host, path, query = url
+        _, base_host, base_path = self.base_url
+        if host == base_host and path.startswith(base_path):
+            path = path[len(base_path) :]
+        if query:
+            return "%s?%s" % (path, query)
+        return path
+
     @classmethod
     def _str_to_bytes(cls, s):
         if six.PY2:
@@ -105,10 +328,7 @@ class Requestor(object):
 
     @classmethod
     def _uri_encode(cls, data, encode_slash=False):
-        safe = "_-~."
-        if not encode_slash:
-            safe += "/"
-        return quote(data, safe=safe)
+        return HmacSigner.uri_encode(data, encode_slash=encode_slash)
 
     @classmethod
     def encode_dict(cls, out, key, dict_value):
@@ -170,8 +390,10 @@ class Requestor(object):
         return urlencode(cls._encode_inner(params))
 
     @classmethod
-    def encode_body(cls, params=None):
-        return cls._utf8(Util.to_json(params, root=None))
+    def encode_body(cls, params=None, codec=None):
+        """Encodes a request body once, as the ``bytes`` that are both
+        signed and sent."""
+        return get_codec(codec).dumps(params)
 
     @classmethod
     def build_url(cls, url, params):
@@ -181,65 +403,190 @@ class Requestor(object):
         else:
             return "%s?%s" % (url, cls.encode(params))
 
-    def sign(self, method, iso8601_timestamp, abs_url, headers, data):
-        if self.api_secret is None:
-            raise RequestorError("No API secret provided.")
-
-        api_hmac_used_signed_headers = []
-        canonical_headers = []
-        for key in headers.keys():
-            if key.lower() in API_HMAC_SIGNED_HEADERS:
-                canonical_headers.append(key.lower() + ":" + headers[key])
-                api_hmac_used_signed_headers.append(key.lower())
-        api_hmac_used_signed_headers.sort()
-        canonical_headers.sort()
-
-        parsed_url = urlparse(abs_url)
-
-        # Parse query string
-        canonical_query_string = []
-        query_string = parse_qsl(
-            parsed_url.query, keep_blank_values=True, strict_parsing=False
-        )
-        for item in query_string:
-            canonical_query_string.append(
-                self._uri_encode(item[0], encode_slash=True)
-                + "="
-                + self._uri_encode(item[1], encode_slash=True)
-            )
-        canonical_query_string.sort()
-
-        canonical_request = (
-            method.upper()
-            + "\n"
-            + iso8601_timestamp
-            + "\n"
-            + self._uri_encode(parsed_url.path, encode_slash=False)
-            + "\n"
-            + "&".join(canonical_query_string)
-            + "\n"
-            + "\n".join(canonical_headers)
-            + "\n"
-            + ";".join(api_hmac_used_signed_headers).lower()
-            + "\n"
-            + hashlib.sha256(self._str_to_bytes(data if data else "")).hexdigest()
-        )
-
-        h = hmac.new(self._str_to_bytes(self.api_secret), b"", hashlib.sha256)
-        h.update(self._str_to_bytes(canonical_request))
+    @property
+    def signer(self):
+        """The :class:`HmacSigner` keyed with the current ``api_secret``."""
+        signer = self._signer
+        if signer is None or signer.api_secret != self.api_secret:
+            if self.api_secret is None:
+                raise RequestorError("No API secret provided.")
+            signer = self._signer = HmacSigner(self.api_secret)
+        return signer
 
-        return h.hexdigest(), api_hmac_used_signed_headers
+    def sign(self, method, iso8601_timestamp, abs_url, headers, data):
+        """Signs a request to ``abs_url``, either an absolute URL or its
+        ``(host, path, query)`` split."""
+        if isinstance(abs_url, tuple):
+            _, path, query = abs_url
+        else:
+            parsed_url = urlparse(abs_url)
+            path, query = parsed_url.path, parsed_url.query
+        return self.signer.sign(method, iso8601_timestamp, path, query, headers, data)
+
+    @property
+    def last_attempts(self):
+        """The :class:`Attempt` list of the last request made by the calling
+        thread with a retry policy."""
+        return getattr(self._local, "attempts", [])
+
+    def cache_key(self, url, params=None):
+        """Returns the key of a GET request in the response cache."""
+        if isinstance(url, tuple):
+            return self.api_key, self.absolute_url(url, params)
+        abs_url = self.api_url(url)
+        if params:
+            abs_url = self.build_url(abs_url, params)
+        return self.api_key, abs_url
 
     def request(self, method, url, params=None, payload=None, **kwargs):
         if params is None:
             params = {}
-        http_body, http_status, response_url, response_headers = self.request_raw(
-            method, url, params, payload, **kwargs
+        cache = self.cache
+        if method.lower() == "get":
+            if (
+                cache is not None
+                or self.validators is not None
+                or self.single_flight is not None
+            ):
+                return self._get(url, params, **kwargs)[0]
+        if cache is None:
+            return self._request(method, url, params, payload, **kwargs)[1]
+        try:
+            return self._request(method, url, params, payload, **kwargs)[1]
+        finally:
+            cache.invalidate(self.request_path(url))
+
+    def get_if_modified(self, url, params=None, validators=None, **kwargs):
+        """Sends a GET request conditional on the ``validators`` of the
+        caller's copy of the resource.
+
+        :param validators: The validators returned with that copy. If
+            ``None``, the request is made as by :meth:`get`.
+        :returns: A ``(response, validators)`` tuple. ``response`` is
+            :data:`NOT_MODIFIED` if the copy is still current.
+        """
+        return self._get(
+            url,
+            params or {},
+            validators=validators,
+            conditional=validators is not None,
+            **kwargs
+        )
+
+    def _get_begin(self, url, params, validators, conditional):
+        """Looks a GET request up in the response cache and picks the
+        validators it is made conditional on.
+
+        :returns: A ``(key, cached, entry, validators)`` tuple, ``cached``
+            being the cached ``(response, validators)`` if any and ``entry``
+            what the validator store remembers of the URL.
+        """
+        key = self.cache_key(url, params)
+        if self.cache is not None:
+            raw = self.cache.get(key)
+            if raw is not None:
+                cached = self.interpret_response(*raw), validators_of(raw[3])
+                return key, cached, None, None
+        entry = None
+        if self.validators is not None:
+            entry = self.validators.get(key)
+            if not conditional and entry is not None:
+                validators = entry[0]
+        return key, None, entry, validators
+
+    def _flight_key(self, key, validators):
+        """Returns the single-flight key of a GET request. Requests made
+        conditional on different validators are not coalesced."""
+        if validators:
+            return key + (validators.get("etag"), validators.get("last_modified"))
+        return key
+
+    def _get_end(
+        self, key, url, raw, response, entry, validators, conditional, shared=False
+    ):
+        """Records the outcome of a GET request sent after
+        :meth:`_get_begin` and returns its ``(response, validators)``.
+
+        ``shared`` responses were received by another coalesced caller, and
+        are decoded again for this one.
+        """
+        store = self.validators
+        if shared:
+            response = self.interpret_response(*raw)
+        if response is NOT_MODIFIED:
+            if store is not None and not shared:
+                store.record(True, entry)
+            if conditional:
+                return NOT_MODIFIED, validators_of(raw[3]) or validators
+            raw = entry[1]
+            response = self.interpret_response(*raw)
+        elif store is not None and not shared:
+            if validators:
+                store.record(False)
+            store.store(key, raw)
+        if self.cache is not None:
+            self.cache.set(key, self.request_path(url), raw)
+        return response, validators_of(raw[3])
+
+    def _get(self, url, params, validators=None, conditional=False, **kwargs):
+        key, cached, entry, validators = self._get_begin(
+            url, params, validators, conditional
         )
-        response = self.interpret_response(
-            http_body, http_status, response_url, response_headers
+        if cached is not None:
+            return cached
+
+        def fetch():
+            return self._request(
+                "get", url, params, None, conditional_headers(validators), **kwargs
+            )
+
+        shared = False
+        if self.single_flight is None:
+            raw, response = fetch()
+        else:
+            (raw, response), shared = self.single_flight.do(
+                self._flight_key(key, validators), fetch
+            )
+        return self._get_end(
+            key, url, raw, response, entry, validators, conditional, shared
         )
-        return response
+
+    def _request(self, method, url, params, payload, headers=None, **kwargs):
+        """Sends a request, retrying it according to the retry policy.
+
+        :returns: A ``(raw, response)`` tuple of the raw response as returned
+            by :meth:`request_raw` and its interpretation.
+        """
+        policy = self.retry_policy
+        if policy is None:
+            raw = self.request_raw(method, url, params, payload, headers, **kwargs)
+            return raw, self.interpret_response(*raw)
+
+        headers = dict(policy.request_headers(method), **(headers or {}))
+        attempts = self._local.attempts = []
+        number = 0
+        while True:
+            number += 1
+            started = time.time()
+            http_status = None
+            try:
+                raw = self.request_raw(
+                    method, url, params, payload, headers=headers, **kwargs
+                )
+                http_status = raw[1]
+                response = self.interpret_response(*raw)
+            except RequestorError as e:
+                delay = policy.retry_delay(method, number, e)
+                policy.record(
+                    attempts,
+                    Attempt(number, time.time() - started, e.http_status, e, delay),
+                )
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            policy.record(attempts, Attempt(number, time.time() - started, http_status))
+            return raw, response
 
     def get(self, url, params=None, **kwargs):
         return self.request("get", url, params, **kwargs)
@@ -256,51 +603,77 @@ class Requestor(object):
     def head(self, url, params=None, **kwargs):
         return self.request("head", url, params, **kwargs)
 
-    def request_raw(self, method, url, params=None, payload=None, **kwargs):
+    def get_stream(self, url, params=None, root=None, **kwargs):
+        """Sends a GET request and decodes the listing in its body while it
+        is being downloaded.
+
+        Streamed requests bypass the response cache, conditional requests,
+        request coalescing and retries.
+
+        :param root: Name of the response member holding the listing.
+            Defaults to the first array found.
+        :returns: :class:`JsonArrayStream` -- an iterator over the elements
+            of the listing.
+        """
+        http_body, http_status, response_url, response_headers = self.request_raw(
+            "get", url, params or {}, stream=True, **kwargs
+        )
+        if not (200 <= http_status < 300):
+            self.interpret_response(
+                http_body, http_status, response_url, response_headers
+            )
+        return JsonArrayStream(http_body, root=root)
+
+    def request_raw(self, method, url, params=None, payload=None, headers=None, **kwargs):
+        path = self.request_path(url)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.api_account_id, path)
+        method, abs_url, headers, data = self.prepare_request(
+            method, url, params, payload, headers
+        )
+        http_body, http_status, response_url, response_headers = self.requests_request(
+            method, abs_url, headers, data, **kwargs
+        )
+        if self.rate_limiter is not None:
+            self.rate_limiter.feedback(
+                self.api_account_id, path, http_status, response_headers
+            )
+
+        return http_body, http_status, response_url, response_headers
+
+    def prepare_request(self, method, url, params=None, payload=None, headers=None):
+        """Builds the absolute URL, body and signed headers of a request.
+
+        ``url`` is either a path relative to ``api_base_url`` or a ``(host,
+        path, query)`` tuple, see :meth:`split_url`. Neither is parsed.
+        ``headers`` are extra, unsigned, headers to send with the request.
+
+        :returns: A ``(method, abs_url, headers, data)`` tuple ready to be
+            handed to a transport.
+        """
         now = datetime.datetime.utcnow()
-        abs_url = self.api_url(url)
+        host, path, query = self.split_url(url, params)
+        abs_url = self.absolute_url((host, path, query))
         method = method.lower()
-        if params:
-            abs_url = self.build_url(abs_url, params)
 
         if method == "get":
             data = None
         elif method == "delete":
-            data = self.encode_body(payload) if payload else None
+            data = self.encode_body(payload, self.codec) if payload else None
         elif method == "post" or method == "put":
-            data = self.encode_body(payload)
+            data = self.encode_body(payload, self.codec)
         else:
             raise RequestorError(
                 "Bug discovered: invalid request method: %s. "
                 "Please report to contact@vivialconnect.net." % method
             )
 
-        ua = {
-            "client_version": VERSION,
-            "lang": "python",
-            "publisher": "vivialconnect",
-            "request_lib": "requests",
-        }
-
-        for attr, func in [
-            ["lang_version", platform.python_version],
-            ["platform", platform.platform],
-        ]:
-            try:
-                val = func()
-            except Exception as e:
-                val = "!! %s" % e
-            ua[attr] = val
-
-        parsed_url = urlparse(abs_url)
-        headers = {
-            "X-VivialConnect-User-Agent": json.dumps(ua),
-            "User-Agent": "VivialConnect PythonClient %s" % VERSION,
-            "Date": "%s" % (now.strftime("%a, %d %b %Y %H:%M:%S GMT")),
-            "Host": parsed_url.hostname
-            + ((":" + str(parsed_url.port)) if parsed_url.port else ""),
-            "Accept": API_CONTENT_TYPE,
-        }
+        extra_headers = headers
+        headers = dict(static_headers())
+        if extra_headers:
+            headers.update(extra_headers)
+        headers["Date"] = "%s" % (now.strftime("%a, %d %b %Y %H:%M:%S GMT"))
+        headers["Host"] = host
 
         if data:
             headers["Content-Type"] = API_CONTENT_TYPE
@@ -309,8 +682,13 @@ class Requestor(object):
             headers["Content-Length"] = "0"
 
         iso8601_timestamp = now.strftime("%Y%m%dT%H%M%SZ")
-        digest, api_hmac_used_signed_headers = self.sign(
-            method, iso8601_timestamp, abs_url, headers, data
+        digest, api_hmac_used_signed_headers = self.signer.sign(
+            method,
+            iso8601_timestamp,
+            path,
+            query,
+            headers,
+            data,
         )
         headers["X-Auth-SignedHeaders"] = "%s" % (
             ";".join(api_hmac_used_signed_headers).lower()
@@ -321,11 +699,7 @@ class Requestor(object):
             digest,
         )
 
-        http_body, http_status, response_url, response_headers = self.requests_request(
-            method, abs_url, headers, data, **kwargs
-        )
-
-        return http_body, http_status, response_url, response_headers
+        return method, abs_url, headers, data
 
     def interpret_response(
         self, http_body, http_status, response_url, response_headers
@@ -333,37 +707,66 @@ class Requestor(object):
         # 204 should return empty body only, so let's check
         # if we are getting anything else back.
         if http_status == 204 and not http_body:
-            return http_body
+            return self._body_text(http_body)
+        if http_status == 304:
+            return NOT_MODIFIED
         try:
-            loaded_response = json.loads(http_body)
+            loaded_response = get_codec(self.codec).loads(http_body)
         except Exception:
+            http_body = self._body_text(http_body)
             raise RequestorError(
                 "Invalid JSON response body from API: (%d) %s "
                 % (http_status, http_body),
                 http_status,
                 http_body,
+                response_headers,
             )
         if not (200 <= http_status < 300):
             self._handle_api_error(
-                http_status, http_body, loaded_response, response_url, response_headers
+                http_status,
+                self._body_text(http_body),
+                loaded_response,
+                response_url,
+                response_headers,
             )
         return loaded_response
 
-    def requests_request(self, method, abs_url, headers, data, **kwargs):
+    @staticmethod
+    def _body_text(http_body):
+        # Errors expose the response body as text.
+        if isinstance(http_body, six.binary_type):
+            return http_body.decode("utf-8", "replace")
+        return http_body
+
+    def requests_request(self, method, abs_url, headers, data, stream=False, **kwargs):
+        """Sends a signed request.
+
+        When ``stream`` is set, the body of a successful response is
+        returned as an iterator of ``bytes`` chunks instead of ``bytes``.
+        """
         try:
-            result = requests.request(
+            result = self.session.request(
                 method,
                 abs_url,
                 headers=headers,
                 data=data,
                 timeout=self.request_timeout,
                 verify=self.verify_request,
+                stream=stream,
                 **kwargs
             )
-            http_body = result.text
+            if stream and 200 <= result.status_code < 300:
+                http_body = self._iter_content(result)
+            else:
+                http_body = result.content
             http_status = result.status_code
             response_url = result.url
             response_headers = result.headers
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            raise ConnectionError(
+                "Could not connect to VivialConnect. If this "
+                "problem persists please let us know at contact@vivialconnect.net."
+            )
         except Exception as e:
             raise RequestorError(
                 "Unexpected error communicating with VivialConnect. If this "
@@ -371,6 +774,19 @@ class Requestor(object):
             )
         return http_body, http_status, response_url, response_headers
 
+    @staticmethod
+    def _iter_content(result):
+        try:
+            for chunk in result.iter_content(STREAM_CHUNK_SIZE):
+                yield chunk
+        except requests.exceptions.RequestException:
+            raise ConnectionError(
+                "Connection to VivialConnect lost while reading the response. If "
+                "this problem persists please let us know at contact@vivialconnect.net."
+            )
+        finally:
+            result.close()
+
     def _handle_api_error(
         self, http_status, http_body, loaded_response, response_url, response_headers
     ):
@@ -399,24 +815,24 @@ class Requestor(object):
                 message, http_status, http_body, response_url, response_headers
             )
         elif http_status == 400:
-            raise BadRequest(message, http_status, http_body)
+            raise BadRequest(message, http_status, http_body, response_headers)
         elif http_status == 401:
-            raise UnauthorizedAccess(message, http_status, http_body)
+            raise UnauthorizedAccess(message, http_status, http_body, response_headers)
         elif http_status == 403:
-            raise ForbiddenAccess(message, http_status, http_body)
+            raise ForbiddenAccess(message, http_status, http_body, response_headers)
         elif http_status == 404:
-            raise ResourceNotFound(message, http_status, http_body)
+            raise ResourceNotFound(message, http_status, http_body, response_headers)
         elif http_status == 405:
-            raise MethodNotAllowed(message, http_status, http_body)
+            raise MethodNotAllowed(message, http_status, http_body, response_headers)
         elif http_status == 409:
-            raise ResourceConflict(message, http_status, http_body)
+            raise ResourceConflict(message, http_status, http_body, response_headers)
         elif http_status == 422:
-            raise ResourceInvalid(message, http_status, http_body)
+            raise ResourceInvalid(message, http_status, http_body, response_headers)
         elif http_status == 429:
-            raise RateLimit(message, http_status, http_body)
+            raise RateLimit(message, http_status, http_body, response_headers)
         elif 401 <= http_status < 500:
-            raise ClientError(message, http_status, http_body)
+            raise ClientError(message, http_status, http_body, response_headers)
         elif 500 <= http_status < 600:
-            raise ServerError(message, http_status, http_body)
+            raise ServerError(message, http_status, http_body, response_headers)
         else:
-            raise RequstorError(message, http_status, http_body)
+            raise RequestorError(message, http_status, http_body, response_headers)
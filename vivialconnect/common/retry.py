@@ -0,0 +1,118 @@
+"""
+.. module:: retry
+   :synopsis: Retry policy for failed API requests.
+
+"""
+
+import uuid
+import random
+
+from vivialconnect.common.error import ConnectionError
+from vivialconnect.common.ratelimit import parse_retry_after
+
+IDEMPOTENT_METHODS = frozenset(["get", "head", "put", "delete"])
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+class Attempt(object):
+    """Outcome and timing of a single attempt of a request.
+
+    :ivar number: Attempt number, starting at 1.
+    :ivar elapsed: Seconds spent on the attempt.
+    :ivar http_status: HTTP status of the response, ``None`` on transport
+        errors.
+    :ivar error: The :class:`RequestorError` raised by the attempt, if any.
+    :ivar delay: Seconds waited before the next attempt, ``None`` if the
+        attempt was not retried.
+    """
+
+    __slots__ = ("number", "elapsed", "http_status", "error", "delay")
+
+    def __init__(self, number, elapsed, http_status=None, error=None, delay=None):
+        self.number = number
+        self.elapsed = elapsed
+        self.http_status = http_status
+        self.error = error
+        self.delay = delay
+
+    def __repr__(self):
+        return "Attempt(%d, %.3fs, %s)" % (self.number, self.elapsed, self.http_status)
+
+
+class RetryPolicy(object):
+    """Decides whether and when a failed request is retried.
+
+    Transient failures (connection errors and the ``retry_statuses``) are
+    retried with exponential backoff and full jitter, or after the delay
+    requested by a ``Retry-After`` header.
+
+    POST requests are not idempotent. They are retried only when
+    ``idempotency_keys`` is set, in which case every attempt of the same
+    request carries the same ``Idempotency-Key`` header.
+
+    :param max_attempts: Maximum number of attempts, including the first one.
+    :param backoff_base: Backoff ceiling in seconds for the first retry.
+    :param backoff_max: Upper bound of the backoff ceiling in seconds.
+    :param max_retry_after: Longest ``Retry-After`` delay, in seconds, that
+        is waited for. Requests asking for longer are not retried.
+    :param on_attempt: Optional callable receiving each :class:`Attempt`.
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff_base=0.5,
+        backoff_max=30,
+        retry_statuses=(429, 500, 502, 503, 504),
+        retry_connection_errors=True,
+        idempotency_keys=True,
+        max_retry_after=60,
+        on_attempt=None,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_connection_errors = retry_connection_errors
+        self.idempotency_keys = idempotency_keys
+        self.max_retry_after = max_retry_after
+        self.on_attempt = on_attempt
+
+    def request_headers(self, method):
+        """Returns the extra headers shared by all attempts of a request."""
+        if self.idempotency_keys and method.lower() not in IDEMPOTENT_METHODS:
+            return {IDEMPOTENCY_KEY_HEADER: str(uuid.uuid4())}
+        return {}
+
+    def backoff(self, attempt):
+        """Returns a full jitter backoff delay after ``attempt`` failed."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def retry_delay(self, method, attempt, error):
+        """Returns the seconds to wait before retrying a failed attempt, or
+        ``None`` if the request must not be retried."""
+        if attempt >= self.max_attempts:
+            return None
+        if method.lower() not in IDEMPOTENT_METHODS and not self.idempotency_keys:
+            return None
+        if error.http_status is None:
+            if not (self.retry_connection_errors and isinstance(error, ConnectionError)):
+                return None
+        elif error.http_status not in self.retry_statuses:
+            return None
+
+        retry_after = None
+        if error.http_headers:
+            retry_after = parse_retry_after(error.http_headers.get("Retry-After"))
+        if retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            return retry_after
+        return self.backoff(attempt)
+
+    def record(self, attempts, attempt):
+        attempts.append(attempt)
+        if self.on_attempt is not None:
+            self.on_attempt(attempt)
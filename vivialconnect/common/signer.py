@@ -0,0 +1,112 @@
+"""
+.. module:: signer
+   :synopsis: HMAC request signing.
+
+"""
+
+import hmac
+import hashlib
+
+import six
+from six.moves.urllib.parse import parse_qsl, quote
+
+API_HMAC_SIGNED_HEADERS = ["content-type", "date", "host"]
+
+_SIGNED_HEADERS = frozenset(API_HMAC_SIGNED_HEADERS)
+_EMPTY_BODY_SHA256 = hashlib.sha256(b"").hexdigest()
+_PATH_CACHE_SIZE = 1024
+
+
+def _str_to_bytes(s):
+    if isinstance(s, six.text_type):
+        return s.encode()
+    return s
+
+
+class HmacSigner(object):
+    """Computes the ``Authorization`` digest of API requests.
+
+    The HMAC is keyed once per signer and every signature starts from a copy
+    of that keyed state. Encoded request paths are memoized since clients
+    hit the same handful of endpoints over and over.
+
+    :param api_secret: The API secret used as the HMAC key.
+    :type api_secret: ``str``.
+    """
+
+    def __init__(self, api_secret):
+        self.api_secret = api_secret
+        self._hmac = hmac.new(_str_to_bytes(api_secret), b"", hashlib.sha256)
+        self._paths = {}
+
+    @staticmethod
+    def uri_encode(data, encode_slash=False):
+        safe = "_-~."
+        if not encode_slash:
+            safe += "/"
+        return quote(data, safe=safe)
+
+    def _encode_path(self, path):
+        try:
+            return self._paths[path]
+        except KeyError:
+            pass
+        if len(self._paths) >= _PATH_CACHE_SIZE:
+            self._paths.clear()
+        encoded = self._paths[path] = self.uri_encode(path, encode_slash=False)
+        return encoded
+
+    def canonical_query_string(self, query):
+        if not query:
+            return ""
+        canonical_query_string = []
+        for key, value in parse_qsl(query, keep_blank_values=True, strict_parsing=False):
+            canonical_query_string.append(
+                self.uri_encode(key, encode_slash=True)
+                + "="
+                + self.uri_encode(value, encode_slash=True)
+            )
+        canonical_query_string.sort()
+        return "&".join(canonical_query_string)
+
+    def sign(self, method, iso8601_timestamp, path, query, headers, data):
+        """Signs a request given its already split URL components.
+
+        :param method: The HTTP method.
+        :param iso8601_timestamp: The request timestamp as YYYYMMDDThhmmssZ.
+        :param path: The URL path.
+        :param query: The raw URL query string, may be empty.
+        :param headers: The request headers.
+        :param data: The request body, ``str``, ``bytes`` or ``None``.
+        :returns: A ``(hexdigest, signed_headers)`` tuple.
+        """
+        signed_headers = []
+        canonical_headers = []
+        for key, value in six.iteritems(headers):
+            lower_key = key.lower()
+            if lower_key in _SIGNED_HEADERS:
+                canonical_headers.append(lower_key + ":" + value)
+                signed_headers.append(lower_key)
+        signed_headers.sort()
+        canonical_headers.sort()
+
+        if data:
+            body_hash = hashlib.sha256(_str_to_bytes(data)).hexdigest()
+        else:
+            body_hash = _EMPTY_BODY_SHA256
+
+        canonical_request = "\n".join(
+            (
+                method.upper(),
+                iso8601_timestamp,
+                self._encode_path(path),
+                self.canonical_query_string(query),
+                "\n".join(canonical_headers),
+                ";".join(signed_headers),
+                body_hash,
+            )
+        )
+
+        h = self._hmac.copy()
+        h.update(_str_to_bytes(canonical_request))
+        return h.hexdigest(), signed_headers
@@ -0,0 +1,112 @@
+"""
+.. module:: singleflight
+   :synopsis: Coalescing of concurrent identical requests.
+
+"""
+
+import asyncio
+import threading
+
+
+class _Call(object):
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Lets concurrent identical calls share a single execution.
+
+    The first caller of :meth:`do` (or :meth:`ado`) for a key runs the
+    call; callers arriving with the same key while it is in flight wait for
+    it and receive the same result, or the same exception. Threads and
+    asyncio tasks are coalesced separately, tasks per event loop.
+
+    A single instance can be shared by any number of requestors::
+
+        Resource.single_flight = SingleFlight()
+
+    :ivar calls: Number of calls actually executed.
+    :ivar coalesced: Number of calls answered with the result of another.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._calls = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self):
+        """Number of calls currently executing."""
+        return len(self._calls) + len(self._futures)
+
+    def do(self, key, func):
+        """Runs ``func()`` unless a call for ``key`` is already in flight.
+
+        :returns: A ``(result, shared)`` tuple, ``shared`` being ``True``
+            when the result was produced for another caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if leader:
+            try:
+                call.result = func()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.event.set()
+        else:
+            call.event.wait()
+
+        if call.error is not None:
+            raise call.error
+        return call.result, not leader
+
+    async def ado(self, key, factory):
+        """Coroutine version of :meth:`do`, ``factory`` being a callable
+        returning the awaitable to run."""
+        loop = asyncio.get_event_loop()
+        key = (id(loop), key)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._futures[key] = loop.create_future()
+                self.calls += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            return await asyncio.shield(future), True
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when no one else waits for it.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                del self._futures[key]
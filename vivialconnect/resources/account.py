@@ -2,7 +2,10 @@
 .. module:: account
    :synopsis: Account module.
 """
-from datetime import datetime
+import collections
+
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 
@@ -12,6 +15,9 @@ from vivialconnect.common.util import Util
 
 _TRANSACTION_SEARCH_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
+# Number of transactions requested per shard by Transaction.find_range.
+TRANSACTION_PAGE_LIMIT = 50
+
 
 class Account(Resource, Countable):
     """The Account resource is used for managing accounts in the API.
@@ -54,12 +60,21 @@ class Account(Resource, Countable):
 
         :returns: A free trial status.
         """
+        return cls.request.get(cls._billing_status_path(account_id))
+
+    @classmethod
+    async def abilling_status(cls, account_id=None):
+        """Coroutine version of :meth:`billing_status`."""
+        return await cls.async_request.get(cls._billing_status_path(account_id))
+
+    @classmethod
+    def _billing_status_path(cls, account_id=None):
         if account_id:
             if not isinstance(account_id, six.string_types):
                 account_id = str(account_id)
         else:
             account_id = Resource.api_account_id
-        return cls.request.get("/accounts/%s/status.json" % (account_id))
+        return "/accounts/%s/status.json" % (account_id)
 
 
 class Transaction(Resource):
@@ -85,7 +100,7 @@ class Transaction(Resource):
 
 
     @classmethod
-    def find(cls, id_=None, path=None, **kwargs):
+    def find(cls, id_=None, path=None, raw=False, records=False, **kwargs):
         """
             Retrieve one or a list of transactions from the user account.
 
@@ -97,6 +112,10 @@ class Transaction(Resource):
             :type end_time: ``str``
             :param transaction_type: *Passed as kwargs*. Filter transactions by type (see allowed types below).
             :type transaction_type: ``str``
+            :param raw: Return the decoded JSON ``dict`` of each transaction.
+            :type raw: ``bool``
+            :param records: Return an immutable record for each transaction.
+            :type records: ``bool``
             :param \**kwargs: Include optional keywords like page, limit,etc. and other useful keys for searching.
 
             :returns: a transaction object or a list of transaction objects.
@@ -126,16 +145,181 @@ class Transaction(Resource):
 
         """
         if id_:
-            return cls._find_single(id_)
+            return cls._find_single(id_, raw=raw, records=records)
+        kwargs = cls._transaction_query(**kwargs)
+        transactions = cls._find_every(
+            root="transactions", raw=raw, records=records, **kwargs
+        )
+        return transactions
+
+    @classmethod
+    async def afind(cls, id_=None, path=None, raw=False, records=False, **kwargs):
+        """Coroutine version of :meth:`find`."""
+        if id_:
+            return await cls._afind_single(id_, raw=raw, records=records)
+        kwargs = cls._transaction_query(**kwargs)
+        return await cls._afind_every(
+            root="transactions", raw=raw, records=records, **kwargs
+        )
+
+    @classmethod
+    def find_stream(cls, path=None, root="transactions", raw=False, records=False, **kwargs):
+        """Iterates over transactions while the response is being
+        downloaded. Takes the same filters as :meth:`find`, see
+        :meth:`Resource.find_stream`."""
+        kwargs = cls._transaction_query(**kwargs)
+        return super(Transaction, cls).find_stream(
+            path=path, root=root, raw=raw, records=records, **kwargs
+        )
+
+    @classmethod
+    def find_range(
+        cls,
+        start,
+        end=None,
+        shard=timedelta(days=1),
+        workers=4,
+        limit=TRANSACTION_PAGE_LIMIT,
+        raw=False,
+        records=False,
+        **kwargs
+    ):
+        """Retrieves every transaction of a time window, oldest first.
+
+        The window is split into shards of ``shard`` which are fetched by
+        ``workers`` threads, so long windows of busy accounts are not
+        pulled through a single slow request. A shard returning ``limit``
+        transactions is split in halves until each part fits in a request,
+        then paged through once it cannot be split any further. Transactions
+        found on both sides of a shard boundary are returned once.
+
+        Example summing a month of cash spending::
+
+            start = datetime(2020, 11, 1)
+            spent = sum(t.cash_amount for t in Transaction.find_range(start, start + timedelta(days=30)))
+
+        :param start: Start of the window (UTC).
+        :type start: ``datetime`` or ``str`` in ISO 8601 format like YYYY-MM-DDThh:mm:ssZ
+        :param end: End of the window (UTC), defaults to now.
+        :type end: ``datetime`` or ``str``
+        :param shard: Duration of the window fetched per request.
+        :type shard: ``timedelta``
+        :param workers: Number of shards fetched concurrently.
+        :type workers: ``int``
+        :param limit: Number of transactions requested per shard.
+        :type limit: ``int``
+        :param raw: Yield the decoded JSON ``dict`` of each transaction.
+        :type raw: ``bool``
+        :param records: Yield an immutable record for each transaction.
+        :type records: ``bool``
+        :param \\**kwargs: Other filters, like ``transaction_type``.
+
+        :returns: A generator of transactions ordered by ``post_time``.
+        """
+        start = cls._range_time(start)
+        end = cls._range_time(end if end is not None else datetime.utcnow())
+        if shard < timedelta(seconds=1):
+            raise ValueError("shard must be at least one second long")
+        query = cls._transaction_query(**kwargs)
+        query.pop("start_time", None)
+        query.pop("end_time", None)
+        shards = []
+        while start < end:
+            shards.append((start, min(start + shard, end)))
+            start += shard
+        return cls._iter_range(shards, workers, limit, query, raw, records)
+
+    @classmethod
+    def _iter_range(cls, shards, workers, limit, query, raw=False, records=False):
+        shards = iter(shards)
+        pending = collections.deque()
+        previous = set()
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            # Keep the workers busy while the oldest shard is being consumed.
+            for window in shards:
+                pending.append(executor.submit(cls._fetch_shard, window, limit, query))
+                if len(pending) >= 2 * workers:
+                    break
+            while pending:
+                elements = pending.popleft().result()
+                for window in shards:
+                    pending.append(executor.submit(cls._fetch_shard, window, limit, query))
+                    break
+                current = set()
+                for element in elements:
+                    current.add(element.get("id"))
+                    if element.get("id") in previous:
+                        continue
+                    if raw:
+                        yield element
+                    elif records:
+                        yield cls._build_record(element)
+                    else:
+                        yield cls._loaded(element)
+                previous = current
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @classmethod
+    def _fetch_shard(cls, window, limit, query):
+        start, end = window
+        elements = cls._find_every(
+            root="transactions",
+            raw=True,
+            start_time=start.strftime(_TRANSACTION_SEARCH_DATE_FORMAT),
+            end_time=end.strftime(_TRANSACTION_SEARCH_DATE_FORMAT),
+            limit=limit,
+            **query
+        )
+        if len(elements) < limit:
+            return cls._merge_transactions(elements)
+        half = timedelta(seconds=int((end - start).total_seconds()) // 2)
+        if half:
+            return cls._merge_transactions(
+                cls._fetch_shard((start, start + half), limit, query),
+                cls._fetch_shard((start + half, end), limit, query),
+            )
+        # A single second holding more than a request can return.
+        page = elements
+        while len(page) >= limit:
+            page = cls._find_every(
+                root="transactions",
+                raw=True,
+                start_time=start.strftime(_TRANSACTION_SEARCH_DATE_FORMAT),
+                end_time=end.strftime(_TRANSACTION_SEARCH_DATE_FORMAT),
+                limit=limit,
+                page=len(elements) // limit + 1,
+                **query
+            )
+            elements.extend(page)
+        return cls._merge_transactions(elements)
+
+    @staticmethod
+    def _merge_transactions(*lists):
+        transactions = {}
+        for elements in lists:
+            for element in elements:
+                transactions[element.get("id")] = element
+        return sorted(
+            six.itervalues(transactions),
+            key=lambda element: (element.get("post_time") or "", element.get("id")),
+        )
+
+    @staticmethod
+    def _range_time(value):
+        if isinstance(value, six.string_types):
+            value = datetime.strptime(value, _TRANSACTION_SEARCH_DATE_FORMAT)
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.replace(microsecond=0, tzinfo=None)
+
+    @classmethod
+    def _transaction_query(cls, **kwargs):
         if "transaction_type" in kwargs:
             transaction_types = kwargs.pop("transaction_type")
             kwargs["include_types[]"] = transaction_types
-        if "start_time" not in kwargs and "end_time" not in "end_time":
-            year_ago = datetime.now().year - 1
-            start_time = datetime.now().replace(year=year_ago).strftime(_TRANSACTION_SEARCH_DATE_FORMAT)
-            end_time = datetime.now().strftime(_TRANSACTION_SEARCH_DATE_FORMAT)
-            kwargs["start_time"] = start_time
-            kwargs["end_time"] = end_time
-        transactions = cls._find_every(root="transactions", **kwargs)
-        return transactions
+        return kwargs
 
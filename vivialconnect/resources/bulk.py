@@ -0,0 +1,444 @@
+"""
+.. module:: bulk
+   :synopsis: Helpers for large bulk message campaigns.
+"""
+
+import csv
+import time
+import calendar
+import itertools
+import threading
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from vivialconnect.resources.message import Message
+
+# Format of the ``date_created`` field of the bulk listing, in UTC.
+_BULK_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# Number of recipients sent in a single bulk request.
+BULK_CHUNK_SIZE = 1000
+
+
+class BulkChunkError(object):
+    """A chunk of recipients that could not be submitted.
+
+    :ivar index: Position of the chunk in the campaign, starting at 0.
+    :ivar recipients: The recipients of the chunk, so it can be resent.
+    :ivar error: The exception raised while sending the chunk.
+    """
+
+    __slots__ = ("index", "recipients", "error")
+
+    def __init__(self, index, recipients, error):
+        self.index = index
+        self.recipients = recipients
+        self.error = error
+
+    def __repr__(self):
+        return "BulkChunkError(%d, %r)" % (self.index, self.error)
+
+
+class BulkSendReport(object):
+    """Summary of a :meth:`BulkSender.send` run.
+
+    :ivar bulk_ids: The bulk ids returned by the API, in chunk order.
+    :ivar chunks: Number of chunks submitted.
+    :ivar recipients: Number of recipients successfully submitted.
+    :ivar errors: :class:`BulkChunkError` list of the failed chunks.
+    :ivar elapsed: Wall time of the run, in seconds.
+    """
+
+    def __init__(self):
+        self._bulk_ids = {}
+        self.chunks = 0
+        self.recipients = 0
+        self.errors = []
+        self.elapsed = 0.0
+
+    @property
+    def bulk_ids(self):
+        return [self._bulk_ids[index] for index in sorted(self._bulk_ids)]
+
+    @property
+    def throughput(self):
+        """Recipients submitted per second."""
+        if not self.elapsed:
+            return 0.0
+        return self.recipients / self.elapsed
+
+    def __repr__(self):
+        return "BulkSendReport(chunks=%d, recipients=%d, errors=%d, %.1f/s)" % (
+            self.chunks,
+            self.recipients,
+            len(self.errors),
+            self.throughput,
+        )
+
+
+class BulkSender(object):
+    """Sends one message to a very large number of recipients.
+
+    Recipients are read lazily from any iterable, split into chunks of
+    ``chunk_size`` and each chunk is submitted with
+    :meth:`Message.send_bulk` from a pool of ``workers`` threads. At most
+    ``max_pending`` chunks are held in memory at any time.
+
+    Example sending a campaign read from a CSV file::
+
+        from vivialconnect import BulkSender
+
+        sender = BulkSender(from_number="+19132597591", body="Howdy!", workers=8)
+        with open("recipients.csv") as f:
+            report = sender.send(BulkSender.read_csv(f, column="phone_number"))
+        print(report.bulk_ids, report.throughput)
+
+    :param from_number: The sending phone number.
+    :param body: The message body.
+    :param media_urls: Optional list of media URLs.
+    :param chunk_size: Recipients per bulk request.
+    :param workers: Number of chunks submitted concurrently.
+    :param max_pending: Maximum number of chunks queued or in flight,
+        defaults to twice ``workers``.
+    :param on_chunk: Optional callable invoked with ``(index, bulk_id,
+        error)`` once each chunk has been submitted.
+    """
+
+    def __init__(
+        self,
+        from_number,
+        body=None,
+        media_urls=None,
+        chunk_size=BULK_CHUNK_SIZE,
+        workers=4,
+        max_pending=None,
+        on_chunk=None,
+    ):
+        self.from_number = from_number
+        self.body = body
+        self.media_urls = media_urls
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.max_pending = max_pending if max_pending else 2 * workers
+        self.on_chunk = on_chunk
+
+    @staticmethod
+    def read_csv(fileobj, column=0):
+        """Yields the recipients found in a CSV stream.
+
+        :param fileobj: An open text file or any iterable of lines.
+        :param column: Index of the column holding phone numbers, or its
+            header name in which case the first row is read as header.
+        """
+        reader = csv.reader(fileobj)
+        if not isinstance(column, int):
+            column = next(reader).index(column)
+        for row in reader:
+            if len(row) > column:
+                yield row[column]
+
+    def chunks(self, recipients):
+        """Splits an iterable of recipients into lists of ``chunk_size``."""
+        recipients = (r.strip() for r in recipients if r and r.strip())
+        while True:
+            chunk = list(itertools.islice(recipients, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def send_chunk(self, recipients):
+        """Submits a single chunk and returns its bulk id."""
+        message = Message()
+        message.from_number = self.from_number
+        message.to_numbers = recipients
+        if self.body is not None:
+            message.body = self.body
+        if self.media_urls is not None:
+            message.media_urls = self.media_urls
+        return message.send_bulk()
+
+    def send(self, recipients):
+        """Sends the message to every recipient.
+
+        Failed chunks do not stop the campaign; they are reported in
+        :attr:`BulkSendReport.errors` along with their recipients.
+
+        :param recipients: An iterable of phone numbers in E.164 format.
+        :returns: :class:`BulkSendReport`.
+        """
+        report = BulkSendReport()
+        lock = threading.Lock()
+        started = time.time()
+
+        def submit(index, chunk):
+            bulk_id, error = None, None
+            try:
+                bulk_id = self.send_chunk(chunk)
+            except Exception as e:
+                error = e
+            with lock:
+                report.chunks += 1
+                if error is None:
+                    report._bulk_ids[index] = bulk_id
+                    report.recipients += len(chunk)
+                else:
+                    report.errors.append(BulkChunkError(index, chunk, error))
+            if self.on_chunk is not None:
+                self.on_chunk(index, bulk_id, error)
+
+        pending = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for index, chunk in enumerate(self.chunks(recipients)):
+                if len(pending) >= self.max_pending:
+                    _, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.add(executor.submit(submit, index, chunk))
+        report.errors.sort(key=lambda e: e.index)
+        report.elapsed = time.time() - started
+        return report
+
+
+class BulkProgress(object):
+    """Progress of a bulk send job tracked by :class:`BulkWatcher`.
+
+    :ivar bulk_id: The bulk id.
+    :ivar total: Number of messages in the job, ``None`` until known.
+    :ivar processed: Number of messages processed by the API so far.
+    :ivar errors: Number of those messages that failed.
+    :ivar rate: Messages processed per second since the previous poll.
+    :ivar interval: Seconds until the job is polled again.
+    :ivar polls: Number of times the job has been polled.
+    :ivar misses: Number of polls in a row that did not find the job in
+        the bulk listing.
+    :ivar lost: ``True`` once the job was missing from too many polls in a
+        row; lost jobs are no longer polled.
+    :ivar created: Time the job was created at, as a UNIX timestamp.
+    """
+
+    def __init__(self, bulk_id, total=None, interval=1.0, created=None):
+        self.bulk_id = bulk_id
+        self.created = created if created is not None else time.time()
+        self.total = total
+        self.processed = 0
+        self.errors = 0
+        self.rate = 0.0
+        self.interval = interval
+        self.polls = 0
+        self.misses = 0
+        self.lost = False
+        self.updated = None
+        self.next_poll = 0.0
+
+    @property
+    def done(self):
+        return self.total is not None and self.processed >= self.total
+
+    @property
+    def fraction(self):
+        if not self.total:
+            return 0.0
+        return min(1.0, float(self.processed) / self.total)
+
+    def __repr__(self):
+        return "BulkProgress(%s, %s/%s)" % (self.bulk_id, self.processed, self.total)
+
+
+class BulkWatcher(object):
+    """Tracks the completion of a set of bulk send jobs.
+
+    A poll reads the ``processed``, ``errors`` and ``total_messages``
+    counts of every due job from the bulk listing, newest bulks first, and
+    stops reading as soon as all of them were found. Whatever the number of
+    jobs and their size, a poll usually costs a single request, and never
+    more than ``max_pages``: the listing is not read past bulks created
+    ``clock_slack`` seconds before the oldest due job, nor past a page that
+    holds no bulk not seen already. Jobs are
+    polled at an interval adapted to their processing rate, between
+    ``min_interval`` and ``max_interval`` seconds, and are no longer polled
+    once finished.
+
+    A job missing from the listing, e.g. one submitted a moment ago, is
+    polled again with a growing interval and is given up on, as
+    :attr:`BulkProgress.lost`, after ``max_misses`` polls in a row.
+
+    Example tracking the chunks of a :class:`BulkSender` campaign::
+
+        watcher = BulkWatcher(on_progress=print)
+        for bulk_id in report.bulk_ids:
+            watcher.track(bulk_id)
+        watcher.watch(timeout=3600)
+
+    :param min_interval: Shortest delay between two polls of a job.
+    :param max_interval: Longest delay between two polls of a job.
+    :param on_progress: Optional callable invoked with a
+        :class:`BulkProgress` whenever a job makes progress.
+    :param on_complete: Optional callable invoked with a
+        :class:`BulkProgress` once a job is finished.
+    :param max_misses: Polls in a row a job may be missing from the bulk
+        listing before it is given up on.
+    :param page_size: Bulks read per listing request.
+    :param max_pages: Listing requests made per poll at most.
+    :param clock_slack: Seconds allowed between the creation time of a job
+        as seen by the API and as passed to :meth:`track`.
+    """
+
+    def __init__(
+        self,
+        min_interval=1.0,
+        max_interval=60.0,
+        on_progress=None,
+        on_complete=None,
+        max_misses=10,
+        page_size=50,
+        max_pages=20,
+        clock_slack=300.0,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.on_progress = on_progress
+        self.on_complete = on_complete
+        self.max_misses = max_misses
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.clock_slack = clock_slack
+        self.jobs = {}
+        self._stopped = threading.Event()
+
+    def track(self, bulk_id, total=None, created=None):
+        """Starts tracking a bulk job.
+
+        :param bulk_id: The bulk id returned by :meth:`Message.send_bulk`.
+        :param total: Number of recipients of the job, if known. Unknown
+            totals are read from the bulk listing.
+        :param created: UNIX timestamp the job was created at, defaults to
+            now. Jobs created earlier than that are not found.
+        :returns: :class:`BulkProgress`.
+        """
+        if bulk_id not in self.jobs:
+            self.jobs[bulk_id] = BulkProgress(
+                bulk_id, total, self.min_interval, created
+            )
+        return self.jobs[bulk_id]
+
+    @property
+    def pending(self):
+        return [job for job in self.jobs.values() if not job.done and not job.lost]
+
+    def stop(self):
+        """Makes a running :meth:`watch` return."""
+        self._stopped.set()
+
+    @staticmethod
+    def _created(bulk):
+        try:
+            created = bulk["date_created"][:19]
+            return calendar.timegm(time.strptime(created, _BULK_DATE_FORMAT))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _find_bulks(self, bulk_ids, since=None):
+        """Reads the bulk listing page by page until every bulk of
+        ``bulk_ids`` was found, and returns the ``dict`` of each one found
+        keyed by bulk id. Bulks created before the ``since`` UNIX timestamp
+        are not looked for."""
+        url = Message._custom_path(custom_path="/bulk")
+        found = {}
+        seen = set()
+        page = 1
+        while True:
+            response = Message.request.get(
+                url, params={"page": page, "limit": self.page_size}
+            )
+            bulks = response.get("bulks") or []
+            new = False
+            oldest = None
+            for bulk in bulks:
+                if bulk.get("bulk_id") not in seen:
+                    seen.add(bulk.get("bulk_id"))
+                    new = True
+                if bulk.get("bulk_id") in bulk_ids:
+                    found[bulk["bulk_id"]] = bulk
+                created = self._created(bulk)
+                if created is not None and (oldest is None or created < oldest):
+                    oldest = created
+            if (
+                len(found) == len(bulk_ids)
+                or not new
+                or len(bulks) < self.page_size
+                or page >= response.get("pages", page + 1)
+                or page >= self.max_pages
+                or (since is not None and oldest is not None and oldest < since)
+            ):
+                return found
+            page += 1
+
+    def _poll(self, job, now, bulk):
+        job.polls += 1
+        if bulk is None:
+            job.misses += 1
+            job.lost = job.misses >= self.max_misses
+            job.interval = min(self.max_interval, max(self.min_interval, job.interval * 2))
+            job.next_poll = now + job.interval
+            return False
+
+        job.misses = 0
+        if bulk.get("total_messages") is not None:
+            job.total = bulk["total_messages"]
+        processed = bulk.get("processed") or 0
+        errors = bulk.get("errors") or 0
+        progressed = processed != job.processed or errors != job.errors
+        if job.updated is not None:
+            job.rate = (processed - job.processed) / max(now - job.updated, 1e-6)
+        job.processed = processed
+        job.errors = errors
+        job.updated = now
+
+        if job.rate > 0 and job.total is not None:
+            eta = (job.total - processed) / job.rate
+            job.interval = eta / 2
+        elif not progressed:
+            job.interval = job.interval * 2
+        job.interval = min(self.max_interval, max(self.min_interval, job.interval))
+        job.next_poll = now + job.interval
+        return progressed
+
+    def poll(self):
+        """Polls every unfinished job that is due.
+
+        :returns: ``list`` -- the :class:`BulkProgress` of the jobs that
+            made progress.
+        """
+        now = time.time()
+        due = [job for job in self.pending if job.next_poll <= now]
+        if not due:
+            return []
+        since = min(job.created for job in due) - self.clock_slack
+        bulks = self._find_bulks(set(job.bulk_id for job in due), since)
+        updated = []
+        for job in due:
+            if self._poll(job, now, bulks.get(job.bulk_id)):
+                updated.append(job)
+                if self.on_progress is not None:
+                    self.on_progress(job)
+            if job.done and self.on_complete is not None:
+                self.on_complete(job)
+        return updated
+
+    def watch(self, timeout=None):
+        """Polls the tracked jobs until they are all finished or lost.
+
+        :param timeout: Maximum number of seconds to watch for.
+        :returns: ``bool`` -- ``True`` if every job finished.
+        """
+        self._stopped.clear()
+        deadline = time.time() + timeout if timeout is not None else None
+        while self.pending and not self._stopped.is_set():
+            self.poll()
+            pending = self.pending
+            if not pending:
+                break
+            wake_up = min(job.next_poll for job in pending)
+            if deadline is not None:
+                if wake_up >= deadline:
+                    break
+            self._stopped.wait(max(0.0, wake_up - time.time()))
+        return all(job.done for job in self.jobs.values())
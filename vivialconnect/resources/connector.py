@@ -3,10 +3,23 @@
    :synopsis: Connector module.
 """
 
+import time
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
 from vivialconnect.resources.resource import Resource, SubordinateResource
 from vivialconnect.resources.countable import Countable
+from vivialconnect.common.error import ResourceError
 from vivialconnect.common.fields import ResourceListingField
 
+# Number of phone numbers or callbacks sent per sub-resource request.
+SYNC_BATCH_SIZE = 50
+
+# Keys identifying the items of each listing.
+_NUMBER_KEYS = ("phone_number_id", "phone_number")
+_CALLBACK_FIELDS = ("message_type", "event_type", "url", "method")
+
 
 class ConnectorNumber(SubordinateResource):
     """Phone Number associated with a Connector. When creating or editing a phone number
@@ -48,6 +61,61 @@ class ConnectorCallback(SubordinateResource):
         )
 
 
+class ConnectorOperation(object):
+    """A batch of phone numbers or callbacks added to or removed from a
+    connector by :meth:`Connector.sync`.
+
+    :ivar field: ``"phone_numbers"`` or ``"callbacks"``.
+    :ivar action: ``"add"`` or ``"remove"``.
+    :ivar items: The ``dict`` of each phone number or callback.
+    """
+
+    __slots__ = ("field", "action", "items")
+
+    def __init__(self, field, action, items):
+        self.field = field
+        self.action = action
+        self.items = items
+
+    def __repr__(self):
+        return "ConnectorOperation(%s %d %s)" % (self.action, len(self.items), self.field)
+
+
+class ConnectorSyncReport(object):
+    """Summary of a :meth:`Connector.sync` run.
+
+    :ivar applied: :class:`ConnectorOperation` list of the batches applied.
+    :ivar errors: ``(operation, error)`` list of the batches that failed.
+    :ivar requests: Number of requests made.
+    :ivar elapsed: Wall time of the run, in seconds.
+    """
+
+    def __init__(self):
+        self.applied = []
+        self.errors = []
+        self.requests = 0
+        self.elapsed = 0.0
+
+    def count(self, field, action):
+        """Number of items of ``field`` successfully added or removed."""
+        return sum(
+            len(operation.items)
+            for operation in self.applied
+            if operation.field == field and operation.action == action
+        )
+
+    @property
+    def ok(self):
+        return not self.errors
+
+    def __repr__(self):
+        return "ConnectorSyncReport(applied=%d, errors=%d, requests=%d)" % (
+            len(self.applied),
+            len(self.errors),
+            self.requests,
+        )
+
+
 class Connector(Resource, Countable):
     """Use the Connector resource to manage API activity related to connector entities.
 
@@ -85,3 +153,251 @@ class Connector(Resource, Countable):
 
     phone_numbers = ResourceListingField("phone_numbers", ConnectorNumber)
     callbacks = ResourceListingField("callbacks", ConnectorCallback)
+
+    # Phone numbers and callbacks as last seen on the server, keyed by field.
+    _server_listings = None
+    # Whether phone_numbers holds every number, see load_phone_numbers.
+    _numbers_loaded = False
+
+    def load_phone_numbers(self, limit=SYNC_BATCH_SIZE):
+        """Replaces :attr:`phone_numbers` with every phone number associated
+        with the connector, read page by page from its ``phone_numbers``
+        sub-resource.
+
+        The API lists at most 50 numbers with a connector and sets
+        ``more_numbers`` when it has more. Such a connector's numbers can
+        only be changed and synced once they are all loaded.
+
+        :param limit: Numbers requested per page.
+        :type limit: ``int``.
+        :returns: The :attr:`phone_numbers` listing.
+        :raises: :class:`ResourceError`: If the connector was not loaded
+            from the server.
+        """
+        if self._server_listings is None:
+            raise ResourceError(
+                "Connector must be loaded or saved before its numbers can be loaded"
+            )
+        url = self._item_sub_resource_path(
+            id_=self.id, resource="connectors", subresource="phone_numbers"
+        )
+        numbers = []
+        page = 1
+        while True:
+            response = self.klass.request.get(url, params={"page": page, "limit": limit})
+            body = response.get(self._singular, response)
+            items = body.get("phone_numbers") or []
+            numbers.extend(items)
+            if not items or not body.get("more_numbers", len(items) >= limit):
+                break
+            page += 1
+        self.phone_numbers = numbers
+        self._mark_listing_clean("phone_numbers")
+        self._server_listings["phone_numbers"] = self._listing("phone_numbers")
+        object.__setattr__(self, "_numbers_loaded", True)
+        return self.phone_numbers
+
+    def changes(self):
+        """Compares :attr:`phone_numbers` and :attr:`callbacks` with their
+        state when the connector was loaded or last saved or synced.
+
+        Phone numbers are matched by number or id. A callback whose URL or
+        method changed is removed and added again.
+
+        :returns: :class:`ConnectorOperation` list, removals first, with a
+            single operation per field and action.
+        :raises: :class:`ResourceError`: If the connector was not loaded
+            from the server, or if its phone numbers were changed while
+            it has more than were listed and :meth:`load_phone_numbers` was
+            not called.
+        """
+        if self._server_listings is None:
+            raise ResourceError(
+                "Connector must be loaded or saved before it can be synced"
+            )
+        if (
+            self.attributes.get("more_numbers")
+            and not self._numbers_loaded
+            and "phone_numbers" in self._dirty_attributes()
+        ):
+            raise ResourceError(
+                "Connector has more phone numbers than were listed, "
+                "call load_phone_numbers() before changing them"
+            )
+        removals, additions = [], []
+        for field, diff in (
+            ("phone_numbers", self._number_changes),
+            ("callbacks", self._callback_changes),
+        ):
+            removed, added = diff(self._server_listings[field], self._listing(field))
+            if removed:
+                removals.append(ConnectorOperation(field, "remove", removed))
+            if added:
+                additions.append(ConnectorOperation(field, "add", added))
+        return removals + additions
+
+    def sync(self, batch_size=SYNC_BATCH_SIZE, workers=4):
+        """Applies the :meth:`changes` made to :attr:`phone_numbers` and
+        :attr:`callbacks` through their sub-resources, instead of uploading
+        both listings in full with :meth:`save`.
+
+        Changes are sent in batches of ``batch_size`` items by ``workers``
+        threads, all removals before any addition so that numbers and
+        callbacks can be moved or replaced. Failed batches do not stop the
+        sync; they are reported and left pending for the next one.
+
+        Example moving a number between two connectors::
+
+            source.phone_numbers = [n for n in source.phone_numbers if n.phone_number != number]
+            source.sync()
+            target.phone_numbers.append({"phone_number": number})
+            target.sync()
+
+        :param batch_size: Items sent per request.
+        :type batch_size: ``int``.
+        :param workers: Number of requests made concurrently.
+        :type workers: ``int``.
+        :returns: :class:`ConnectorSyncReport`.
+        :raises: :class:`ResourceError`: If the connector was not loaded
+            from the server.
+        """
+        report = ConnectorSyncReport()
+        lock = threading.Lock()
+        started = time.time()
+
+        def apply(operation):
+            error = None
+            try:
+                self._apply(operation)
+            except Exception as e:
+                error = e
+            with lock:
+                report.requests += 1
+                if error is None:
+                    report.applied.append(operation)
+                else:
+                    report.errors.append((operation, error))
+
+        changes = self.changes()
+        phases = (
+            [op for op in changes if op.action == "remove"],
+            [op for op in changes if op.action == "add"],
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for phase in phases:
+                batches = [
+                    ConnectorOperation(
+                        operation.field,
+                        operation.action,
+                        operation.items[i : i + batch_size],
+                    )
+                    for operation in phase
+                    for i in range(0, len(operation.items), batch_size)
+                ]
+                list(executor.map(apply, batches))
+
+        for operation in report.applied:
+            self._synced(operation)
+        pending = set(operation.field for operation in self.changes())
+        for field in ("phone_numbers", "callbacks"):
+            if field not in pending:
+                self._mark_listing_clean(field)
+        report.elapsed = time.time() - started
+        return report
+
+    def _apply(self, operation):
+        url = self._item_sub_resource_path(
+            id_=self.id, resource="connectors", subresource=operation.field
+        )
+        payload = {self._singular: {operation.field: operation.items}}
+        if operation.action == "add":
+            self.klass.request.post(url, payload=payload)
+        else:
+            self.klass.request.delete(url, payload=payload)
+
+    def _synced(self, operation):
+        state = self._server_listings[operation.field]
+        if operation.action == "add":
+            state.extend(operation.items)
+        else:
+            removed = set(
+                self._identity(operation.field, item) for item in operation.items
+            )
+            state[:] = [
+                item
+                for item in state
+                if self._identity(operation.field, item) not in removed
+            ]
+
+    def _mark_listing_clean(self, field):
+        self.attributes._dirty.discard(field)
+        for item in getattr(self, field):
+            item._mark_clean()
+
+    def _listing(self, field):
+        return [item._to_dict() for item in getattr(self, field)]
+
+    @staticmethod
+    def _identity(field, item):
+        if field == "phone_numbers":
+            return item.get("phone_number") or item.get("phone_number_id")
+        return tuple(item.get(key) for key in _CALLBACK_FIELDS)
+
+    @staticmethod
+    def _number_changes(server, local):
+        def keys(item):
+            return set(
+                (key, item[key]) for key in _NUMBER_KEYS if item.get(key) is not None
+            )
+
+        server_keys = set()
+        for item in server:
+            server_keys |= keys(item)
+        local_keys = set()
+        added = []
+        for item in local:
+            item_keys = keys(item)
+            local_keys |= item_keys
+            if not item_keys & server_keys:
+                added.append(
+                    dict((key, item[key]) for key in _NUMBER_KEYS if key in item)
+                )
+        removed = [
+            dict((key, item[key]) for key in _NUMBER_KEYS if key in item)
+            for item in server
+            if not keys(item) & local_keys
+        ]
+        return removed, added
+
+    @staticmethod
+    def _callback_changes(server, local):
+        def fields(item):
+            return dict((key, item.get(key)) for key in _CALLBACK_FIELDS)
+
+        server_callbacks = [fields(item) for item in server]
+        local_callbacks = [fields(item) for item in local]
+        removed = [item for item in server_callbacks if item not in local_callbacks]
+        added = [item for item in local_callbacks if item not in server_callbacks]
+        return removed, added
+
+    def _remember_listings(self):
+        object.__setattr__(
+            self,
+            "_server_listings",
+            {
+                "phone_numbers": self._listing("phone_numbers"),
+                "callbacks": self._listing("callbacks"),
+            },
+        )
+
+    def _mark_clean(self):
+        super(Connector, self)._mark_clean()
+        # The listing was just read from a response, which is truncated.
+        object.__setattr__(self, "_numbers_loaded", False)
+        self._remember_listings()
+
+    @classmethod
+    def _loaded(cls, attributes, **kwargs):
+        connector = super(Connector, cls)._loaded(attributes, **kwargs)
+        connector._remember_listings()
+        return connector
@@ -0,0 +1,289 @@
+"""
+.. module:: costs
+   :synopsis: Local aggregation of transactions for cost reporting.
+"""
+
+import calendar
+
+from array import array
+from datetime import datetime, timedelta
+
+import six
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from vivialconnect.resources.account import Transaction
+
+# Dimensions transactions can be rolled up by.
+DIMENSIONS = ("transaction_type", "account_id", "day", "hour")
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Hour bucket of transactions without post_time.
+_NO_HOUR = -1
+
+
+class CostTotals(object):
+    """Totals of a group of transactions.
+
+    :ivar count: Number of transactions.
+    :ivar cash_amount: Sum of the cash amounts.
+    :ivar credit_amount: Sum of the credit amounts.
+    :ivar unit_count: Sum of the unit counts.
+    """
+
+    __slots__ = ("count", "cash_amount", "credit_amount", "unit_count")
+
+    def __init__(self, count=0, cash_amount=0, credit_amount=0, unit_count=0):
+        self.count = count
+        self.cash_amount = cash_amount
+        self.credit_amount = credit_amount
+        self.unit_count = unit_count
+
+    def __eq__(self, other):
+        if not isinstance(other, CostTotals):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "CostTotals(count=%d, cash_amount=%r, credit_amount=%r, unit_count=%d)" % (
+            self.count,
+            self.cash_amount,
+            self.credit_amount,
+            self.unit_count,
+        )
+
+
+class TransactionAggregator(object):
+    """Builds cost rollups from any number of transactions.
+
+    Transactions are not kept as objects: each one is reduced to a row of
+    compact columnar arrays (around 40 bytes), with transaction types and
+    accounts dictionary encoded and post times bucketed by hour. Rollups
+    are computed with NumPy when it is installed, in pure Python otherwise.
+
+    Example of a monthly report by type and day::
+
+        from vivialconnect import TransactionAggregator
+
+        costs = TransactionAggregator.from_range(datetime(2020, 11, 1), datetime(2020, 12, 1))
+        for (transaction_type, day), totals in sorted(costs.rollup("transaction_type", "day").items()):
+            print(day, transaction_type, totals.count, totals.cash_amount)
+
+    :param use_numpy: Compute rollups with NumPy. Defaults to ``True`` when
+        NumPy is installed.
+    """
+
+    def __init__(self, use_numpy=None):
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ImportError(
+                "numpy library is required. " + 'Install numpy via "pip install numpy".'
+            )
+        self.use_numpy = use_numpy
+        self._types = []
+        self._type_codes = {}
+        self._accounts = []
+        self._account_codes = {}
+        self._hour_buckets = {}
+        self._type = array("I")
+        self._account = array("I")
+        self._hour = array("q")
+        self._cash = array("d")
+        self._credit = array("d")
+        self._units = array("q")
+
+    @classmethod
+    def from_range(cls, start, end=None, use_numpy=None, **kwargs):
+        """Aggregates the transactions of a time window, streamed with
+        :meth:`Transaction.find_range`.
+
+        :param start: Start of the window (UTC).
+        :param end: End of the window (UTC), defaults to now.
+        :param \\**kwargs: Other arguments of :meth:`Transaction.find_range`.
+        :returns: :class:`TransactionAggregator`.
+        """
+        aggregator = cls(use_numpy=use_numpy)
+        kwargs["raw"] = True
+        aggregator.extend(Transaction.find_range(start, end, **kwargs))
+        return aggregator
+
+    def __len__(self):
+        return len(self._type)
+
+    @property
+    def nbytes(self):
+        """Memory held by the columns, in bytes."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self._type,
+                self._account,
+                self._hour,
+                self._cash,
+                self._credit,
+                self._units,
+            )
+        )
+
+    def add(self, transaction):
+        """Adds a transaction, given as a :class:`Transaction`, a record or
+        the decoded JSON ``dict`` returned with ``raw=True``."""
+        if isinstance(transaction, dict):
+            get = transaction.get
+        else:
+            get = lambda name: getattr(transaction, name, None)
+        # Every value is converted before any column grows, so that a bad
+        # transaction leaves the columns the same length.
+        cash = float(get("cash_amount") or 0)
+        credit = float(get("credit_amount") or 0)
+        units = int(get("unit_count") or 0)
+        hour = self._hour_bucket(get("post_time"))
+        self._type.append(self._code(self._type_codes, self._types, get("transaction_type")))
+        self._account.append(self._code(self._account_codes, self._accounts, get("account_id")))
+        self._hour.append(hour)
+        self._cash.append(cash)
+        self._credit.append(credit)
+        self._units.append(units)
+
+    def extend(self, transactions):
+        """Adds every transaction of an iterable, consuming it lazily."""
+        for transaction in transactions:
+            self.add(transaction)
+        return self
+
+    def totals(self):
+        """Returns the :class:`CostTotals` of every transaction."""
+        return CostTotals(
+            len(self),
+            sum(self._cash),
+            sum(self._credit),
+            sum(self._units),
+        )
+
+    def rollup(self, *dimensions):
+        """Groups transactions and totals each group.
+
+        Keys are ``transaction_type`` names, ``account_id`` values,
+        ``datetime.date`` days or ``datetime.datetime`` hours, all in UTC,
+        or tuples of them when grouping by several dimensions.
+
+        :param \\*dimensions: One or more of ``"transaction_type"``,
+            ``"account_id"``, ``"day"`` and ``"hour"``.
+        :returns: ``dict`` of key to :class:`CostTotals`.
+        """
+        if not dimensions:
+            raise ValueError("At least one dimension is required")
+        for dimension in dimensions:
+            if dimension not in DIMENSIONS:
+                raise ValueError(
+                    "Unknown dimension %s, expected one of %s"
+                    % (dimension, ", ".join(DIMENSIONS))
+                )
+        if not len(self):
+            return {}
+        if self.use_numpy:
+            groups = self._numpy_groups(dimensions)
+        else:
+            groups = self._python_groups(dimensions)
+        decoders = [self._decoder(dimension) for dimension in dimensions]
+        rollup = {}
+        for codes, totals in groups:
+            key = tuple(decode(code) for decode, code in zip(decoders, codes))
+            rollup[key if len(key) > 1 else key[0]] = totals
+        return rollup
+
+    def _python_groups(self, dimensions):
+        columns = [self._codes(dimension) for dimension in dimensions]
+        groups = {}
+        for codes, cash, credit, units in zip(
+            zip(*columns), self._cash, self._credit, self._units
+        ):
+            group = groups.get(codes)
+            if group is None:
+                group = groups[codes] = [0, 0, 0, 0]
+            group[0] += 1
+            group[1] += cash
+            group[2] += credit
+            group[3] += units
+        return [(codes, CostTotals(*group)) for codes, group in six.iteritems(groups)]
+
+    def _numpy_groups(self, dimensions):
+        columns = []
+        for dimension in dimensions:
+            if dimension == "day":
+                column = numpy.frombuffer(self._hour, dtype=self._hour.typecode) // 24
+            else:
+                column = self._codes(dimension)
+                column = numpy.frombuffer(column, dtype=column.typecode)
+            columns.append(column.astype(numpy.int64))
+        keys, inverse = numpy.unique(
+            numpy.stack(columns), axis=1, return_inverse=True
+        )
+        inverse = inverse.reshape(-1)
+        size = keys.shape[1]
+        count = numpy.bincount(inverse, minlength=size)
+        sums = [
+            numpy.bincount(
+                inverse,
+                weights=numpy.frombuffer(column, dtype=column.typecode),
+                minlength=size,
+            )
+            for column in (self._cash, self._credit, self._units)
+        ]
+        return [
+            (
+                tuple(keys[:, i].tolist()),
+                CostTotals(
+                    int(count[i]), float(sums[0][i]), float(sums[1][i]), int(sums[2][i])
+                ),
+            )
+            for i in range(size)
+        ]
+
+    def _codes(self, dimension):
+        if dimension == "transaction_type":
+            return self._type
+        if dimension == "account_id":
+            return self._account
+        if dimension == "hour":
+            return self._hour
+        return [hour // 24 for hour in self._hour]
+
+    def _decoder(self, dimension):
+        if dimension == "transaction_type":
+            return self._types.__getitem__
+        if dimension == "account_id":
+            return self._accounts.__getitem__
+        if dimension == "hour":
+            return lambda hour: None if hour < 0 else _EPOCH + timedelta(hours=hour)
+        return lambda day: None if day < 0 else (_EPOCH + timedelta(days=day)).date()
+
+    @staticmethod
+    def _code(codes, values, value):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def _hour_bucket(self, post_time):
+        """Returns the number of hours between the epoch and ``post_time``,
+        an ISO 8601 date and time like ``2020-12-08T20:14:09.144070``."""
+        if not post_time:
+            return _NO_HOUR
+        if not isinstance(post_time, six.string_types):
+            return int(calendar.timegm(post_time.utctimetuple()) // 3600)
+        prefix = post_time[:13]
+        hour = self._hour_buckets.get(prefix)
+        if hour is None:
+            hour = calendar.timegm(datetime.strptime(prefix, "%Y-%m-%dT%H").timetuple()) // 3600
+            self._hour_buckets[prefix] = hour
+        return hour
@@ -18,3 +18,10 @@ class Countable(object):
         if opts is None:
             opts = kwargs
         return int(Util.remove_root(cls.get(custom_path="/count", **opts)))
+
+    @classmethod
+    async def acount(cls, opts=None, **kwargs):
+        """Coroutine version of :meth:`count`."""
+        if opts is None:
+            opts = kwargs
+        return int(Util.remove_root(await cls.aget(custom_path="/count", **opts)))
@@ -4,6 +4,7 @@
 """
 
 from vivialconnect.resources.resource import Resource
+from vivialconnect.resources.pagination import PageIterator
 
 
 class Log(Resource):
@@ -74,16 +75,78 @@ class Log(Resource):
         return response
 
     @classmethod
-    def find(cls, id_=None, path=None, **kwargs):
+    async def aget_aggregated_logs(
+        cls,
+        start_time,
+        end_time,
+        aggregator_type="minutes",
+        optional_query_parameters=None,
+    ):
+        """Coroutine version of :meth:`get_aggregated_logs`."""
+        query_string = {
+            "start_time": start_time,
+            "end_time": end_time,
+            "aggregator_type": aggregator_type,
+        }
+        if optional_query_parameters is not None:
+            for key, value in optional_query_parameters.items():
+                query_string[key] = value
+        return await Log.aget(custom_path="/aggregate", **query_string)
+
+    @classmethod
+    def find(cls, id_=None, path=None, raw=False, records=False, **kwargs):
         """
              Get logs related to an user account.
 
              This method returns a tuple with the following values:
                 - last_key: Used for pagination. Can be sent with next request as start_key to get next set of results.
-                - logs: list of log entries.
+                - logs: list of log entries, as plain ``dict`` objects when
+                  ``raw`` is set or as immutable records when ``records`` is.
         """
         url = cls._collection_path(path=path, options=None) + cls._query_string(kwargs)
-        response = cls.request.get(url)
+        return cls._build_logs(cls.request.get(url), raw=raw, records=records)
+
+    @classmethod
+    async def afind(cls, id_=None, path=None, raw=False, records=False, **kwargs):
+        """Coroutine version of :meth:`find`."""
+        url = cls._collection_path(path=path, options=None) + cls._query_string(kwargs)
+        return cls._build_logs(
+            await cls.async_request.get(url), raw=raw, records=records
+        )
+
+    @classmethod
+    def stream(cls, start_time, end_time, prefetch=True, cursor=None, **kwargs):
+        """Iterates over every log entry between start_time and end_time,
+        following ``last_key`` from page to page.
+
+        The next page is fetched in the background while the current one is
+        being consumed. The iterator :attr:`~PageIterator.cursor` can be
+        saved and passed back as ``cursor`` to resume after a crash::
+
+            logs = Log.stream("20181101T145548Z", "20181205T155548Z")
+            for log in logs:
+                export(log)
+                checkpoint(logs.cursor)
+
+        :param start_time: Start date and time as YYYYMMDDThhmmssZ.
+        :param end_time: End date and time as YYYYMMDDThhmmssZ.
+        :param prefetch: Fetch the next page in the background.
+        :param cursor: A cursor saved from a previous stream to resume from.
+        :param \\**kwargs: Any of the optional query parameters of :meth:`find`.
+        :returns: :class:`PageIterator` -- an iterator of Log objects.
+        """
+
+        def fetch_page(start_key):
+            query = dict(kwargs, start_time=start_time, end_time=end_time)
+            if start_key:
+                query["start_key"] = start_key
+            last_key, logs = cls.find(**query)
+            return logs, (last_key or None)
+
+        return PageIterator(fetch_page, cursor=cursor, prefetch=prefetch)
+
+    @classmethod
+    def _build_logs(cls, response, raw=False, records=False):
         last_key = response.get("last_key")
-        logs = cls._build_list(response["log_items"])
+        logs = cls._build_list(response["log_items"], raw=raw, records=records)
         return last_key, logs
@@ -61,9 +61,23 @@ class Message(Resource, Countable):
     def send(self):
         """Sends a new message.
         """
+        self._prepare_send()
+        return self.save()
+
+    async def asend(self):
+        """Coroutine version of :meth:`send`."""
+        self._prepare_send()
+        return await self.asave()
+
+    def _prepare_send(self):
         if not hasattr(self, "body") and hasattr(self, "media_urls"):
             setattr(self, "body", "")
-        return self.save()
+
+    def _attachment_path(self, id=None, **kwargs):
+        custom_path = "/attachments/%s" % id if id else "/attachments"
+        return self.klass._custom_path(
+            id_=self.id, custom_path=custom_path, options=None
+        ) + self.klass._query_string(kwargs)
 
     def attachment(self, id, **kwargs):
         """Use this method to view information about a single media attachment
@@ -73,28 +87,43 @@ class Message(Resource, Countable):
         :type id: ``int``.
         :returns: :class:`Resource` -- a Resource object.
         """
-        url = self.klass._custom_path(
-            id_=self.id, custom_path="/attachments/%s" % id, options=None
-        ) + self.klass._query_string(kwargs)
+        url = self._attachment_path(id, **kwargs)
         attachment = Attachment._build_object(Attachment.request.get(url))
         attachment._entity_path = url
         return attachment
 
-    def attachments(self, **kwargs):
+    async def aattachment(self, id, **kwargs):
+        """Coroutine version of :meth:`attachment`."""
+        url = self._attachment_path(id, **kwargs)
+        attachment = Attachment._build_object(await Attachment.async_request.get(url))
+        attachment._entity_path = url
+        return attachment
+
+    def attachments(self, raw=False, **kwargs):
         """Use this method to view the list of attachments for a message in
         your account.
 
+        :param raw: Return the decoded JSON ``dict`` of each attachment.
+        :type raw: ``bool``.
         :param \**kwargs: Any keyword arguments used for forming a query.
         :returns: ``list`` -- a list of Resource objects.
         """
-        url = self.klass._custom_path(
-            id_=self.id, custom_path="/attachments", options=None
-        ) + self.klass._query_string(kwargs)
-        attachments = Attachment._build_list(Attachment.request.get(url))
+        url = self._attachment_path(**kwargs)
+        return self._build_attachments(Attachment.request.get(url), raw, **kwargs)
+
+    async def aattachments(self, raw=False, **kwargs):
+        """Coroutine version of :meth:`attachments`."""
+        url = self._attachment_path(**kwargs)
+        return self._build_attachments(
+            await Attachment.async_request.get(url), raw, **kwargs
+        )
+
+    def _build_attachments(self, response, raw=False, **kwargs):
+        if raw:
+            return Attachment._build_list(response, raw=True)
+        attachments = Attachment._build_list(response)
         for attachment in attachments:
-            attachment._entity_path = self.klass._custom_path(
-                id_=self.id, custom_path="/attachments/%s" % attachment.id, options=None
-            ) + self.klass._query_string(kwargs)
+            attachment._entity_path = self._attachment_path(attachment.id, **kwargs)
         return attachments
 
     def attachments_count(self, opts=None, **kwargs):
@@ -103,13 +132,16 @@ class Message(Resource, Countable):
         """
         if opts is None:
             opts = kwargs
-
-        url = self.klass._custom_path(
-            id_=self.id, custom_path="/attachments/count", options=None
-        ) + self.klass._query_string(opts)
-
+        url = self._attachment_path("count", **opts)
         return Util.remove_root(Attachment.request.get(url))
 
+    async def aattachments_count(self, opts=None, **kwargs):
+        """Coroutine version of :meth:`attachments_count`."""
+        if opts is None:
+            opts = kwargs
+        url = self._attachment_path("count", **opts)
+        return Util.remove_root(await Attachment.async_request.get(url))
+
     def send_bulk(self):
         """Sends a message to multiples recipients.
 
@@ -118,16 +150,25 @@ class Message(Resource, Countable):
 
         If `to_numbers` is not provided a `ValueError` exception will be raised.
         """
+        url, payload = self._send_bulk_request()
+        response = Message.request.post(url, params=payload)
 
+        return response["bulk_id"]
+
+    async def asend_bulk(self):
+        """Coroutine version of :meth:`send_bulk`."""
+        url, payload = self._send_bulk_request()
+        response = await Message.async_request.post(url, params=payload)
+
+        return response["bulk_id"]
+
+    def _send_bulk_request(self):
         if not hasattr(self, "to_numbers"):
             raise ValueError("Property 'to_numbers' is required")
 
         url = self.klass._custom_path(custom_path="/bulk")
         raw_data = self._wrap_attributes()
-        payload = Util.remove_root(raw_data)
-        response = Message.request.post(url, params=payload)
-
-        return response["bulk_id"]
+        return url, Util.remove_root(raw_data)
 
     @classmethod
     def bulk_messages(cls, bulk_id):
@@ -137,12 +178,28 @@ class Message(Resource, Countable):
         response = Message.request.get(url)
         return cls._build_list(response)
 
+    @classmethod
+    async def abulk_messages(cls, bulk_id):
+        """Coroutine version of :meth:`bulk_messages`."""
+        url = cls._custom_path(custom_path=f"/bulk/{bulk_id}")
+        response = await Message.async_request.get(url)
+        return cls._build_list(response)
+
     @classmethod
     def bulks(cls):
         """Returns a list of all bulk send jobs.
         """
         url = cls._custom_path(custom_path="/bulk")
-        response = Message.request.get(url)
+        return cls._build_bulks(Message.request.get(url))
+
+    @classmethod
+    async def abulks(cls):
+        """Coroutine version of :meth:`bulks`."""
+        url = cls._custom_path(custom_path="/bulk")
+        return cls._build_bulks(await Message.async_request.get(url))
+
+    @classmethod
+    def _build_bulks(cls, response):
         bulks_data = list(response.values())[0]
         bulks = []
 
@@ -147,16 +147,29 @@ class Number(Resource, Countable):
     """
 
     @classmethod
-    def available(cls, opts=None, **kwargs):
+    def available(cls, opts=None, raw=False, **kwargs):
         """Lists available phone numbers.
 
         :param opts: Additional query params.
         :type opts: ``dict``.
         :param \**kwargs: You must specify exactly one of the following three keys:
             in_region, area_code, in_postal_code.
+        :param raw: Return the decoded JSON ``dict`` of each number.
+        :type raw: ``bool``.
 
         :returns: :class:`Number` -- a list of available US local or toll-free phone numbers.
         """
+        url, qs = cls._available_request(opts, **kwargs)
+        return cls._build_list(Number.request.get(url, qs), raw=raw)
+
+    @classmethod
+    async def aavailable(cls, opts=None, raw=False, **kwargs):
+        """Coroutine version of :meth:`available`."""
+        url, qs = cls._available_request(opts, **kwargs)
+        return cls._build_list(await Number.async_request.get(url, qs), raw=raw)
+
+    @classmethod
+    def _available_request(cls, opts=None, **kwargs):
         qs = {}
         country_code = "US"
         number_type = "local"
@@ -173,7 +186,7 @@ class Number(Resource, Countable):
         url = cls._custom_path(
             custom_path="/available/{}/{}".format(country_code, number_type)
         )
-        return cls._build_list(Number.request.get(url, qs))
+        return url, qs
 
     def buy(self):
         """Purchases a new phone number.
@@ -182,12 +195,23 @@ class Number(Resource, Countable):
             self.id = None
         return self.save()
 
+    async def abuy(self):
+        """Coroutine version of :meth:`buy`."""
+        if self.id:
+            self.id = None
+        return await self.asave()
+
     def buy_local(self):
         """Purchases a new local phone number.
         """
         self.phone_number_type = "local"
         return self.save()
 
+    async def abuy_local(self):
+        """Coroutine version of :meth:`buy_local`."""
+        self.phone_number_type = "local"
+        return await self.asave()
+
     def remove_tag(self, key):
         """
             Delete a tag from server
@@ -198,6 +222,19 @@ class Number(Resource, Countable):
         response = self.klass.request.delete(
             self._item_sub_resource_path(self.id, self._plural, "tags"), payload=payload
         )
+        return self._update_tags(response)
+
+    async def aremove_tag(self, key):
+        """Coroutine version of :meth:`remove_tag`."""
+        if key not in self.tags:
+            raise ValueError(f"Tag with key '{key}' does not exist")
+        payload = {"tags": {key: ""}}
+        response = await self.klass.async_request.delete(
+            self._item_sub_resource_path(self.id, self._plural, "tags"), payload=payload
+        )
+        return self._update_tags(response)
+
+    def _update_tags(self, response):
         if "phone_number" in response:
             self.tags = response["phone_number"]["tags"]
             return True
@@ -213,6 +250,15 @@ class Number(Resource, Countable):
         options = Util.format_filter_tag_params(options)
         return cls._build_list_from_pagination(Number.request.get(url, options))
 
+    @classmethod
+    async def atagged_numbers(cls, **options):
+        """Coroutine version of :meth:`tagged_numbers`."""
+        url = cls._custom_path(custom_path="/tags")
+        options = Util.format_filter_tag_params(options)
+        return cls._build_list_from_pagination(
+            await Number.async_request.get(url, options)
+        )
+
     @classmethod
     def lookup(cls, phone_number):
         """
@@ -223,5 +269,13 @@ class Number(Resource, Countable):
         response = cls.request.get(url, params)
         return NumberInfo(attributes=response["number_info"])
 
+    @classmethod
+    async def alookup(cls, phone_number):
+        """Coroutine version of :meth:`lookup`."""
+        params = {"phone_number": phone_number}
+        url = cls._custom_path(custom_path="/lookup")
+        response = await cls.async_request.get(url, params)
+        return NumberInfo(attributes=response["number_info"])
+
 
 Number._singular = "phone_number"
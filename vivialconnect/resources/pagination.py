@@ -0,0 +1,91 @@
+"""
+.. module:: pagination
+   :synopsis: Lazy iteration over paginated listings.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PageIterator(object):
+    """Iterates over the items of a paginated listing one page at a time.
+
+    Only the page being consumed (and, with ``prefetch``, the next one) is
+    held in memory. The position of the iterator is available as
+    :attr:`cursor` and can be passed back to resume iteration later.
+
+    :param fetch_page: Callable taking a page token and returning a
+        ``(items, next_token)`` tuple, ``next_token`` being ``None`` on the
+        last page.
+    :param start: Token of the first page to fetch.
+    :param cursor: A cursor previously returned by :attr:`cursor`. Takes
+        precedence over ``start``.
+    :param prefetch: Fetch the next page in a background thread while the
+        current one is being consumed.
+    """
+
+    def __init__(self, fetch_page, start=None, cursor=None, prefetch=False):
+        self._fetch_page = fetch_page
+        self._token = start
+        self._offset = 0
+        if cursor:
+            self._token = cursor["page"]
+            self._offset = cursor["offset"]
+        self._items = None
+        self._next_token = None
+        self._pending = None
+        self._executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        self._done = False
+
+    def __iter__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def cursor(self):
+        """A JSON serializable checkpoint of the iterator position, or
+        ``None`` once the listing is exhausted."""
+        if self._done:
+            return None
+        return {"page": self._token, "offset": self._offset}
+
+    def close(self):
+        """Stops iteration and the background prefetch thread, if any."""
+        self._done = True
+        self._items = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _load_page(self):
+        if self._pending is not None:
+            items, next_token = self._pending.result()
+            self._pending = None
+        else:
+            items, next_token = self._fetch_page(self._token)
+        self._items = items
+        self._next_token = next_token
+        if self._executor is not None and next_token is not None:
+            self._pending = self._executor.submit(self._fetch_page, next_token)
+
+    def __next__(self):
+        while not self._done:
+            if self._items is None:
+                self._load_page()
+            if self._offset < len(self._items):
+                item = self._items[self._offset]
+                self._offset += 1
+                return item
+            if self._next_token is None:
+                self.close()
+                break
+            self._token = self._next_token
+            self._offset = 0
+            self._items = None
+        raise StopIteration
+
+    next = __next__
@@ -0,0 +1,72 @@
+"""
+.. module:: record
+   :synopsis: Compact read-only records for listing results.
+"""
+
+import re
+import keyword
+
+from collections import namedtuple
+
+import six
+
+# Names a record field can have: identifiers not starting with an underscore.
+_FIELD_NAME = re.compile(r"[A-Za-z][A-Za-z0-9_]*\Z")
+
+
+class Record(tuple):
+    """Base class of the immutable records returned by ``find(records=True)``.
+
+    A record type is generated per resource class and set of fields. Each
+    record is a named tuple without instance ``__dict__``, so it takes a
+    fraction of the memory of a :class:`Resource`. Fields are read as
+    attributes, and reading a field the resource did not have raises
+    ``AttributeError`` just like on a :class:`Resource`. Nested objects are
+    kept as plain ``dict`` and ``list`` values. Objects having a field that
+    cannot be an attribute name, like ``from`` or ``_links``, are returned
+    as :class:`Resource` objects instead.
+    """
+
+    __slots__ = ()
+
+    _singular = None
+
+    def __repr__(self):
+        return "%s(%s)" % (self._singular, getattr(self, "id", None))
+
+    def _to_dict(self):
+        return dict(zip(self._fields, self))
+
+
+def valid_field_names(field_names):
+    """Tells whether every name of ``field_names`` can be a record field."""
+    for name in field_names:
+        if (
+            not isinstance(name, six.string_types)
+            or not _FIELD_NAME.match(name)
+            or keyword.iskeyword(name)
+        ):
+            return False
+    return True
+
+
+def record_type(resource_class, field_names):
+    """Creates the record type of ``resource_class`` holding ``field_names``.
+
+    :param resource_class: The :class:`Resource` subclass the records stand for.
+    :param field_names: ``tuple`` of field names, in the order values are
+        passed to the record constructor.
+    :returns: a :class:`Record` subclass.
+    :raises ValueError: if a field name is not valid, see
+        :func:`valid_field_names`.
+    """
+    fields = namedtuple(resource_class.__name__ + "Fields", field_names)
+    return type(
+        resource_class.__name__ + "Record",
+        (Record, fields),
+        {
+            "__slots__": (),
+            "__module__": resource_class.__module__,
+            "_singular": resource_class._singular,
+        },
+    )
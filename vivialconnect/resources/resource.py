@@ -5,13 +5,18 @@
 # Inspired by https://github.com/Shopify/pyactiveresource
 
 import sys
+import threading
 
 from collections import MutableSequence, MutableMapping
 from itertools import chain
 
 from vivialconnect.common.requestor import Requestor
+from vivialconnect.common.async_requestor import AsyncRequestor
+from vivialconnect.common.cache import NOT_MODIFIED
 from vivialconnect.common.error import ResourceError
 from vivialconnect.common.util import Util
+from vivialconnect.resources.pagination import PageIterator
+from vivialconnect.resources.record import record_type, valid_field_names
 import six
 
 
@@ -19,6 +24,37 @@ class BaseField(object):
     pass
 
 
+# Marks attribute names missing from an attribute storage.
+_MISSING = object()
+
+
+class _AttributeAccessor(object):
+    """Reads a resource attribute from its attribute storage.
+
+    Accessors are added to a resource class for each attribute name read or
+    written on its instances, so that reading the attribute again does not
+    go through :meth:`Resource.__getattr__`. They define no ``__set__`` so
+    that values in the instance ``__dict__`` keep precedence.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, obj_type=None):
+        if obj is None:
+            return self
+        value = obj.__dict__["attributes"]._items.get(self.name, _MISSING)
+        if value is _MISSING:
+            raise AttributeError(self.name)
+        return value
+
+
+# Instance attributes of resources which must never get an accessor.
+_RESERVED_NAMES = frozenset(("klass", "attributes", "parent_resource"))
+
+
 class ResourceAttributeStorage(MutableMapping):
     def __init__(self, parent, attributes=None, backing_type=dict):
         if not isinstance(parent, Resource):
@@ -26,14 +62,23 @@ class ResourceAttributeStorage(MutableMapping):
         self.parent_resource = parent
         self._items = backing_type()
         self._fields = parent.declared_fields
+        self._dirty = set()
         if isinstance(attributes, dict):
-            self.update(attributes)
+            for key, value in six.iteritems(attributes):
+                if key in self._fields:
+                    setattr(parent, key, value)
+                else:
+                    self._items[key] = value
+            self._dirty.update(attributes)
 
     def __getitem__(self, key):
         if key in self._fields:
             return getattr(self.parent_resource, key)
         return self._items[key]
 
+    def __contains__(self, key):
+        return key in self._items or key in self._fields
+
     def __iter__(self):
         return chain(self._items, self._fields)
 
@@ -44,12 +89,47 @@ class ResourceAttributeStorage(MutableMapping):
         if key in self._fields:
             delattr(self.parent_resource, key)
         del self._items[key]
+        self._dirty.discard(key)
 
     def __setitem__(self, key, value):
         if key in self._fields:
             setattr(self.parent_resource, key, value)
         else:
             self._items[key] = value
+        self._dirty.add(key)
+
+    @property
+    def dirty(self):
+        """Names of the attributes set since the resource was last loaded
+        or saved."""
+        return frozenset(self._dirty)
+
+    def mark_dirty(self, key):
+        """Flags an attribute as modified, e.g. after changing a ``dict``
+        or ``list`` value in place."""
+        self._dirty.add(key)
+
+    def mark_clean(self):
+        self._dirty.clear()
+
+
+# Class attributes the URL paths of a resource class are built from.
+_PATH_ATTRIBUTES = frozenset(("_api_account_id", "_plural", "API_ACCOUNT_PREFIX"))
+
+
+class _PathTemplates(object):
+    """The URL path parts of a resource class that do not change from one
+    request to the next: the account prefix and the plural name segment.
+
+    Built when the class is created and rebuilt whenever one of the class
+    attributes in ``_PATH_ATTRIBUTES`` changes.
+    """
+
+    __slots__ = ("account", "plural")
+
+    def __init__(self, klass):
+        self.account = klass.API_ACCOUNT_PREFIX % {"account_id": klass._api_account_id}
+        self.plural = "/" + klass._plural
 
 
 class ResourceMeta(type):
@@ -63,13 +143,42 @@ class ResourceMeta(type):
             new_attrs["_singular"] = Util.underscore(name)
         if "_plural" not in new_attrs or not new_attrs["_plural"]:
             new_attrs["_plural"] = Util.pluralize(new_attrs["_singular"])
+        # Whether names assigned on instances are class attributes, see
+        # Resource.__setattr__. Cleared whenever a class attribute is set.
+        new_attrs["_class_attrs"] = {}
         klass = type.__new__(mcs, name, bases, new_attrs)
         klass._fields = {}
+        for base in reversed(bases):
+            klass._fields.update(getattr(base, "_fields", {}))
+        # Classes resolved by _find_class_for, keyed by lookup arguments.
+        klass._class_cache = {}
+        klass._class_cache_lock = threading.Lock()
+        # Record types built by _build_record, keyed by field names, or None
+        # for field names a record cannot hold.
+        klass._record_types = {}
         for attr, val in new_attrs.items():
             if isinstance(val, BaseField):
                 klass._fields[attr] = val
+        klass._paths = _PathTemplates(klass)
         return klass
 
+    def __setattr__(cls, name, value):
+        type.__setattr__(cls, name, value)
+        cls._clear_class_attrs(name in _PATH_ATTRIBUTES)
+
+    def __delattr__(cls, name):
+        type.__delattr__(cls, name)
+        cls._clear_class_attrs(name in _PATH_ATTRIBUTES)
+
+    def _clear_class_attrs(cls, paths=False):
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            klass.__dict__["_class_attrs"].clear()
+            if paths:
+                type.__setattr__(klass, "_paths", _PathTemplates(klass))
+            classes.extend(klass.__subclasses__())
+
     def get_plural(cls):
         return cls._plural
 
@@ -108,6 +217,8 @@ class ResourceMeta(type):
         super_class = cls.__mro__[1]
         if super_class == object or "_request" in cls.__dict__:
             if cls._request is None:
+                session = cls.__dict__.get("_pooled_session")
+                cls._pooled_session = None
                 cls._request = Requestor(
                     api_key=cls.api_key,
                     api_secret=cls.api_secret,
@@ -115,16 +226,76 @@ class ResourceMeta(type):
                     api_account_id=cls.api_account_id,
                     verify_request=cls._verify_request,
                     request_timeout=cls._request_timeout,
+                    pool_connections=cls._pool_connections,
+                    pool_maxsize=cls._pool_maxsize,
+                    pool_idle_timeout=cls._pool_idle_timeout,
+                    session=session,
+                    rate_limiter=cls._rate_limiter,
+                    retry_policy=cls._retry_policy,
+                    cache=cls._response_cache,
+                    validators=cls._validator_store,
+                    single_flight=cls._single_flight,
                 )
             return cls._request
         else:
             return super_class.request
 
+    @property
+    def async_request(cls):
+        super_class = cls.__mro__[1]
+        if super_class == object or "_async_request" in cls.__dict__:
+            if cls._async_request is None:
+                transport = cls.__dict__.get("_async_transport")
+                cls._async_transport = None
+                cls._async_request = AsyncRequestor(
+                    api_key=cls.api_key,
+                    api_secret=cls.api_secret,
+                    api_base_url=cls.api_base_url,
+                    api_account_id=cls.api_account_id,
+                    verify_request=cls._verify_request,
+                    request_timeout=cls._request_timeout,
+                    pool_connections=cls._pool_connections,
+                    pool_maxsize=cls._pool_maxsize,
+                    pool_idle_timeout=cls._pool_idle_timeout,
+                    transport=transport,
+                    rate_limiter=cls._rate_limiter,
+                    retry_policy=cls._retry_policy,
+                    cache=cls._response_cache,
+                    validators=cls._validator_store,
+                    single_flight=cls._single_flight,
+                )
+            return cls._async_request
+        else:
+            return super_class.async_request
+
+    def _reset_request(cls, keep_session=True):
+        """Drops the current requestor so that it is rebuilt with the new
+        configuration on next use.
+
+        The pooled HTTP session is handed over to the next requestor unless
+        ``keep_session`` is ``False``, in which case it is closed.
+        """
+        async_request = cls.__dict__.get("_async_request")
+        cls._async_request = None
+        if async_request is not None:
+            cls._async_transport = async_request.transport
+        request = cls.__dict__.get("_request")
+        cls._request = None
+        if request is None:
+            return
+        session = request.detach_session()
+        if session is None:
+            return
+        if keep_session:
+            cls._pooled_session = session
+        else:
+            session.close()
+
     def get_api_key(cls):
         return cls._api_key
 
     def set_api_key(cls, value):
-        cls._request = None
+        cls._reset_request()
         cls._api_key = value
 
     api_key = property(
@@ -135,7 +306,7 @@ class ResourceMeta(type):
         return cls._api_secret
 
     def set_api_secret(cls, value):
-        cls._request = None
+        cls._reset_request()
         cls._api_secret = value
 
     api_secret = property(
@@ -149,7 +320,7 @@ class ResourceMeta(type):
         return cls._api_account_id
 
     def set_api_account_id(cls, value):
-        cls._request = None
+        cls._reset_request()
         cls._api_account_id = value
 
     api_account_id = property(
@@ -160,7 +331,7 @@ class ResourceMeta(type):
         return cls._api_base_url
 
     def set_api_base_url(cls, value):
-        cls._request = None
+        cls._reset_request()
         cls._api_base_url = value
 
     api_base_url = property(
@@ -174,7 +345,7 @@ class ResourceMeta(type):
         return cls._verify_request
 
     def set_verify_request(cls, value):
-        cls._request = None
+        cls._reset_request()
         cls._verify_request = value
 
     api_verify_request = property(
@@ -191,12 +362,126 @@ class ResourceMeta(type):
         get_request_timeout, set_request_timeout, None, "Request Timeout"
     )
 
+    def get_rate_limiter(cls):
+        return cls._rate_limiter
+
+    def set_rate_limiter(cls, value):
+        cls._reset_request()
+        cls._rate_limiter = value
+
+    rate_limiter = property(
+        get_rate_limiter,
+        set_rate_limiter,
+        None,
+        "A RateLimiter shared by the requests of this resource type",
+    )
+
+    def get_retry_policy(cls):
+        return cls._retry_policy
+
+    def set_retry_policy(cls, value):
+        cls._reset_request()
+        cls._retry_policy = value
+
+    retry_policy = property(
+        get_retry_policy,
+        set_retry_policy,
+        None,
+        "A RetryPolicy applied to the requests of this resource type",
+    )
+
+    def get_response_cache(cls):
+        return cls._response_cache
+
+    def set_response_cache(cls, value):
+        cls._reset_request()
+        cls._response_cache = value
+
+    response_cache = property(
+        get_response_cache,
+        set_response_cache,
+        None,
+        "A ResponseCache shared by the GET requests of this resource type",
+    )
+
+    def get_validators(cls):
+        return cls._validator_store
+
+    def set_validators(cls, value):
+        cls._reset_request()
+        cls._validator_store = value
+
+    validators = property(
+        get_validators,
+        set_validators,
+        None,
+        "A ValidatorStore making the GET requests of this resource type conditional",
+    )
+
+    def get_single_flight(cls):
+        return cls._single_flight
+
+    def set_single_flight(cls, value):
+        cls._reset_request()
+        cls._single_flight = value
+
+    single_flight = property(
+        get_single_flight,
+        set_single_flight,
+        None,
+        "A SingleFlight coalescing concurrent identical GET requests",
+    )
+
+    def get_pool_connections(cls):
+        return cls._pool_connections
+
+    def set_pool_connections(cls, value):
+        cls._reset_request(keep_session=False)
+        cls._pool_connections = value
+
+    pool_connections = property(
+        get_pool_connections,
+        set_pool_connections,
+        None,
+        "Number of per-host connection pools to cache",
+    )
+
+    def get_pool_maxsize(cls):
+        return cls._pool_maxsize
+
+    def set_pool_maxsize(cls, value):
+        cls._reset_request(keep_session=False)
+        cls._pool_maxsize = value
+
+    pool_maxsize = property(
+        get_pool_maxsize,
+        set_pool_maxsize,
+        None,
+        "Maximum number of keep-alive connections per host",
+    )
+
+    def get_pool_idle_timeout(cls):
+        return cls._pool_idle_timeout
+
+    def set_pool_idle_timeout(cls, value):
+        cls._reset_request()
+        cls._pool_idle_timeout = value
+
+    pool_idle_timeout = property(
+        get_pool_idle_timeout,
+        set_pool_idle_timeout,
+        None,
+        "Seconds a pooled session may stay idle before it is recycled",
+    )
+
 
 class Resource(six.with_metaclass(ResourceMeta, object)):
     """This class represents a base :class:`Resource` object.
     """
 
     _request = None
+    _async_request = None
+    _async_transport = None
     _api_key = None
     _api_secret = None
     _api_account_id = None
@@ -204,6 +489,19 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
     _verify_request = True
     _primary_key = "id"
     _request_timeout = 30
+    _pool_connections = None
+    _pool_maxsize = None
+    _pool_idle_timeout = None
+    _pooled_session = None
+    _rate_limiter = None
+    _retry_policy = None
+    _response_cache = None
+    _validator_store = None
+    _single_flight = None
+    # Validators of the response this object was last loaded from.
+    _response_validators = None
+    # Send only the modified attributes when updating a resource.
+    partial_updates = True
 
     API_ACCOUNT_PREFIX = "/accounts/%(account_id)s"
 
@@ -220,37 +518,121 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
 
     # Public class methods which act as factory functions
     @classmethod
-    def find(cls, id_=None, path=None, **kwargs):
+    def find(cls, id_=None, path=None, raw=False, records=False, **kwargs):
         """Find resources.
 
         :param id_: A specific resource to retrieve.
         :type id_: ``int``.
         :param path: The path that resources will be fetched from.
         :type path: ``str``.
+        :param raw: Return the decoded JSON ``dict`` of each resource instead
+            of Resource objects. Much cheaper for large read-only listings.
+        :type raw: ``bool``.
+        :param records: Return immutable :class:`~vivialconnect.resources.record.Record`
+            objects instead of Resource objects. They take a fraction of the
+            memory and are meant for holding large listings.
+        :type records: ``bool``.
         :param \**kwargs: Any keyword arguments used for forming a query.
         :returns: :class:`Resource` -- a Resource object.
         :raises: :class:`RequestorError`: On any communications errors.
                  :class:`ResourceError`: On any other errors.
         """
         if id_:
-            return cls._find_single(id_, path=path, **kwargs)
-        return cls._find_every(path=path, **kwargs)
+            return cls._find_single(id_, path=path, raw=raw, records=records, **kwargs)
+        return cls._find_every(path=path, raw=raw, records=records, **kwargs)
 
     @classmethod
-    def find_first(cls, path=None, **kwargs):
+    def find_first(cls, path=None, raw=False, records=False, **kwargs):
         """Find first available resource from the list.
 
         :param path: The path that resources will be fetched from.
         :type path: ``str``.
+        :param raw: Return the decoded JSON ``dict`` instead of a Resource.
+        :type raw: ``bool``.
+        :param records: Return an immutable record instead of a Resource.
+        :type records: ``bool``.
         :param \**kwargs: Any keyword arguments used for forming a query. Valid query keywords include: search, order, limit, page
         :returns: The first found resource from the list of returned resources, otherwise ``None``.
         :raises: :class:`RequestorError`: On any communications errors.
                  :class:`ResourceError`: On any other errors.
         """
-        resources = cls._find_every(path=path, **kwargs)
+        resources = cls._find_every(path=path, raw=raw, records=records, **kwargs)
         if resources:
             return resources[0]
 
+    @classmethod
+    def iter_all(cls, path=None, page_size=50, prefetch=False, cursor=None, **kwargs):
+        """Lazily iterates over every resource matching a query, across pages.
+
+        Pages of ``page_size`` resources are requested one at a time, so
+        only one page (two with ``prefetch``) is held in memory.
+
+        Example resuming an interrupted walk over all messages::
+
+            messages = Message.iter_all(page_size=100, cursor=saved_cursor)
+            for message in messages:
+                process(message)
+                saved_cursor = messages.cursor
+
+        :param path: The path that resources will be fetched from.
+        :type path: ``str``.
+        :param page_size: Number of resources requested per page.
+        :type page_size: ``int``.
+        :param prefetch: Fetch the next page in the background while the
+            current one is being consumed.
+        :type prefetch: ``bool``.
+        :param cursor: A cursor saved from a previous iterator to resume from.
+        :type cursor: ``dict``.
+        :param \\**kwargs: Any keyword arguments used for forming a query.
+        :returns: :class:`PageIterator` -- an iterator of Resource objects.
+        """
+
+        def fetch_page(page):
+            resources = cls.find(path=path, page=page, limit=page_size, **kwargs)
+            return resources, (page + 1 if len(resources) >= page_size else None)
+
+        return PageIterator(fetch_page, start=1, cursor=cursor, prefetch=prefetch)
+
+    @classmethod
+    def find_stream(cls, path=None, root=None, raw=False, records=False, **kwargs):
+        """Iterates over a listing while its response is being downloaded.
+
+        Resources are decoded and built one at a time from the response
+        body, so very large listings are walked with constant memory
+        instead of being loaded in full like :meth:`find` does. The stream
+        is closed once exhausted; close the returned generator to abandon
+        it early. Streamed requests are not cached nor retried.
+
+        :param path: The path that resources will be fetched from.
+        :type path: ``str``.
+        :param root: Name of the response member holding the listing.
+            Defaults to the first array of the response.
+        :type root: ``str``.
+        :param raw: Yield the decoded JSON ``dict`` of each resource.
+        :type raw: ``bool``.
+        :param records: Yield immutable records instead of Resource objects.
+        :type records: ``bool``.
+        :param \\**kwargs: Any keyword arguments used for forming a query.
+        :returns: A generator of Resource objects.
+        :raises: :class:`RequestorError`: On any communications errors.
+                 :class:`ResourceError`: On any other errors.
+        """
+        url = cls._collection_path(path=path, options=None) + cls._query_string(kwargs)
+        stream = cls.request.get_stream(url, root=root)
+        return cls._build_stream(stream, raw=raw, records=records)
+
+    @classmethod
+    def _build_stream(cls, stream, raw=False, records=False):
+        with stream:
+            for element in stream:
+                element = Util.remove_root(element)
+                if raw:
+                    yield element
+                elif records:
+                    yield cls._build_record(element)
+                else:
+                    yield cls._loaded(element)
+
     @classmethod
     def create(cls, attributes):
         """Creates and saves a resource with the given attributes.
@@ -263,37 +645,138 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
         resource.save()
         return resource
 
-    def save(self):
+    @classmethod
+    async def afind(cls, id_=None, path=None, raw=False, records=False, **kwargs):
+        """Coroutine version of :meth:`find`."""
+        if id_:
+            return await cls._afind_single(
+                id_, path=path, raw=raw, records=records, **kwargs
+            )
+        return await cls._afind_every(path=path, raw=raw, records=records, **kwargs)
+
+    @classmethod
+    async def afind_first(cls, path=None, raw=False, records=False, **kwargs):
+        """Coroutine version of :meth:`find_first`."""
+        resources = await cls._afind_every(
+            path=path, raw=raw, records=records, **kwargs
+        )
+        if resources:
+            return resources[0]
+
+    @classmethod
+    async def acreate(cls, attributes):
+        """Coroutine version of :meth:`create`."""
+        resource = cls(attributes)
+        await resource.asave()
+        return resource
+
+    def _save_request(self, full=False):
+        if self.id:
+            if full or not self.partial_updates:
+                attributes = self._wrap_attributes(root=self._singular)
+            else:
+                dirty = self._dirty_attributes()
+                if not dirty:
+                    return None
+                attributes = {self._singular: self._to_dict(dirty)}
+            return (
+                "put",
+                self._element_path(self.id, path=None, options=self._prefix_options),
+                attributes,
+            )
+        attributes = self._wrap_attributes(root=self._singular)
+        return (
+            "post",
+            self._collection_path(path=None, options=self._prefix_options),
+            attributes,
+        )
+
+    def save(self, full=False):
         """Saves :class:`Resource` object to the server.
 
+        Updates of existing resources only send the attributes set since
+        the object was loaded or last saved, and no request is made when
+        nothing changed. Changes made in place to ``dict`` or ``list``
+        values are not detected: assign the value again, or flag it with
+        ``attributes.mark_dirty(name)``.
+
+        :param full: Send every attribute, as when :attr:`partial_updates`
+            is ``False``.
+        :type full: ``bool``.
         :returns: ``True`` on success, or throws an error.
         :raises: :class:`RequestorError`: On any communications errors.
             :class:`ResourceError`: On any other errors.
         """
-        attributes = self._wrap_attributes(root=self._singular)
-        if self.id:
-            response = self.klass.request.put(
-                self._element_path(self.id, path=None, options=self._prefix_options),
-                payload=attributes,
-            )
-        else:
-            response = self.klass.request.post(
-                self._collection_path(path=None, options=self._prefix_options),
-                payload=attributes,
-            )
+        request = self._save_request(full)
+        if request is None:
+            return True
+        method, url, attributes = request
+        response = self.klass.request.request(method, url, payload=attributes)
+        self._update(Util.remove_root(response))
+        self._mark_clean()
+        return True
+
+    async def asave(self, full=False):
+        """Coroutine version of :meth:`save`."""
+        request = self._save_request(full)
+        if request is None:
+            return True
+        method, url, attributes = request
+        response = await self.klass.async_request.request(
+            method, url, payload=attributes
+        )
         self._update(Util.remove_root(response))
+        self._mark_clean()
         return True
 
     def reload(self):
         """Reloads :class:`Resource` object from the server.
 
+        When :attr:`validators` is set the request is conditional, and an
+        object without unsaved changes is left untouched if the server copy
+        has not changed since it was loaded. Unsaved changes are always
+        replaced by the server copy.
+
         :raises: :class:`RequestorError`: On any communications errors.
             :class:`ResourceError`: On any other errors.
         """
-        attributes = self.klass.request.get(
-            self._element_path(self.id, path=None, options=self._prefix_options)
+        request = self.klass.request
+        url = self._element_path(self.id, path=None, options=self._prefix_options)
+        if request.validators is None:
+            self._update(Util.remove_root(request.get(url)))
+            self._mark_clean()
+            return
+        attributes, validators = request.get_if_modified(
+            url, validators=self._reload_validators()
         )
-        self._update(attributes)
+        self._reloaded(attributes, validators)
+
+    async def areload(self):
+        """Coroutine version of :meth:`reload`."""
+        request = self.klass.async_request
+        url = self._element_path(self.id, path=None, options=self._prefix_options)
+        if request.validators is None:
+            self._update(Util.remove_root(await request.get(url)))
+            self._mark_clean()
+            return
+        attributes, validators = await request.get_if_modified(
+            url, validators=self._reload_validators()
+        )
+        self._reloaded(attributes, validators)
+
+    def _reload_validators(self):
+        # A dirty object must be reset, so it is not reloaded conditionally;
+        # the validator store still makes the request conditional and
+        # returns the body it remembers when the server answers 304.
+        if self.is_dirty():
+            return None
+        return self._response_validators
+
+    def _reloaded(self, attributes, validators):
+        object.__setattr__(self, "_response_validators", validators)
+        if attributes is not NOT_MODIFIED:
+            self._update(Util.remove_root(attributes))
+            self._mark_clean()
 
     def destroy(self):
         """Deletes :class:`Resource` object from the server.
@@ -305,6 +788,12 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
             self._element_path(self.id, path=None, options=self._prefix_options)
         )
 
+    async def adestroy(self):
+        """Coroutine version of :meth:`destroy`."""
+        await self.klass.async_request.delete(
+            self._element_path(self.id, path=None, options=self._prefix_options)
+        )
+
     def is_new(self):
         """Returns True if resource is new and have not been saved.
 
@@ -312,6 +801,50 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
         """
         return not self.id
 
+    def is_dirty(self):
+        """Returns True if resource has changes which have not been saved.
+
+        :returns: ``True`` if any attribute, including those of nested
+            resources, was set since the resource was loaded or saved.
+        """
+        if self.attributes._dirty:
+            return True
+        return any(_has_dirty(value) for value in six.itervalues(self.attributes))
+
+    def _dirty_attributes(self):
+        dirty = set(self.attributes._dirty)
+        for key, value in six.iteritems(self.attributes):
+            if key not in dirty and _has_dirty(value):
+                dirty.add(key)
+        return dirty
+
+    def _mark_clean(self):
+        """Forgets pending changes of the resource and its nested resources."""
+        self.attributes.mark_clean()
+        for value in six.itervalues(self.attributes):
+            if isinstance(value, Resource):
+                value._mark_clean()
+            elif isinstance(value, MutableSequence):
+                for item in value:
+                    if isinstance(item, Resource):
+                        item._mark_clean()
+
+    @classmethod
+    def _loaded(cls, attributes, **kwargs):
+        """Builds a resource from a server response, with no pending changes."""
+        resource = cls(attributes, **kwargs)
+        resource.attributes._dirty.clear()
+        # Only declared fields turn nested values into resources on creation.
+        for name in cls._fields:
+            value = getattr(resource, name)
+            if isinstance(value, Resource):
+                value._mark_clean()
+            elif isinstance(value, MutableSequence):
+                for item in value:
+                    if isinstance(item, Resource):
+                        item._mark_clean()
+        return resource
+
     @classmethod
     def get(cls, id_=None, path=None, custom_path="", **kwargs):
         url = cls._custom_path(
@@ -327,35 +860,104 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
         return cls.request.post(url, params=params)
 
     @classmethod
-    def _find_single(cls, id_, path=None, **kwargs):
+    async def aget(cls, id_=None, path=None, custom_path="", **kwargs):
+        """Coroutine version of :meth:`get`."""
+        url = cls._custom_path(
+            id_=id_, path=path, custom_path=custom_path, options=None
+        ) + cls._query_string(kwargs)
+        return await cls.async_request.get(url)
+
+    @classmethod
+    async def apost(cls, id_=None, path=None, custom_path="", params=None, **kwargs):
+        """Coroutine version of :meth:`post`."""
+        url = cls._custom_path(
+            id_=id_, path=path, custom_path=custom_path, options=None
+        ) + cls._query_string(kwargs)
+        return await cls.async_request.post(url, params=params)
+
+    @classmethod
+    def _find_single(cls, id_, path=None, raw=False, records=False, **kwargs):
         url = cls._element_path(id_, path=path, options=None) + cls._query_string(
             kwargs
         )
-        response = cls.request.get(url)
-        return cls._build_object(response)
+        if cls.request.validators is None or raw or records:
+            response = cls.request.get(url)
+            return cls._build_object(response, raw=raw, records=records)
+        response, validators = cls.request.get_if_modified(url)
+        resource = cls._build_object(response)
+        object.__setattr__(resource, "_response_validators", validators)
+        return resource
 
     @classmethod
-    def _find_every(cls, path=None, root=None, **kwargs):
+    async def _afind_single(cls, id_, path=None, raw=False, records=False, **kwargs):
+        url = cls._element_path(id_, path=path, options=None) + cls._query_string(
+            kwargs
+        )
+        request = cls.async_request
+        if request.validators is None or raw or records:
+            response = await request.get(url)
+            return cls._build_object(response, raw=raw, records=records)
+        response, validators = await request.get_if_modified(url)
+        resource = cls._build_object(response)
+        object.__setattr__(resource, "_response_validators", validators)
+        return resource
+
+    @classmethod
+    def _find_every(
+        cls, path=None, root=None, raw=False, records=False, **kwargs
+    ):
         url = cls._collection_path(path=path, options=None) + cls._query_string(kwargs)
         response = cls.request.get(url)
         if root and root in response:
             response = response[root]
-        return cls._build_list(response)
+        return cls._build_list(response, raw=raw, records=records)
 
     @classmethod
-    def _build_object(cls, attributes):
-        return cls(Util.remove_root(attributes))
+    async def _afind_every(
+        cls, path=None, root=None, raw=False, records=False, **kwargs
+    ):
+        url = cls._collection_path(path=path, options=None) + cls._query_string(kwargs)
+        response = await cls.async_request.get(url)
+        if root and root in response:
+            response = response[root]
+        return cls._build_list(response, raw=raw, records=records)
 
     @classmethod
-    def _build_list(cls, attributes):
-        resources = []
+    def _build_object(cls, attributes, raw=False, records=False):
+        if raw:
+            return Util.remove_root(attributes)
+        if records:
+            return cls._build_record(Util.remove_root(attributes))
+        return cls._loaded(Util.remove_root(attributes))
+
+    @classmethod
+    def _build_list(cls, attributes, raw=False, records=False):
         elements = Util.remove_root(attributes)
         if isinstance(elements, dict):
             elements = [elements]
+        if raw:
+            return [Util.remove_root(element) for element in elements]
+        if records:
+            build = cls._build_record
+            return [build(Util.remove_root(element)) for element in elements]
+        resources = []
         for element in elements:
-            resources.append(cls(Util.remove_root(element)))
+            resources.append(cls._loaded(Util.remove_root(element)))
         return resources
 
+    @classmethod
+    def _build_record(cls, element):
+        fields = tuple(element)
+        try:
+            klass = cls._record_types[fields]
+        except KeyError:
+            klass = record_type(cls, fields) if valid_field_names(fields) else None
+            klass = cls._record_types.setdefault(fields, klass)
+        if klass is None:
+            # Some field cannot be read as an attribute of a record.
+            return cls._loaded(element)
+        return klass(*element.values())
+
     def _update(self, attributes):
         if not isinstance(attributes, dict):
             return
@@ -363,7 +965,7 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
             desc = self.declared_fields.get(key)
             if isinstance(value, dict):
                 klass = self._find_class_for(key)
-                attr = klass(value)
+                attr = klass._loaded(value)
             elif isinstance(value, list):
                 klass = None
                 attr = []
@@ -377,9 +979,9 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
                                 # Guess the subclass
                                 klass = self._find_class_for_collection(key)
                         if issubclass(klass, SubordinateResource):
-                            attr.append(klass(child, parent_resource=self))
+                            attr.append(klass._loaded(child, parent_resource=self))
                         else:
-                            attr.append(klass(child))
+                            attr.append(klass._loaded(child))
                     else:
                         attr.append(child)
                 if klass and issubclass(klass, SubordinateResource):
@@ -391,10 +993,33 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
 
     @classmethod
     def _find_class_for_collection(cls, collection_name):
-        return cls._find_class_for(Util.singularize(collection_name))
+        key = ("collection", collection_name)
+        try:
+            return cls._class_cache[key]
+        except KeyError:
+            pass
+        klass = cls._find_class_for(Util.singularize(collection_name))
+        with cls._class_cache_lock:
+            return cls._class_cache.setdefault(key, klass)
 
     @classmethod
     def _find_class_for(cls, element_name=None, class_name=None, create_missing=True):
+        key = (element_name, class_name, create_missing)
+        try:
+            return cls._class_cache[key]
+        except KeyError:
+            pass
+        with cls._class_cache_lock:
+            # Created classes must be unique, so resolve under the lock.
+            if key not in cls._class_cache:
+                klass = cls._resolve_class_for(element_name, class_name, create_missing)
+                if klass is None:
+                    return None
+                cls._class_cache[key] = klass
+            return cls._class_cache[key]
+
+    @classmethod
+    def _resolve_class_for(cls, element_name=None, class_name=None, create_missing=True):
         if not element_name and not class_name:
             raise ResourceError("element_name or class_name must be specified")
         elif not element_name:
@@ -432,9 +1057,11 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
     def declared_fields(self):
         return self._fields
 
-    def _to_dict(self):
+    def _to_dict(self, keys=None):
         attributes = {}
         for key, value in six.iteritems(self.attributes):
+            if keys is not None and key not in keys:
+                continue
             if isinstance(value, MutableSequence):
                 new_value = []
                 for item in value:
@@ -469,22 +1096,61 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
         return False
 
     def __getattr__(self, name):
-        if "attributes" in self.__dict__:
-            if name in self.attributes:
-                return self.attributes[name]
+        # Only reached when the name is neither an instance nor a class
+        # attribute, which covers declared fields and accessors.
+        attributes = self.__dict__.get("attributes")
+        if attributes is not None:
+            value = attributes._items.get(name, _MISSING)
+            if value is not _MISSING:
+                self._add_accessor(name)
+                return value
         raise AttributeError(name)
 
     def __setattr__(self, name, value):
-        if "_initialized" in self.__dict__:
-            if name in self.__dict__ or getattr(self.__class__, name, None):
+        field = self._fields.get(name)
+        if field is not None:
+            field.assign(self, value)
+        elif "_initialized" in self.__dict__:
+            is_class_attr = self._class_attrs.get(name)
+            if is_class_attr is None:
+                is_class_attr = self._is_class_attr(name)
+            if name in self.__dict__ or (
+                is_class_attr and getattr(self.__class__, name, None)
+            ):
                 # Update a normal attribute
                 object.__setattr__(self, name, value)
             else:
                 # Add/update an attribute
-                self.attributes[name] = value
+                attributes = self.__dict__["attributes"]
+                attributes._items[name] = value
+                attributes._dirty.add(name)
         else:
             object.__setattr__(self, name, value)
 
+    @classmethod
+    def _is_class_attr(cls, name):
+        """Returns whether ``name`` is defined by the class or its
+        metaclass, accessors aside, and caches the answer."""
+        for klass in cls.__mro__:
+            if name in klass.__dict__:
+                is_class_attr = not isinstance(klass.__dict__[name], _AttributeAccessor)
+                break
+        else:
+            is_class_attr = hasattr(type(cls), name)
+        cls._class_attrs[name] = is_class_attr
+        return is_class_attr
+
+    @classmethod
+    def _add_accessor(cls, name):
+        if (
+            name.startswith("_")
+            or name in _RESERVED_NAMES
+            or hasattr(type(cls), name)
+            or name in cls.__dict__
+        ):
+            return
+        setattr(cls, name, _AttributeAccessor(name))
+
     def __repr__(self):
         return "%s(%s)" % (self._singular, self.id)
 
@@ -517,50 +1183,29 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
             prefix = prefix + ("/%s/%s" % tuple(options))
         return prefix
 
+    @classmethod
+    def _base_path(cls, path=None, options=None):
+        paths = cls._paths
+        if path or options:
+            return paths.account + cls._prefix(path, options) + paths.plural
+        return paths.account + paths.plural
+
     @classmethod
     def _element_path(cls, id_, path=None, options=None, ext=".json"):
-        return (cls.API_ACCOUNT_PREFIX + "%(prefix)s/%(plural)s/%(id)s%(ext)s") % {
-            "account_id": cls._api_account_id,
-            "prefix": cls._prefix(path, options),
-            "plural": cls._plural,
-            "id": id_,
-            "ext": ext,
-        }
+        return "%s/%s%s" % (cls._base_path(path, options), id_, ext)
 
     @classmethod
     def _collection_path(cls, path=None, options=None, ext=".json"):
-        return (cls.API_ACCOUNT_PREFIX + "%(prefix)s/%(plural)s%(ext)s") % {
-            "account_id": cls._api_account_id,
-            "prefix": cls._prefix(path, options),
-            "plural": cls._plural,
-            "ext": ext,
-        }
+        return cls._base_path(path, options) + ext
 
     @classmethod
     def _custom_path(
         cls, id_=None, path=None, custom_path="", options=None, ext=".json"
     ):
         if id_:
-            return (
-                cls.API_ACCOUNT_PREFIX + "%(prefix)s/%(plural)s/%(id)s%(custom)s%(ext)s"
-            ) % {
-                "account_id": cls._api_account_id,
-                "prefix": cls._prefix(path, options),
-                "plural": cls._plural,
-                "id": id_,
-                "custom": custom_path,
-                "ext": ext,
-            }
+            return "%s/%s%s%s" % (cls._base_path(path, options), id_, custom_path, ext)
         else:
-            return (
-                cls.API_ACCOUNT_PREFIX + "%(prefix)s/%(plural)s%(custom)s%(ext)s"
-            ) % {
-                "account_id": cls._api_account_id,
-                "prefix": cls._prefix(path, options),
-                "plural": cls._plural,
-                "custom": custom_path,
-                "ext": ext,
-            }
+            return "%s%s%s" % (cls._base_path(path, options), custom_path, ext)
 
     @classmethod
     def _query_string(cls, query_options=None):
@@ -575,19 +1220,20 @@ class Resource(six.with_metaclass(ResourceMeta, object)):
         if isinstance(attributes, dict) and "items" in attributes:
             elements = attributes.get("items")
             for element in elements:
-                resources.append(cls(element))
+                resources.append(cls._loaded(element))
         return resources
 
     @classmethod
     def _item_sub_resource_path(cls, id_, resource, subresource):
-        return (
-            cls.API_ACCOUNT_PREFIX + "/%(resource)s/%(id)s/%(subresource)s.json"
-        ) % {
-            "account_id": cls._api_account_id,
-            "resource": resource,
-            "id": id_,
-            "subresource": subresource,
-        }
+        return "%s/%s/%s/%s.json" % (cls._paths.account, resource, id_, subresource)
+
+
+def _has_dirty(value):
+    if isinstance(value, Resource):
+        return value.is_dirty()
+    if isinstance(value, MutableSequence):
+        return any(isinstance(item, Resource) and item.is_dirty() for item in value)
+    return False
 
 
 class SubordinateResource(Resource):
@@ -599,6 +1245,10 @@ class SubordinateResource(Resource):
     def find(cls, *args, **kwargs):
         raise NotImplementedError("Cannot find subordinate resources.")
 
+    @classmethod
+    async def afind(cls, *args, **kwargs):
+        raise NotImplementedError("Cannot find subordinate resources.")
+
     def __repr__(self):
         try:
             identity = "({})".format(self.identity)